@@ -1,12 +1,18 @@
 import uuid
+from datetime import date
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import CountStrategy, settings
 from app.db import get_db
+from app.models.document import Document
+from app.models.record import AuctionRecord
 from app.models.user import User
+from app.services.pagination import decode_cursor
+from app.services.search import RecordFilters, apply_record_filters
 from app.services.security import decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/login")
@@ -51,3 +57,69 @@ async def get_current_active_user(user: User = Depends(get_current_user)) -> Use
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user")
     return user
+
+
+class PageParams:
+    """Offset (``page``) or keyset (``cursor``) paging parameters for list endpoints."""
+
+    def __init__(
+        self,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: str | None = None,
+        include_total: bool = True,
+        count: CountStrategy | None = None,
+    ) -> None:
+        self.page = page
+        self.per_page = per_page
+        self.include_total = include_total
+        self.count = count or settings.COUNT_STRATEGY
+        self.after = None
+        if cursor:
+            try:
+                self.after = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+                )
+
+
+class RecordFilterParams:
+    """Record filter parameters shared by the list, facet and export endpoints."""
+
+    def __init__(
+        self,
+        q: str | None = None,
+        auction_date_from: date | None = None,
+        auction_date_to: date | None = None,
+        mileage_min: int | None = None,
+        mileage_max: int | None = None,
+        score_min: float | None = None,
+        auction_venue: list[str] | None = Query(None),
+        source: str | None = None,
+        needs_review: bool | None = None,
+    ) -> None:
+        try:
+            self.filters = RecordFilters(
+                q=q,
+                auction_date_from=auction_date_from,
+                auction_date_to=auction_date_to,
+                mileage_min=mileage_min,
+                mileage_max=mileage_max,
+                score_min=score_min,
+                auction_venue=auction_venue,
+                needs_review=needs_review,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+        self.source = source or None
+
+    def apply(self, query: Select) -> Select:
+        """Add the filters, joining documents when filtering on ``source``."""
+        if self.source:
+            query = query.join(Document, AuctionRecord.document_id == Document.id)
+            query = query.where(Document.source == self.source)
+        return apply_record_filters(query, self.filters)
+
+    def cache_key(self) -> tuple:
+        return (self.source, self.filters.cache_key())
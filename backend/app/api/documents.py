@@ -1,20 +1,35 @@
+import asyncio
+import uuid
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import func, select
+from sqlalchemy import String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user
+from app.api.deps import PageParams, get_current_active_user
 from app.config import settings
 from app.db import get_db
 from app.models.document import Document
 from app.models.record import AuctionRecord
 from app.schemas.common import Page
-from app.schemas.document import DocumentRead, DocumentStatus, DocumentUploadResponse
-from app.services.files import create_thumbnail, sha256_bytes
-from app.services.queue import enqueue_preprocess
-from app.services.storage import generate_key, storage_client
+from app.schemas.document import (
+    BatchUploadDocument,
+    BatchUploadDuplicate,
+    BatchUploadResponse,
+    DocumentRead,
+    DocumentStatus,
+    DocumentUploadResponse,
+    FinalizeUploadRequest,
+    UploadUrlRequest,
+    UploadUrlResponse,
+)
+from app.services.files import sha256_bytes, sha256_upload
+from app.services.pagination import paginate
+from app.services.queue import enqueue_document, enqueue_documents
+from app.services.security import create_upload_token, decode_upload_token
+from app.services.storage import async_storage_client, generate_key
 
 router = APIRouter()
 
@@ -41,22 +56,13 @@ async def upload_document(
         return DocumentUploadResponse(status="duplicate", existing_id=existing_doc.id)
 
     original_key = generate_key("originals", file.filename)
-    storage_client.upload_bytes(original_key, data, file.content_type)
-
-    thumb_key = None
-    try:
-        thumb_bytes = create_thumbnail(data)
-        thumb_key = generate_key("thumbs", "thumb.jpg")
-        storage_client.upload_bytes(thumb_key, thumb_bytes, "image/jpeg")
-    except Exception:
-        thumb_key = None
+    await async_storage_client.upload_bytes(original_key, data, file.content_type)
 
     doc = Document(
         source="upload",
         uploaded_by=current_user.id,
         status="queued",
         original_path=original_key,
-        thumb_path=thumb_key,
         hash_sha256=file_hash,
     )
     db.add(doc)
@@ -71,22 +77,252 @@ async def upload_document(
         raise
 
     await db.refresh(doc)
-    enqueue_preprocess(str(doc.id))
+    enqueue_document(str(doc.id))
     return DocumentUploadResponse(status="queued", document_id=doc.id)
 
 
+@router.post("/upload/batch", response_model=BatchUploadResponse)
+async def upload_documents(
+    files: list[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    try:
+        return await _upload_batch(files, db, current_user.id)
+    finally:
+        for file in files:
+            await file.close()
+
+
+async def _upload_batch(
+    files: list[UploadFile], db: AsyncSession, user_id: UUID
+) -> BatchUploadResponse:
+    if len(files) > settings.UPLOAD_MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.UPLOAD_MAX_BATCH_FILES} files per upload",
+        )
+
+    max_bytes = settings.UPLOAD_MAX_SIZE_MB * 1024 * 1024
+    hashes = []
+    for file in files:
+        file_hash, size = await sha256_upload(file, max_bytes)
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File too large: {file.filename}",
+            )
+        hashes.append(file_hash)
+
+    known = await _existing_documents(db, hashes)
+    response = BatchUploadResponse()
+    pending = []
+    for file, file_hash in zip(files, hashes):
+        if file_hash in known:
+            response.duplicates.append(
+                BatchUploadDuplicate(filename=file.filename, existing_id=known[file_hash])
+            )
+            continue
+        # Ids are assigned here so repeats within the batch can point at the first copy.
+        known[file_hash] = uuid.uuid4()
+        pending.append((file, file_hash, known[file_hash]))
+    if not pending:
+        return response
+
+    stored = await asyncio.gather(*(_store_upload(file) for file, _, _ in pending))
+    rows = [
+        {
+            "id": doc_id,
+            "source": "upload",
+            "uploaded_by": user_id,
+            "status": "queued",
+            "original_path": original_key,
+            "hash_sha256": file_hash,
+        }
+        for (_, file_hash, doc_id), original_key in zip(pending, stored)
+    ]
+    result = await db.execute(
+        insert(Document)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Document.hash_sha256])
+        .returning(Document.id)
+    )
+    inserted = set(result.scalars().all())
+    await db.commit()
+
+    # Rows skipped by ON CONFLICT lost a race with a concurrent upload of the same file.
+    raced = [
+        (file, file_hash, original_key)
+        for (file, file_hash, doc_id), original_key in zip(pending, stored)
+        if doc_id not in inserted
+    ]
+    if raced:
+        winners = await _existing_documents(db, [file_hash for _, file_hash, _ in raced])
+        await async_storage_client.delete_objects(
+            [original_key for _, _, original_key in raced]
+        )
+        response.duplicates.extend(
+            BatchUploadDuplicate(filename=file.filename, existing_id=winners[file_hash])
+            for file, file_hash, _ in raced
+            if file_hash in winners
+        )
+
+    queued = [(file, doc_id) for file, _, doc_id in pending if doc_id in inserted]
+    enqueue_documents([str(doc_id) for _, doc_id in queued])
+    response.documents = [
+        BatchUploadDocument(id=doc_id, filename=file.filename, status="queued")
+        for file, doc_id in queued
+    ]
+    return response
+
+
+async def _existing_documents(db: AsyncSession, hashes: list[str]) -> dict[str, UUID]:
+    result = await db.execute(
+        select(Document.hash_sha256, Document.id).where(
+            Document.hash_sha256
+            == any_(bindparam("hashes", sorted(set(hashes)), type_=ARRAY(String(64))))
+        )
+    )
+    return dict(result.all())
+
+
+async def _store_upload(file: UploadFile) -> str:
+    original_key = generate_key("originals", file.filename)
+    file.file.seek(0)
+    await async_storage_client.upload_fileobj(original_key, file.file, file.content_type)
+    return original_key
+
+
+@router.post("/upload-url", response_model=UploadUrlResponse)
+async def create_upload_url(
+    payload: UploadUrlRequest,
+    current_user=Depends(get_current_active_user),
+):
+    """Step one of a direct upload: a presigned PUT for the original image.
+
+    The returned ``document_id`` and ``upload_token`` are passed to
+    ``/{document_id}/finalize`` once the PUT has succeeded; the token ties
+    the object to the user who asked for the URL.
+    """
+    document_id = uuid.uuid4()
+    key = _direct_upload_key(document_id)
+    expires_in = settings.PRESIGNED_UPLOAD_EXPIRES_SECONDS
+    upload_url = async_storage_client.presigned_put_url(key, payload.content_type, expires_in)
+    upload_token = create_upload_token(
+        str(current_user.id), key, expires_in + UPLOAD_TOKEN_GRACE_SECONDS
+    )
+    headers = {"Content-Type": payload.content_type} if payload.content_type else {}
+    return UploadUrlResponse(
+        document_id=document_id,
+        upload_token=upload_token,
+        upload_url=upload_url,
+        headers=headers,
+        expires_in=expires_in,
+    )
+
+
+@router.post("/{document_id}/finalize", response_model=DocumentUploadResponse)
+async def finalize_upload(
+    document_id: UUID,
+    payload: FinalizeUploadRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Step two of a direct upload: register the stored object and queue it.
+
+    Only the user the ``upload_token`` was issued to can finalize its object.
+    The object is hashed from storage; a sha256 sent by the client is only
+    checked against it.  Duplicates are deleted from storage.
+    """
+    key = _direct_upload_key(document_id)
+    try:
+        token = decode_upload_token(payload.upload_token)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid upload token")
+    if token["key"] != key or token["uid"] != str(current_user.id):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid upload token")
+
+    existing_doc = await db.get(Document, document_id)
+    if existing_doc:
+        return DocumentUploadResponse(status="queued", document_id=existing_doc.id)
+
+    head = await async_storage_client.head_object(key)
+    if head is None:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if head.get("ContentLength", 0) > settings.UPLOAD_MAX_SIZE_MB * 1024 * 1024:
+        await async_storage_client.delete_objects([key])
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File too large",
+        )
+
+    # Dedupe deletes the object, so it must be keyed on the stored bytes, never
+    # on what the client claims they are.
+    file_hash = await async_storage_client.sha256_object(key)
+    if payload.sha256 and payload.sha256.lower() != file_hash:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="sha256 does not match the uploaded object",
+        )
+
+    existing = await db.execute(select(Document).where(Document.hash_sha256 == file_hash))
+    existing_doc = existing.scalar_one_or_none()
+    if existing_doc:
+        await async_storage_client.delete_objects([key])
+        return DocumentUploadResponse(status="duplicate", existing_id=existing_doc.id)
+
+    doc = Document(
+        id=document_id,
+        source="upload",
+        uploaded_by=current_user.id,
+        status="queued",
+        original_path=key,
+        hash_sha256=file_hash,
+    )
+    db.add(doc)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        existing = await db.execute(select(Document).where(Document.hash_sha256 == file_hash))
+        existing_doc = existing.scalar_one_or_none()
+        if not existing_doc:
+            raise
+        # A concurrent finalize of the same upload won; its object must stay.
+        if existing_doc.id == document_id:
+            return DocumentUploadResponse(status="queued", document_id=document_id)
+        await async_storage_client.delete_objects([key])
+        return DocumentUploadResponse(status="duplicate", existing_id=existing_doc.id)
+
+    enqueue_document(str(document_id))
+    return DocumentUploadResponse(status="queued", document_id=document_id)
+
+
+# Finalize may come a little after the presigned PUT itself expires.
+UPLOAD_TOKEN_GRACE_SECONDS = 3600
+
+
+def _direct_upload_key(document_id: UUID) -> str:
+    return f"originals/{document_id}"
+
+
 @router.get("", response_model=Page[DocumentRead])
 async def list_documents(
-    page: int = 1,
-    per_page: int = 20,
+    paging: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    offset = (page - 1) * per_page
-    result = await db.execute(select(Document).order_by(Document.created_at.desc()).offset(offset).limit(per_page))
-    items = result.scalars().all()
-    total = await db.scalar(select(func.count()).select_from(Document))
-    return Page(items=items, page=page, per_page=per_page, total=total or 0)
+    return await paginate(
+        db,
+        select(Document),
+        Document,
+        page=paging.page,
+        per_page=paging.per_page,
+        after=paging.after,
+        include_total=paging.include_total,
+        count_strategy=paging.count,
+        count_key=("documents",),
+    )
 
 
 @router.get("/{document_id}", response_model=DocumentRead)
@@ -128,17 +364,20 @@ async def get_document_status(
 @router.post("/{document_id}/reprocess", response_model=DocumentStatus)
 async def reprocess_document(
     document_id: UUID,
+    skip_duplicate_check: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
+    """Run the pipeline again; ``skip_duplicate_check`` OCRs a false-positive duplicate."""
     result = await db.execute(select(Document).where(Document.id == document_id))
     doc = result.scalar_one_or_none()
     if not doc:
         raise HTTPException(status_code=404, detail="Document not found")
     doc.status = "queued"
     doc.error_message = None
+    doc.duplicate_of = None
     doc.processing_started_at = None
     doc.processing_completed_at = None
     await db.commit()
-    enqueue_preprocess(str(doc.id))
+    enqueue_document(str(doc.id), skip_duplicate_check=skip_duplicate_check)
     return DocumentStatus(id=doc.id, status=doc.status)
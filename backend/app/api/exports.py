@@ -1,51 +1,84 @@
-from datetime import date
-
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select
 
-from app.api.deps import get_current_active_user
-from app.db import get_db
-from app.models.document import Document
+from app.api.deps import RecordFilterParams, get_current_active_user
+from app.db import AsyncSessionLocal
 from app.models.record import AuctionRecord
-from app.services.export import stream_csv
-from app.services.search import RecordFilters, apply_record_filters
+from app.services.export import (
+    ARROW_FORMATS,
+    CSV_FIELDS,
+    EXPORT_FETCH_SIZE,
+    EXPORT_FIELDS,
+    export_select,
+    resolve_fields,
+    stream_arrow,
+    stream_csv,
+)
 
 router = APIRouter()
 
 
+class ExportQuery:
+    """Filters shared by every export format."""
+
+    def __init__(
+        self,
+        record_filters: RecordFilterParams = Depends(),
+        fields: list[str] | None = Query(None),
+    ) -> None:
+        self.record_filters = record_filters
+        self.fields = fields
+
+    def resolve_fields(self, default: list[str]) -> list[str]:
+        try:
+            return resolve_fields(self.fields, default)
+        except ValueError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    def select(self, fields: list[str]) -> Select:
+        query = self.record_filters.apply(export_select(fields))
+        return query.order_by(AuctionRecord.created_at.desc())
+
+
 @router.get("/records.csv")
 async def export_records(
-    q: str | None = None,
-    auction_date_from: date | None = None,
-    auction_date_to: date | None = None,
-    mileage_min: int | None = None,
-    mileage_max: int | None = None,
-    score_min: float | None = None,
-    auction_venue: list[str] | None = None,
-    source: str | None = None,
-    needs_review: bool | None = None,
-    db: AsyncSession = Depends(get_db),
+    export: ExportQuery = Depends(),
     current_user=Depends(get_current_active_user),
 ):
-    filters = RecordFilters(
-        q=q,
-        auction_date_from=auction_date_from,
-        auction_date_to=auction_date_to,
-        mileage_min=mileage_min,
-        mileage_max=mileage_max,
-        score_min=score_min,
-        auction_venue=auction_venue,
-        needs_review=needs_review,
-    )
-    query = select(AuctionRecord)
-    if source:
-        query = query.join(Document, AuctionRecord.document_id == Document.id)
-        query = query.where(Document.source == source)
-    query = apply_record_filters(query, filters)
-    result = await db.execute(query.order_by(AuctionRecord.created_at.desc()))
-    records = result.scalars().all()
-
+    fields = export.resolve_fields(CSV_FIELDS)
+    rows = _stream_rows(export.select(fields))
     headers = {"Content-Disposition": "attachment; filename=records.csv"}
-    return StreamingResponse(stream_csv(records), media_type="text/csv", headers=headers)
+    return StreamingResponse(stream_csv(rows, fields), media_type="text/csv", headers=headers)
+
+
+@router.get("/records.parquet")
+async def export_records_parquet(
+    export: ExportQuery = Depends(),
+    current_user=Depends(get_current_active_user),
+):
+    return _columnar_response(export, "parquet")
+
+
+@router.get("/records.arrow")
+async def export_records_arrow(
+    export: ExportQuery = Depends(),
+    current_user=Depends(get_current_active_user),
+):
+    return _columnar_response(export, "arrow")
+
+
+def _columnar_response(export: ExportQuery, fmt: str) -> StreamingResponse:
+    fields = export.resolve_fields(EXPORT_FIELDS)
+    body = stream_arrow(_stream_rows(export.select(fields)), fields, fmt)
+    headers = {"Content-Disposition": f"attachment; filename=records.{fmt}"}
+    return StreamingResponse(body, media_type=ARROW_FORMATS[fmt], headers=headers)
+
+
+async def _stream_rows(query: Select):
+    # The request-scoped session from get_db is closed before a streaming body
+    # is sent, so the cursor gets a session that lives as long as the response.
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=EXPORT_FETCH_SIZE))
+        async for row in result:
+            yield row
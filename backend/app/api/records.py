@@ -1,62 +1,64 @@
-from datetime import date
+from typing import Literal
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user
+from app.api.deps import PageParams, RecordFilterParams, get_current_active_user
 from app.db import get_db
-from app.models.document import Document
 from app.models.record import AuctionRecord
 from app.schemas.common import Page
-from app.schemas.record import RecordListItem, RecordRead, RecordUpdate
-from app.services.search import RecordFilters, apply_record_filters
+from app.schemas.record import RecordFacets, RecordListItem, RecordRead, RecordUpdate
+from app.services.facets import facet_counts, facet_select
+from app.services.pagination import paginate
+from app.services.search import plan_search
 
 router = APIRouter()
 
 
 @router.get("", response_model=Page[RecordListItem])
 async def list_records(
-    q: str | None = None,
-    auction_date_from: date | None = None,
-    auction_date_to: date | None = None,
-    mileage_min: int | None = None,
-    mileage_max: int | None = None,
-    score_min: float | None = None,
-    auction_venue: list[str] | None = None,
-    source: str | None = None,
-    needs_review: bool | None = None,
-    page: int = 1,
-    per_page: int = 20,
+    record_filters: RecordFilterParams = Depends(),
+    sort: Literal["relevance", "newest"] | None = None,
+    paging: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    filters = RecordFilters(
-        q=q,
-        auction_date_from=auction_date_from,
-        auction_date_to=auction_date_to,
-        mileage_min=mileage_min,
-        mileage_max=mileage_max,
-        score_min=score_min,
-        auction_venue=auction_venue,
-        needs_review=needs_review,
-    )
+    query = record_filters.apply(select(AuctionRecord))
 
-    query = select(AuctionRecord)
-    if source:
-        query = query.join(Document, AuctionRecord.document_id == Document.id)
-        query = query.where(Document.source == source)
-    query = apply_record_filters(query, filters)
+    # Searches are ranked by relevance unless the caller asks for newest first
+    # or is walking the newest-first list with a cursor.
+    rank = None
+    text = record_filters.filters.text
+    plan = plan_search(text) if text else None
+    if plan and sort != "newest" and paging.after is None:
+        rank = plan.rank
+    elif sort == "relevance" and paging.after is not None:
+        raise HTTPException(status_code=400, detail="Cursors only apply to sort=newest")
+    return await paginate(
+        db,
+        query,
+        AuctionRecord,
+        page=paging.page,
+        per_page=paging.per_page,
+        after=paging.after,
+        include_total=paging.include_total,
+        count_strategy=paging.count,
+        count_key=("auction_records", *record_filters.cache_key()),
+        rank=rank,
+    )
 
-    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
-    offset = (page - 1) * per_page
-    result = await db.execute(
-        query.order_by(AuctionRecord.created_at.desc()).offset(offset).limit(per_page)
-    )
-    items = result.scalars().all()
-    return Page(items=items, page=page, per_page=per_page, total=total or 0)
+@router.get("/facets", response_model=RecordFacets)
+async def record_facets(
+    record_filters: RecordFilterParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Counts per venue, score, model year and price band for the list filters."""
+    query = record_filters.apply(facet_select())
+    return await facet_counts(db, query, cache_key=record_filters.cache_key())
 
 
 @router.get("/{record_id}", response_model=RecordRead)
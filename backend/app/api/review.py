@@ -2,35 +2,39 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user
+from app.api.deps import PageParams, get_current_active_user
 from app.db import get_db
 from app.models.override import Override
 from app.models.record import AuctionRecord
 from app.schemas.common import Page
 from app.schemas.record import RecordListItem, RecordRead
 from app.schemas.review import OverrideCreate, VerifyRequest
+from app.services.pagination import paginate
 
 router = APIRouter()
 
 
 @router.get("/queue", response_model=Page[RecordListItem])
 async def review_queue(
-    page: int = 1,
-    per_page: int = 20,
+    paging: PageParams = Depends(),
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_active_user),
 ):
-    offset = (page - 1) * per_page
     query = select(AuctionRecord).where(AuctionRecord.needs_review.is_(True))
-    total = await db.scalar(
-        select(func.count()).select_from(AuctionRecord).where(AuctionRecord.needs_review.is_(True))
+    return await paginate(
+        db,
+        query,
+        AuctionRecord,
+        page=paging.page,
+        per_page=paging.per_page,
+        after=paging.after,
+        include_total=paging.include_total,
+        count_strategy=paging.count,
+        count_key=("review_queue",),
     )
-    result = await db.execute(query.order_by(AuctionRecord.created_at.desc()).offset(offset).limit(per_page))
-    items = result.scalars().all()
-    return Page(items=items, page=page, per_page=per_page, total=total or 0)
 
 
 @router.post("/{record_id}/override", response_model=RecordRead)
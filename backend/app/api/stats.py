@@ -0,0 +1,62 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_active_user
+from app.db import get_db
+from app.schemas.stats import MarketStat, MarketStatsResponse
+from app.services.market_stats import mileage_adjusted_median, mileage_trend, stats_query
+
+router = APIRouter()
+
+
+@router.get("/market", response_model=MarketStatsResponse)
+async def market_stats(
+    make_model: str | None = None,
+    grade: str | None = None,
+    model_year_gregorian: int | None = None,
+    score_numeric: float | None = None,
+    group_by: list[Literal["grade", "model_year_gregorian", "score_numeric"]] | None = Query(None),
+    mileage_km: int | None = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_active_user),
+):
+    """Final bid statistics from the market_price_stats materialized view."""
+    try:
+        query = stats_query(
+            make_model,
+            filters={
+                "grade": grade,
+                "model_year_gregorian": model_year_gregorian,
+                "score_numeric": score_numeric,
+            },
+            group_by=tuple(group_by or ()),
+            limit=limit,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    rows = (await db.execute(query)).all()
+    items = [
+        MarketStat(
+            make_model=row.make_model,
+            grade=row.grade,
+            model_year_gregorian=row.model_year_gregorian,
+            score_numeric=row.score_numeric,
+            sale_count=row.sale_count,
+            median_yen=row.median_yen,
+            p10_yen=row.p10_yen,
+            p90_yen=row.p90_yen,
+            avg_mileage_km=row.avg_mileage_km,
+            yen_per_10k_km=mileage_trend(row),
+            adjusted_median_yen=(
+                mileage_adjusted_median(row, mileage_km) if mileage_km is not None else None
+            ),
+            first_auction_date=row.first_auction_date,
+            last_auction_date=row.last_auction_date,
+        )
+        for row in rows
+    ]
+    return MarketStatsResponse(items=items, refreshed_at=rows[0].refreshed_at if rows else None)
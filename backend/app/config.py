@@ -1,13 +1,21 @@
 from pathlib import Path
-from typing import List
+from typing import List, Literal
 
 from sqlalchemy.engine.url import make_url
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 
+# Storage formats for the preprocessed page.  worker.ocr.intermediate owns the
+# list (IntermediateFormat); it is repeated here because importing worker from
+# config would be circular, and tests/test_intermediate.py keeps the two equal.
+PreprocessedFormat = Literal["png", "webp", "raw", "raw-lz4"]
+# How list endpoints compute ``total``; see app.services.counts.
+CountStrategy = Literal["exact", "estimate", "cached"]
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -29,13 +37,66 @@ class Settings(BaseSettings):
     S3_ACCESS_KEY: str = "minioadmin"
     S3_SECRET_KEY: str = "minioadmin"
     S3_BUCKET: str = "auction-ocr"
+    # Endpoint browsers use for presigned uploads; defaults to S3_ENDPOINT_URL.
+    S3_PUBLIC_ENDPOINT_URL: str | None = None
+    PRESIGNED_UPLOAD_EXPIRES_SECONDS: int = 900
+    # boto3 connection pool size; also the API's storage thread pool size.
+    S3_MAX_POOL_CONNECTIONS: int = 20
 
     SECRET_KEY: str = "dev-secret-change-me"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24
     PASSWORD_HASH_SCHEME: str = "bcrypt"
 
     UPLOAD_MAX_SIZE_MB: int = 15
+    UPLOAD_MAX_BATCH_FILES: int = 50
+    # Thumbnails rendered by the preprocess stage: name -> maximum side in pixels.
+    # "list" is also stored as documents.thumb_path.
+    THUMBNAIL_SIZES: dict[str, int] = {"list": 400, "detail": 1200}
     PIPELINE_VERSION: str = "v1"
+    # Bits (of 256) by which a document's perceptual hash may differ from an earlier
+    # one for it to be marked a duplicate instead of being OCR'd; at most 15, which
+    # the band index guarantees to find. None disables near-duplicate detection.
+    NEAR_DUPLICATE_MAX_DISTANCE: int | None = Field(12, ge=0, le=15)
+
+    # How list endpoints compute ``total``: "exact", "estimate" or "cached"
+    # (see app.services.counts). Callers can override it with ?count=.
+    COUNT_STRATEGY: CountStrategy = "exact"
+    # "estimate" only reports planner estimates at or above this many rows.
+    COUNT_ESTIMATE_THRESHOLD: int = 10_000
+    COUNT_CACHE_TTL_SECONDS: float = 30.0
+    # Seconds /v1/records/facets results are reused for the same filters.
+    FACETS_CACHE_TTL_SECONDS: float = 60.0
+    # Beat interval for REFRESH MATERIALIZED VIEW CONCURRENTLY market_price_stats.
+    MARKET_STATS_REFRESH_SECONDS: float = 900.0
+
+    # "staged" chains the preprocess/ocr/extract/validate tasks through storage;
+    # "fused" runs all stages in one gpu_ocr task on in-memory data.
+    PIPELINE_MODE: Literal["staged", "fused"] = "staged"
+    # Storage format of the preprocessed page handed between stages: "png", "webp"
+    # (lossless), "raw" (uncompressed ndarray) or "raw-lz4" (LZ4-framed "raw").
+    PREPROCESSED_FORMAT: PreprocessedFormat = "png"
+    # zlib level for "png"; unset keeps OpenCV's default.
+    PREPROCESSED_PNG_LEVEL: int | None = None
+    # Documents claimed per gpu_ocr micro-batch; 1 keeps the per-document ocr task.
+    OCR_BATCH_SIZE: int = 1
+    # "split" runs VL on the header and sheet crops separately; "stacked" runs
+    # both ROIs through a single VL prediction and splits blocks by ROI.
+    OCR_VL_MODE: Literal["split", "stacked"] = "split"
+    # "always" runs the header fallback OCR on every document; "auto" skips it
+    # when the VL header output already contains every P0 field.
+    OCR_HEADER_FALLBACK: Literal["always", "auto"] = "always"
+    # Whole-image preprocessing profile: "full", "fast", "none", or "auto" to pick
+    # per document from the estimated noise level and JPEG quality.
+    PREPROCESS_PROFILE: Literal["full", "fast", "none", "auto"] = "full"
+    # Profiles "auto" may choose. Add "fast"/"none" only after the ground-truth
+    # profile accuracy test shows they match "full"; otherwise auto only records
+    # the measurements and its suggestion.
+    PREPROCESS_AUTO_PROFILES: list[Literal["full", "fast", "none"]] = ["full"]
+    # Build the OCR models when a worker process starts instead of on the first
+    # document. Enable on gpu_ocr workers only; CPU queues never use the models.
+    OCR_PRELOAD_MODELS: bool = False
+    # Seconds a prefork child may spend in worker_process_init before Celery kills it.
+    OCR_PRELOAD_TIMEOUT: float = 600.0
 
     def resolved_sync_db_url(self) -> str:
         if self.DATABASE_URL_SYNC:
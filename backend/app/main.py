@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import auth, documents, exports, records, review, webhooks
+from app.api import auth, documents, exports, records, review, stats, webhooks
 from app.config import settings
 from app.services.storage import storage_client
 
@@ -25,6 +25,7 @@ app.include_router(documents.router, prefix="/v1/documents", tags=["documents"])
 app.include_router(records.router, prefix="/v1/records", tags=["records"])
 app.include_router(review.router, prefix="/v1/review", tags=["review"])
 app.include_router(exports.router, prefix="/v1/exports", tags=["exports"])
+app.include_router(stats.router, prefix="/v1/stats", tags=["stats"])
 app.include_router(webhooks.router, prefix="/v1/webhooks", tags=["webhooks"])
 
 
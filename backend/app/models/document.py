@@ -1,8 +1,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -26,11 +26,20 @@ class Document(Base):
 
     original_path: Mapped[str] = mapped_column(String(500), nullable=False)
     thumb_path: Mapped[str | None] = mapped_column(String(500))
+    thumbnails: Mapped[dict | None] = mapped_column(JSONB)
     preprocessed_path: Mapped[str | None] = mapped_column(String(500))
+    preprocessed_format: Mapped[str | None] = mapped_column(String(20))
 
     roi: Mapped[dict | None] = mapped_column(JSONB)
 
     hash_sha256: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    # Perceptual hash of the image (hex) and its band keys; see worker.ocr.image_utils.
+    phash: Mapped[str | None] = mapped_column(String(64))
+    phash_bands: Mapped[list[int] | None] = mapped_column(ARRAY(Integer))
+    # Earlier document with a near-identical image; set instead of running OCR again.
+    duplicate_of: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("documents.id", ondelete="SET NULL")
+    )
 
     model_version: Mapped[str | None] = mapped_column(String(50))
     pipeline_version: Mapped[str | None] = mapped_column(String(50))
@@ -47,3 +56,10 @@ class Document(Base):
     uploaded_by_user = relationship("User", back_populates="documents")
     record = relationship("AuctionRecord", back_populates="document", uselist=False)
     whatsapp_meta = relationship("WhatsappMeta", back_populates="document")
+
+    __table_args__ = (
+        Index("idx_documents_status", "status"),
+        Index("idx_documents_created", created_at.desc(), id.desc()),
+        Index("idx_documents_source", "source"),
+        Index("idx_documents_phash_bands", "phash_bands", postgresql_using="gin"),
+    )
@@ -20,6 +20,22 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
 
+SEARCH_TEXT_SQL = (
+    "coalesce(lot_no, '') || ' ' || "
+    "coalesce(auction_venue, '') || ' ' || "
+    "coalesce(auction_venue_round, '') || ' ' || "
+    "coalesce(make_model, '') || ' ' || "
+    "coalesce(make_ja, '') || ' ' || "
+    "coalesce(make_en, '') || ' ' || "
+    "coalesce(model_ja, '') || ' ' || "
+    "coalesce(model_en, '') || ' ' || "
+    "coalesce(model_code, '') || ' ' || "
+    "coalesce(chassis_no, '') || ' ' || "
+    "coalesce(notes_text, '') || ' ' || "
+    "coalesce(options_text, '')"
+)
+
+
 class AuctionRecord(Base):
     __tablename__ = "auction_records"
 
@@ -120,22 +136,13 @@ class AuctionRecord(Base):
     )
 
     search_text: Mapped[str | None] = mapped_column(
-        Text,
-        Computed(
-            "coalesce(lot_no, '') || ' ' || "
-            "coalesce(auction_venue, '') || ' ' || "
-            "coalesce(auction_venue_round, '') || ' ' || "
-            "coalesce(make_model, '') || ' ' || "
-            "coalesce(make_ja, '') || ' ' || "
-            "coalesce(make_en, '') || ' ' || "
-            "coalesce(model_ja, '') || ' ' || "
-            "coalesce(model_en, '') || ' ' || "
-            "coalesce(model_code, '') || ' ' || "
-            "coalesce(chassis_no, '') || ' ' || "
-            "coalesce(notes_text, '') || ' ' || "
-            "coalesce(options_text, '')",
-            persisted=True,
-        ),
+        Text, Computed(SEARCH_TEXT_SQL, persisted=True)
+    )
+
+    # NFKC-normalized character bigrams of search_text (see auction_bigrams() in
+    # migration 0005), so Japanese text is searchable without a word tokenizer.
+    search_bigrams: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(f"auction_bigrams({SEARCH_TEXT_SQL})", persisted=True)
     )
 
     created_at: Mapped[datetime] = mapped_column(
@@ -151,11 +158,27 @@ class AuctionRecord(Base):
     __table_args__ = (
         Index("idx_records_document", "document_id"),
         Index("idx_records_auction_date", "auction_date"),
-        Index("idx_records_auction_venue", "auction_venue"),
-        Index("idx_records_lot", "lot_no"),
+        Index(
+            "idx_records_auction_venue",
+            "auction_venue",
+            postgresql_ops={"auction_venue": "text_pattern_ops"},
+        ),
+        Index(
+            "idx_records_lot",
+            "lot_no",
+            postgresql_ops={"lot_no": "text_pattern_ops"},
+        ),
         Index("idx_records_make_model", "make_model"),
-        Index("idx_records_model_code", "model_code"),
-        Index("idx_records_chassis_no", "chassis_no"),
+        Index(
+            "idx_records_model_code",
+            "model_code",
+            postgresql_ops={"model_code": "text_pattern_ops"},
+        ),
+        Index(
+            "idx_records_chassis_no",
+            "chassis_no",
+            postgresql_ops={"chassis_no": "text_pattern_ops"},
+        ),
         Index("idx_records_mileage", "mileage_km"),
         Index("idx_records_score", "score_numeric"),
         Index("idx_records_price", "final_bid_yen"),
@@ -164,6 +187,13 @@ class AuctionRecord(Base):
             "needs_review",
             postgresql_where=text("needs_review = true"),
         ),
+        Index("idx_records_created", created_at.desc(), id.desc()),
+        Index(
+            "idx_records_review_created",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("needs_review = true"),
+        ),
         Index("idx_records_fts_en", "fts_vector_en", postgresql_using="gin"),
         Index(
             "idx_records_make_model_trgm",
@@ -190,4 +220,5 @@ class AuctionRecord(Base):
             postgresql_ops={"search_text": "gin_trgm_ops"},
         ),
         Index("idx_records_evidence", "evidence", postgresql_using="gin"),
+        Index("idx_records_search_bigrams", "search_bigrams", postgresql_using="gin"),
     )
@@ -1,6 +1,14 @@
 from app.schemas.auth import Token, UserCreate, UserRead
 from app.schemas.common import Page
-from app.schemas.document import DocumentRead, DocumentStatus, DocumentUploadResponse
+from app.schemas.document import (
+    BatchUploadResponse,
+    DocumentRead,
+    DocumentStatus,
+    DocumentUploadResponse,
+    FinalizeUploadRequest,
+    UploadUrlRequest,
+    UploadUrlResponse,
+)
 from app.schemas.record import RecordListItem, RecordRead, RecordUpdate
 from app.schemas.review import OverrideCreate, VerifyRequest
 
@@ -12,6 +20,10 @@ __all__ = [
     "DocumentRead",
     "DocumentStatus",
     "DocumentUploadResponse",
+    "BatchUploadResponse",
+    "UploadUrlRequest",
+    "UploadUrlResponse",
+    "FinalizeUploadRequest",
     "RecordListItem",
     "RecordRead",
     "RecordUpdate",
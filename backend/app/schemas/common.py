@@ -9,4 +9,9 @@ class Page(BaseModel, Generic[T]):
     items: List[T]
     page: int
     per_page: int
-    total: int
+    # None when the caller passed include_total=false.
+    total: int | None = None
+    # True when total is the planner's row estimate rather than a COUNT.
+    total_estimated: bool = False
+    # Opaque keyset cursor for the following page; None on the last page.
+    next_cursor: str | None = None
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DocumentRead(BaseModel):
@@ -12,8 +12,11 @@ class DocumentRead(BaseModel):
     status: str
     original_path: str
     thumb_path: str | None
+    thumbnails: dict[str, str] | None
     preprocessed_path: str | None
+    preprocessed_format: str | None
     hash_sha256: str
+    duplicate_of: UUID | None = None
     error_message: str | None
     created_at: datetime
     updated_at: datetime
@@ -32,3 +35,38 @@ class DocumentUploadResponse(BaseModel):
     status: str
     document_id: UUID | None = None
     existing_id: UUID | None = None
+
+
+class BatchUploadDocument(BaseModel):
+    id: UUID
+    filename: str | None = None
+    status: str
+
+
+class BatchUploadDuplicate(BaseModel):
+    filename: str | None = None
+    existing_id: UUID
+
+
+class BatchUploadResponse(BaseModel):
+    documents: list[BatchUploadDocument] = []
+    duplicates: list[BatchUploadDuplicate] = []
+
+
+class UploadUrlRequest(BaseModel):
+    filename: str | None = None
+    content_type: str | None = None
+
+
+class UploadUrlResponse(BaseModel):
+    document_id: UUID
+    upload_token: str
+    upload_url: str
+    method: str = "PUT"
+    headers: dict[str, str] = {}
+    expires_in: int
+
+
+class FinalizeUploadRequest(BaseModel):
+    upload_token: str
+    sha256: str | None = Field(default=None, pattern=r"^[0-9a-fA-F]{64}$")
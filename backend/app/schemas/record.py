@@ -92,3 +92,23 @@ class RecordListItem(BaseModel):
     final_bid_yen: int | None = None
     needs_review: bool | None = None
     created_at: datetime
+
+
+class FacetCount(BaseModel):
+    value: str | int | None = None
+    count: int
+
+
+class PriceBandCount(BaseModel):
+    # 万円 bounds of final_bid_yen, lower inclusive; max_man is None for the top band.
+    min_man: int | None = None
+    max_man: int | None = None
+    count: int
+
+
+class RecordFacets(BaseModel):
+    total: int
+    auction_venue: list[FacetCount]
+    score: list[FacetCount]
+    model_year_gregorian: list[FacetCount]
+    price_band: list[PriceBandCount]
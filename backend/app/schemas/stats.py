@@ -0,0 +1,28 @@
+from datetime import date, datetime
+
+from pydantic import BaseModel
+
+
+class MarketStat(BaseModel):
+    make_model: str
+    # None either for records without the value or, outside group_by/filters, for the roll-up.
+    grade: str | None = None
+    model_year_gregorian: int | None = None
+    score_numeric: float | None = None
+    sale_count: int
+    median_yen: float | None = None
+    p10_yen: float | None = None
+    p90_yen: float | None = None
+    avg_mileage_km: float | None = None
+    # Price change per 10,000 km from a least-squares fit; None with too few samples.
+    yen_per_10k_km: float | None = None
+    # median_yen adjusted to the requested mileage_km along that fit.
+    adjusted_median_yen: float | None = None
+    first_auction_date: date | None = None
+    last_auction_date: date | None = None
+
+
+class MarketStatsResponse(BaseModel):
+    items: list[MarketStat]
+    # When market_price_stats was last refreshed; None when it has no rows.
+    refreshed_at: datetime | None = None
@@ -1,13 +1,15 @@
 from app.services.export import stream_csv
-from app.services.files import create_thumbnail, sha256_bytes
-from app.services.queue import enqueue_preprocess
+from app.services.files import sha256_bytes, sha256_upload
+from app.services.queue import enqueue_document, enqueue_documents, enqueue_preprocess
 from app.services.search import RecordFilters, apply_record_filters
 from app.services.security import create_access_token, hash_password, verify_password
-from app.services.storage import generate_key, storage_client
+from app.services.storage import async_storage_client, generate_key, storage_client
 
 __all__ = [
-    "create_thumbnail",
     "sha256_bytes",
+    "sha256_upload",
+    "enqueue_document",
+    "enqueue_documents",
     "enqueue_preprocess",
     "RecordFilters",
     "apply_record_filters",
@@ -16,5 +18,6 @@ __all__ = [
     "verify_password",
     "generate_key",
     "storage_client",
+    "async_storage_client",
     "stream_csv",
 ]
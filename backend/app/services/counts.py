@@ -0,0 +1,92 @@
+import json
+from typing import Hashable
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.config import settings
+from app.services.cache import TTLCache
+
+# "exact": COUNT(*) over the filtered query on every request.
+# "estimate": the planner's row estimate (pg_class.reltuples for unfiltered
+#   queries, EXPLAIN otherwise) once it reaches COUNT_ESTIMATE_THRESHOLD;
+#   smaller results are still counted exactly.
+# "cached": exact counts kept for COUNT_CACHE_TTL_SECONDS per filter set.
+COUNT_STRATEGIES = ("exact", "estimate", "cached")
+
+_count_cache = TTLCache(ttl=settings.COUNT_CACHE_TTL_SECONDS)
+
+
+class explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` for a select, keeping its bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(explain, "postgresql")
+def _compile_explain(element: explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_rows(
+    db: AsyncSession,
+    query: Select,
+    model,
+    strategy: str = "exact",
+    cache_key: Hashable | None = None,
+) -> tuple[int, bool]:
+    """Return ``(total, estimated)`` for ``query`` using ``strategy``.
+
+    ``cache_key`` identifies the filter set for the "cached" strategy; without
+    one the count is not cached.
+    """
+    if strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"Unknown count strategy: {strategy}")
+
+    if strategy == "estimate":
+        if query.whereclause is None:
+            estimate = await _table_estimate(db, model.__table__.name)
+        else:
+            estimate = await _plan_estimate(db, query)
+        if estimate is not None and estimate >= settings.COUNT_ESTIMATE_THRESHOLD:
+            return estimate, True
+        return await _exact_count(db, query), False
+
+    if strategy == "cached" and cache_key is not None:
+        total = _count_cache.get(cache_key)
+        if total is None:
+            total = await _exact_count(db, query)
+            _count_cache.set(cache_key, total)
+        return total, False
+
+    return await _exact_count(db, query), False
+
+
+async def _exact_count(db: AsyncSession, query: Select) -> int:
+    return await db.scalar(select(func.count()).select_from(query.subquery())) or 0
+
+
+async def _table_estimate(db: AsyncSession, table: str) -> int | None:
+    # reltuples is -1 until the table has been vacuumed or analyzed.
+    reltuples = await db.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+        {"table": table},
+    )
+    if reltuples is None or reltuples < 0:
+        return None
+    return int(reltuples)
+
+
+async def _plan_estimate(db: AsyncSession, query: Select) -> int | None:
+    plan = await db.scalar(explain(query))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    try:
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
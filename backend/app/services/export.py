@@ -1,6 +1,11 @@
 import csv
-from io import StringIO
-from typing import Iterable
+from io import RawIOBase, StringIO
+from typing import AsyncIterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, Date, DateTime, Integer, Numeric, Select, select
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 
 from app.models.record import AuctionRecord
 
@@ -21,17 +26,156 @@ CSV_FIELDS = [
     "needs_review",
 ]
 
+# Large or derived columns that are never exported.
+_EXCLUDED_COLUMNS = {"full_text", "search_text"}
+
+# Every scalar column of auction_records, in table order; the default for columnar exports.
+EXPORT_FIELDS = [
+    column.name
+    for column in AuctionRecord.__table__.columns
+    if not isinstance(column.type, (JSONB, TSVECTOR)) and column.name not in _EXCLUDED_COLUMNS
+]
+
+# Rows fetched per server-side cursor round trip, rows written per CSV chunk,
+# and rows per Arrow record batch / Parquet row group.
+EXPORT_FETCH_SIZE = 1000
+EXPORT_CHUNK_ROWS = 500
+EXPORT_BATCH_ROWS = 10_000
+
+ARROW_FORMATS = {
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+def resolve_fields(fields: list[str] | None, default: list[str]) -> list[str]:
+    """Validate requested export fields; accepts repeated and comma-separated values."""
+    if not fields:
+        return list(default)
+    requested = [name.strip() for value in fields for name in value.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in EXPORT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown export fields: {', '.join(unknown)}")
+    return requested
+
 
-def stream_csv(records: Iterable[AuctionRecord]):
+def export_select(fields: list[str] = CSV_FIELDS) -> Select:
+    """Select only the exported columns, leaving full_text and evidence in the database."""
+    return select(*(getattr(AuctionRecord, field) for field in fields))
+
+
+async def stream_csv(
+    rows: AsyncIterable, fields: list[str] = CSV_FIELDS, chunk_rows: int = EXPORT_CHUNK_ROWS
+):
+    """Yield CSV text for ``rows`` (tuples in ``fields`` order), ``chunk_rows`` per chunk."""
     buffer = StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
-    writer.writeheader()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+
+    pending = 0
+    async for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
     yield buffer.getvalue()
-    buffer.seek(0)
-    buffer.truncate(0)
-
-    for record in records:
-        writer.writerow({field: getattr(record, field) for field in CSV_FIELDS})
-        yield buffer.getvalue()
-        buffer.seek(0)
-        buffer.truncate(0)
+
+
+def arrow_schema(fields: list[str]):
+    """Arrow types for the exported columns; Numeric columns become float64 for pandas."""
+    schema = []
+    for field in fields:
+        column = AuctionRecord.__table__.columns[field]
+        if isinstance(column.type, UUID):
+            arrow_type = pa.string()
+        elif isinstance(column.type, DateTime):
+            arrow_type = pa.timestamp("us", tz="UTC")
+        elif isinstance(column.type, Date):
+            arrow_type = pa.date32()
+        elif isinstance(column.type, Boolean):
+            arrow_type = pa.bool_()
+        elif isinstance(column.type, Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, Numeric):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        schema.append(pa.field(field, arrow_type, nullable=column.nullable))
+    return pa.schema(schema)
+
+
+async def stream_arrow(
+    rows: AsyncIterable,
+    fields: list[str],
+    fmt: str = "parquet",
+    batch_rows: int = EXPORT_BATCH_ROWS,
+):
+    """Yield a Parquet file or Arrow IPC stream for ``rows``, one record batch at a time.
+
+    Parquet gets one row group per batch, so only a single batch is held in
+    memory; the footer is written when the rows run out.
+    """
+    schema = arrow_schema(fields)
+    converters = [_converter(schema.field(idx).type) for idx in range(len(fields))]
+    sink = _ChunkSink()
+    writer = _arrow_writer(sink, schema, fmt)
+
+    columns: list[list] = [[] for _ in fields]
+    try:
+        async for row in rows:
+            for column, convert, value in zip(columns, converters, row):
+                column.append(convert(value))
+            if len(columns[0]) >= batch_rows:
+                writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+                columns = [[] for _ in fields]
+                yield sink.drain()
+        if columns[0]:
+            writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+class _ChunkSink(RawIOBase):
+    """Write-only file that hands back whatever was written since the last drain."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_writer(sink: _ChunkSink, schema, fmt: str):
+    if fmt == "parquet":
+        return pq.ParquetWriter(sink, schema)
+    if fmt == "arrow":
+        return pa.ipc.new_stream(sink, schema)
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+def _converter(arrow_type):
+    if arrow_type == pa.string():
+        return lambda value: None if value is None else str(value)
+    if arrow_type == pa.float64():
+        return lambda value: None if value is None else float(value)
+    return lambda value: value
+
@@ -0,0 +1,81 @@
+from typing import Hashable
+
+from sqlalchemy import Select, case, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.record import AuctionRecord
+from app.services.cache import TTLCache
+
+# Lower bounds of the price bands, in 万円 (final_bid_man); the last band is open-ended.
+PRICE_BANDS_MAN = (0, 100, 200, 300, 500, 1000)
+
+FACETS = ("auction_venue", "score", "model_year_gregorian", "price_band")
+
+_facet_cache = TTLCache(ttl=settings.FACETS_CACHE_TTL_SECONDS)
+
+
+def facet_select() -> Select:
+    """Columns the facets group on; apply the list filters to this before ``facet_counts``."""
+    band = case(
+        *((AuctionRecord.final_bid_man >= lower, lower) for lower in reversed(PRICE_BANDS_MAN)),
+        else_=None,
+    )
+    return select(
+        AuctionRecord.auction_venue,
+        AuctionRecord.score,
+        AuctionRecord.model_year_gregorian,
+        band.label("price_band"),
+    )
+
+
+def facet_query(query: Select) -> Select:
+    """One GROUPING SETS query: a set per facet plus the empty set for the total."""
+    rows = query.subquery()
+    columns = [rows.c[name] for name in FACETS]
+    return select(
+        *columns,
+        *(func.grouping(column).label(f"grouping_{column.name}") for column in columns),
+        func.count().label("count"),
+    ).group_by(func.grouping_sets(*(tuple_(column) for column in columns), tuple_()))
+
+
+async def facet_counts(db: AsyncSession, query: Select, cache_key: Hashable | None = None) -> dict:
+    """Count ``query`` (built on ``facet_select``) per facet value in one round trip.
+
+    Results are kept for FACETS_CACHE_TTL_SECONDS under ``cache_key``.
+    """
+    if cache_key is not None:
+        cached = _facet_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    facets: dict = {name: [] for name in FACETS}
+    total = 0
+    for row in (await db.execute(facet_query(query))).mappings():
+        grouped = [name for name in FACETS if row[f"grouping_{name}"] == 0]
+        if not grouped:
+            total = row["count"]
+            continue
+        name = grouped[0]
+        facets[name].append({"value": row[name], "count": row["count"]})
+
+    facets["auction_venue"].sort(key=lambda item: (-item["count"], item["value"] or ""))
+    facets["score"].sort(key=lambda item: (-item["count"], item["value"] or ""))
+    facets["model_year_gregorian"].sort(
+        key=lambda item: (item["value"] is None, -(item["value"] or 0))
+    )
+    facets["price_band"].sort(key=lambda item: (item["value"] is None, item["value"] or 0))
+    facets["price_band"] = [_price_band(item) for item in facets["price_band"]]
+    result = {"total": total, **facets}
+    if cache_key is not None:
+        _facet_cache.set(cache_key, result)
+    return result
+
+
+def _price_band(item: dict) -> dict:
+    lower = item["value"]
+    upper = None
+    if lower is not None:
+        upper = next((bound for bound in PRICE_BANDS_MAN if bound > lower), None)
+    return {"min_man": lower, "max_man": upper, "count": item["count"]}
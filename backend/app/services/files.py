@@ -1,17 +1,30 @@
 import hashlib
-from io import BytesIO
 
-from PIL import Image
+from fastapi import UploadFile
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
 
 
 def sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-def create_thumbnail(data: bytes, max_size: int = 400) -> bytes:
-    with Image.open(BytesIO(data)) as image:
-        image = image.convert("RGB")
-        image.thumbnail((max_size, max_size))
-        output = BytesIO()
-        image.save(output, format="JPEG", quality=80)
-        return output.getvalue()
+async def sha256_upload(
+    file: UploadFile, max_bytes: int, chunk_size: int = HASH_CHUNK_SIZE
+) -> tuple[str, int]:
+    """Hash an upload chunk by chunk and rewind it.
+
+    Returns the hex digest and the size read.  Reading stops as soon as the
+    size passes ``max_bytes``, so an oversized file is never read in full.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := await file.read(chunk_size):
+        size += len(chunk)
+        if size > max_bytes:
+            break
+        digest.update(chunk)
+    await file.seek(0)
+    return digest.hexdigest(), size
+
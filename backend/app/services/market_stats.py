@@ -0,0 +1,84 @@
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    Numeric,
+    Select,
+    String,
+    column,
+    select,
+    table,
+    text,
+)
+
+# Materialized view created in migration 0007; refreshed by worker.tasks.market_stats.
+market_price_stats = table(
+    "market_price_stats",
+    column("make_model", String),
+    column("grade", String),
+    column("model_year_gregorian", Integer),
+    column("score_numeric", Numeric(3, 1)),
+    column("grouping_level", Integer),
+    column("sale_count", Integer),
+    column("median_yen", Float),
+    column("p10_yen", Float),
+    column("p90_yen", Float),
+    column("avg_mileage_km", Float),
+    column("mileage_samples", Integer),
+    column("yen_per_km", Float),
+    column("first_auction_date", Date),
+    column("last_auction_date", Date),
+    column("refreshed_at", DateTime(timezone=True)),
+)
+
+# GROUPING() bit of each dimension in market_price_stats.grouping_level.
+DIMENSIONS = {"grade": 4, "model_year_gregorian": 2, "score_numeric": 1}
+
+# Fewer (price, mileage) pairs than this and no mileage trend is reported.
+MIN_MILEAGE_SAMPLES = 5
+
+REFRESH_SQL = text("REFRESH MATERIALIZED VIEW CONCURRENTLY market_price_stats")
+
+
+def stats_query(
+    make_model: str | None = None,
+    filters: dict | None = None,
+    group_by: tuple[str, ...] = (),
+    limit: int = 100,
+) -> Select:
+    """Select precomputed stats rows at the level implied by ``filters`` and ``group_by``.
+
+    Dimensions that are filtered on or listed in ``group_by`` are kept; the
+    rest are read from the rolled-up rows, so e.g. ``make_model`` alone
+    returns one row over every grade, year and score.
+    """
+    filters = {name: value for name, value in (filters or {}).items() if value is not None}
+    unknown = (set(filters) | set(group_by)) - set(DIMENSIONS)
+    if unknown:
+        raise ValueError(f"Unknown stats dimensions: {', '.join(sorted(unknown))}")
+
+    kept = set(filters) | set(group_by)
+    level = sum(bit for name, bit in DIMENSIONS.items() if name not in kept)
+    stats = market_price_stats.c
+    query = select(market_price_stats).where(stats.grouping_level == level)
+    if make_model:
+        query = query.where(stats.make_model == make_model)
+    for name, value in filters.items():
+        query = query.where(stats[name] == value)
+    return query.order_by(stats.sale_count.desc(), stats.make_model).limit(limit)
+
+
+def mileage_trend(row) -> float | None:
+    """Change in price per 10,000 km for the group, when there are enough samples."""
+    if row.yen_per_km is None or (row.mileage_samples or 0) < MIN_MILEAGE_SAMPLES:
+        return None
+    return row.yen_per_km * 10_000
+
+
+def mileage_adjusted_median(row, mileage_km: int) -> float | None:
+    """The group's median moved along its price/mileage slope to ``mileage_km``."""
+    trend = mileage_trend(row)
+    if trend is None or row.median_yen is None or row.avg_mileage_km is None:
+        return None
+    return row.median_yen + trend * (mileage_km - row.avg_mileage_km) / 10_000
@@ -0,0 +1,89 @@
+import base64
+import json
+from datetime import datetime
+from typing import Hashable
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.schemas.common import Page
+from app.services.counts import count_rows
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    payload = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except Exception as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    model,
+    *,
+    page: int = 1,
+    per_page: int = 20,
+    after: tuple[datetime, UUID] | None = None,
+    include_total: bool = True,
+    count_strategy: str = "exact",
+    count_key: Hashable | None = None,
+    rank: ColumnElement | None = None,
+) -> Page:
+    """Page ``query`` newest first on ``(created_at, id)``.
+
+    With ``after`` (a decoded ``next_cursor``) rows are fetched by keyset,
+    which costs the same on every page; otherwise ``page`` selects an
+    OFFSET page as before.  Either way one extra row is read to decide
+    whether a ``next_cursor`` exists.  ``include_total=False`` skips the
+    count; otherwise ``count_strategy`` picks how ``total`` is computed and
+    ``count_key`` names the filter set for cached counts.
+
+    ``rank`` orders by relevance (highest first) ahead of ``(created_at, id)``;
+    such pages are always OFFSET pages and carry no ``next_cursor``.
+    """
+    total = None
+    estimated = False
+    if include_total:
+        total, estimated = await count_rows(db, query, model, count_strategy, count_key)
+
+    if rank is not None:
+        ordered = query.order_by(rank.desc(), model.created_at.desc(), model.id.desc())
+        result = await db.execute(ordered.offset((page - 1) * per_page).limit(per_page))
+        return Page(
+            items=list(result.scalars().all()),
+            page=page,
+            per_page=per_page,
+            total=total,
+            total_estimated=estimated,
+        )
+
+    ordered = query.order_by(model.created_at.desc(), model.id.desc())
+    if after:
+        ordered = ordered.where(tuple_(model.created_at, model.id) < tuple_(*after))
+    else:
+        ordered = ordered.offset((page - 1) * per_page)
+
+    result = await db.execute(ordered.limit(per_page + 1))
+    items = list(result.scalars().all())
+    next_cursor = None
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+    return Page(
+        items=items,
+        page=page,
+        per_page=per_page,
+        total=total,
+        total_estimated=estimated,
+        next_cursor=next_cursor,
+    )
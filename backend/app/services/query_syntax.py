@@ -0,0 +1,167 @@
+"""Field-targeted search syntax for ``q``, e.g. ``chassis:WP0ZZ* venue:東京 price:>3000000``.
+
+Each ``field:value`` term compiles to a predicate on that field's own indexed
+column; whatever is left over is free text for ``plan_search``.  Values are:
+
+- text fields (``chassis``, ``model_code``, ``lot``, ``venue``): an exact value, or
+  a prefix ending in ``*``, which becomes a btree range scan;
+- numeric and date fields: ``v``, ``>v``, ``>=v``, ``<v``, ``<=v`` or ``lo..hi``
+  (inclusive; either side may be empty).  ``price`` also accepts ``万`` units.
+
+Values containing spaces can be double-quoted: ``venue:"USS 東京"``.  A ``name:``
+prefix that is not a field (``note:12:30``, a colon in a lot title) stays free text.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+from sqlalchemy import and_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.record import AuctionRecord
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    column: str
+    kind: str  # "code" (upper-cased text), "text", "int", "yen", "decimal" or "date"
+
+
+FIELDS = {
+    "chassis": FieldSpec("chassis_no", "code"),
+    "model_code": FieldSpec("model_code", "code"),
+    "code": FieldSpec("model_code", "code"),
+    "lot": FieldSpec("lot_no", "text"),
+    "venue": FieldSpec("auction_venue", "text"),
+    "price": FieldSpec("final_bid_yen", "yen"),
+    "mileage": FieldSpec("mileage_km", "int"),
+    "km": FieldSpec("mileage_km", "int"),
+    "score": FieldSpec("score_numeric", "decimal"),
+    "year": FieldSpec("year", "int"),
+    "date": FieldSpec("auction_date", "date"),
+}
+
+_TERM_RE = re.compile(r'([A-Za-z_]+):("[^"]*"|\S+)|"[^"]*"|\S+')
+_COMPARISON_RE = re.compile(r"^(>=|<=|>|<|=)?(.+)$")
+
+
+@dataclass(frozen=True)
+class FieldTerm:
+    field: str
+    op: str  # "=", ">", ">=", "<", "<=", "prefix" or "range"
+    value: object
+    upper: object = None  # upper bound of a "range"
+
+
+@dataclass(frozen=True)
+class ParsedQuery:
+    terms: tuple[FieldTerm, ...]
+    text: str  # free text left after removing field terms
+
+
+def parse_query(q: str) -> ParsedQuery:
+    """Split ``q`` into field terms and free text; raises ``ValueError`` on bad field values."""
+    q = unicodedata.normalize("NFKC", q)
+    terms: list[FieldTerm] = []
+    words: list[str] = []
+    for match in _TERM_RE.finditer(q):
+        name, raw = match.group(1), match.group(2)
+        if name is None:
+            words.append(_unquote(match.group(0)))
+            continue
+        if name.lower() not in FIELDS:
+            words.append(f"{name}:{_unquote(raw)}")
+            continue
+        terms.append(_parse_term(name.lower(), _unquote(raw)))
+    return ParsedQuery(tuple(terms), " ".join(words))
+
+
+def term_condition(term: FieldTerm) -> ColumnElement:
+    column = getattr(AuctionRecord, FIELDS[term.field].column)
+    if term.op == "prefix":
+        upper = _prefix_upper_bound(term.value)
+        # Pattern operators compare bytewise, so the range is right under any collation
+        # and can use the text_pattern_ops indexes (migration 0006).
+        lower_bound = column.op("~>=~", is_comparison=True)(term.value)
+        if upper is None:
+            return lower_bound
+        return and_(lower_bound, column.op("~<~", is_comparison=True)(upper))
+    if term.op == "range":
+        bounds = []
+        if term.value is not None:
+            bounds.append(column >= term.value)
+        if term.upper is not None:
+            bounds.append(column <= term.upper)
+        return and_(*bounds)
+    if term.op == ">":
+        return column > term.value
+    if term.op == ">=":
+        return column >= term.value
+    if term.op == "<":
+        return column < term.value
+    if term.op == "<=":
+        return column <= term.value
+    return column == term.value
+
+
+def _parse_term(name: str, raw: str) -> FieldTerm:
+    kind = FIELDS[name].kind
+    if not raw:
+        raise ValueError(f"Empty value for search field: {name}")
+
+    if kind in ("code", "text"):
+        value = raw.upper() if kind == "code" else raw
+        if value.endswith("*"):
+            prefix = value.rstrip("*")
+            if not prefix:
+                raise ValueError(f"Empty prefix for search field: {name}")
+            return FieldTerm(name, "prefix", prefix)
+        return FieldTerm(name, "=", value)
+
+    if ".." in raw:
+        lower, _, upper = raw.partition("..")
+        if not lower and not upper:
+            raise ValueError(f"Empty range for search field: {name}")
+        return FieldTerm(
+            name,
+            "range",
+            _parse_value(name, kind, lower) if lower else None,
+            _parse_value(name, kind, upper) if upper else None,
+        )
+
+    op, value = _COMPARISON_RE.match(raw).groups()
+    return FieldTerm(name, op or "=", _parse_value(name, kind, value))
+
+
+def _parse_value(name: str, kind: str, raw: str):
+    text = raw.replace(",", "")
+    try:
+        if kind == "date":
+            return date.fromisoformat(text.replace("/", "-"))
+        if kind == "yen" and text.endswith("万"):
+            return int(Decimal(text[:-1]) * 10_000)
+        if kind == "decimal":
+            return Decimal(text)
+        return int(text)
+    except (ValueError, InvalidOperation):
+        raise ValueError(f"Invalid value for search field {name}: {raw}")
+
+
+def _unquote(raw: str) -> str:
+    if len(raw) >= 2 and raw.startswith('"') and raw.endswith('"'):
+        return raw[1:-1].strip()
+    return raw
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with ``prefix``."""
+    for idx in range(len(prefix) - 1, -1, -1):
+        code_point = ord(prefix[idx]) + 1
+        if 0xD800 <= code_point <= 0xDFFF:
+            code_point = 0xE000
+        if code_point <= 0x10FFFF:
+            return prefix[:idx] + chr(code_point)
+    return None
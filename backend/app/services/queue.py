@@ -9,5 +9,46 @@ celery_client = Celery(
 )
 
 
-def enqueue_preprocess(document_id: str) -> None:
-    celery_client.send_task("worker.tasks.preprocess", args=[document_id])
+def enqueue_preprocess(document_id: str, skip_duplicate_check: bool = False) -> None:
+    celery_client.send_task(
+        "worker.tasks.preprocess.preprocess",
+        args=[document_id],
+        kwargs=_task_kwargs(skip_duplicate_check),
+        queue="cpu_preprocess",
+    )
+
+
+def enqueue_documents(document_ids: list[str]) -> None:
+    """Start processing several documents with a single broker message.
+
+    A ``dispatch_documents`` task on the worker side fans the ids out to the
+    per-document pipeline tasks.
+    """
+    if len(document_ids) == 1:
+        enqueue_document(document_ids[0])
+    elif document_ids:
+        celery_client.send_task(
+            "worker.tasks.pipeline.dispatch_documents", args=[document_ids], queue="default"
+        )
+
+
+def enqueue_document(document_id: str, skip_duplicate_check: bool = False) -> None:
+    """Start processing a document in the configured ``PIPELINE_MODE``.
+
+    ``skip_duplicate_check`` OCRs the document even if it looks like a
+    near-duplicate of an earlier one.
+    """
+    if settings.PIPELINE_MODE == "fused":
+        celery_client.send_task(
+            "worker.tasks.pipeline.process_document",
+            args=[document_id],
+            kwargs=_task_kwargs(skip_duplicate_check),
+            queue="gpu_ocr",
+        )
+    else:
+        enqueue_preprocess(document_id, skip_duplicate_check)
+
+
+def _task_kwargs(skip_duplicate_check: bool) -> dict:
+    # Only sent when set, so workers still on the old task signature keep working.
+    return {"skip_duplicate_check": True} if skip_duplicate_check else {}
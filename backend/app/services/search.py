@@ -1,12 +1,24 @@
+import re
+import unicodedata
 from datetime import date
 from typing import Iterable
 
-from sqlalchemy import Select, func, or_
+from sqlalchemy import Select, case, cast, func, literal, or_
+from sqlalchemy.dialects.postgresql import TSQUERY
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.record import AuctionRecord
+from app.services.query_syntax import parse_query, term_condition
+
+# Japanese chassis numbers ("AAZA20-6001762") and 17-character VINs.
+_CHASSIS_RE = re.compile(r"^(?:[A-Z0-9]{2,8}-\d{4,8}|[A-HJ-NPR-Z0-9]{17})$")
+# Model codes ("AAZA20", "J1NE", "3BA-AAZA20"): letters and digits, no spaces.
+_MODEL_CODE_RE = re.compile(r"^(?:[A-Z0-9]{3}-)?(?=[A-Z0-9]*[A-Z])(?=[A-Z0-9]*\d)[A-Z0-9]{3,10}$")
 
 
 class RecordFilters:
+    """List/export filters; raises ``ValueError`` when ``q`` has a malformed field term."""
+
     def __init__(
         self,
         q: str | None = None,
@@ -19,6 +31,10 @@ class RecordFilters:
         needs_review: bool | None = None,
     ) -> None:
         self.q = q
+        # Field terms ("chassis:WP0ZZ*") and the free text left over; see query_syntax.
+        parsed = parse_query(q) if q else None
+        self.terms = parsed.terms if parsed else ()
+        self.text = parsed.text if parsed else None
         self.auction_date_from = auction_date_from
         self.auction_date_to = auction_date_to
         self.mileage_min = mileage_min
@@ -27,16 +43,29 @@ class RecordFilters:
         self.auction_venue = list(auction_venue) if auction_venue else None
         self.needs_review = needs_review
 
+    def cache_key(self) -> tuple:
+        """Hashable key that is equal for filters selecting the same rows."""
+        venues = tuple(sorted(set(self.auction_venue))) if self.auction_venue else None
+        return (
+            self.terms,
+            self.text or None,
+            self.auction_date_from,
+            self.auction_date_to,
+            self.mileage_min,
+            self.mileage_max,
+            self.score_min,
+            venues,
+            self.needs_review,
+        )
+
 
 def apply_record_filters(query: Select, filters: RecordFilters) -> Select:
-    if filters.q:
-        ts_query = func.plainto_tsquery("english", filters.q)
-        query = query.where(
-            or_(
-                AuctionRecord.fts_vector_en.op("@@")(ts_query),
-                AuctionRecord.search_text.ilike(f"%{filters.q}%"),
-            )
-        )
+    for term in filters.terms:
+        query = query.where(term_condition(term))
+    if filters.text:
+        plan = plan_search(filters.text)
+        if plan:
+            query = query.where(plan.condition)
     if filters.auction_date_from:
         query = query.where(AuctionRecord.auction_date >= filters.auction_date_from)
     if filters.auction_date_to:
@@ -52,3 +81,99 @@ def apply_record_filters(query: Select, filters: RecordFilters) -> Select:
     if filters.needs_review is not None:
         query = query.where(AuctionRecord.needs_review == filters.needs_review)
     return query
+
+
+class SearchPlan:
+    """How a free-text query is matched: ``condition`` filters, ``rank`` orders (higher first).
+
+    ``kind`` is "chassis", "model_code", "text" or "substring" (queries with a
+    one-character word, which bigrams cannot match).
+    """
+
+    def __init__(self, kind: str, condition: ColumnElement, rank: ColumnElement) -> None:
+        self.kind = kind
+        self.condition = condition
+        self.rank = rank
+
+
+def normalize_query(q: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", q).split())
+
+
+def bigrams(text: str) -> list[str]:
+    """Distinct character bigrams of each word of NFKC-normalized, lowercased ``text``.
+
+    Mirrors the ``auction_bigrams()`` SQL function behind ``search_bigrams``.
+    """
+    grams: dict[str, None] = {}
+    for word in unicodedata.normalize("NFKC", text).lower().split():
+        for idx in range(len(word) - 1):
+            grams[word[idx : idx + 2]] = None
+    return list(grams)
+
+
+def bigram_tsquery(text: str) -> str:
+    """A tsquery literal that matches rows containing every bigram of ``text``."""
+    return " & ".join(_tsquery_lexeme(gram) for gram in bigrams(text))
+
+
+def plan_search(q: str) -> SearchPlan | None:
+    """Pick the index a query should use from its shape.
+
+    Chassis numbers go to ``chassis_no`` (exact or trigram); model codes to
+    ``model_code``/``chassis_no`` trigrams plus the bigram index, since names
+    such as "GR86" look like codes; everything else to the bigram and English
+    full-text indexes, ranked with ``ts_rank``.
+    """
+    q = normalize_query(q)
+    if not q:
+        return None
+    code = q.upper()
+
+    if _CHASSIS_RE.match(code):
+        return SearchPlan(
+            "chassis",
+            or_(AuctionRecord.chassis_no == code, _contains(AuctionRecord.chassis_no, code)),
+            case((AuctionRecord.chassis_no == code, 2.0), else_=0.0)
+            + func.similarity(AuctionRecord.chassis_no, code),
+        )
+
+    if any(len(word) < 2 for word in q.split()):
+        return SearchPlan(
+            "substring", _contains(AuctionRecord.search_text, q), literal(0.0)
+        )
+
+    ts_bigrams = cast(bigram_tsquery(q), TSQUERY)
+    ts_english = func.plainto_tsquery("english", q)
+    text_condition = or_(
+        AuctionRecord.search_bigrams.op("@@")(ts_bigrams),
+        AuctionRecord.fts_vector_en.op("@@")(ts_english),
+    )
+    text_rank = func.coalesce(func.ts_rank(AuctionRecord.search_bigrams, ts_bigrams), 0.0) + (
+        func.coalesce(func.ts_rank(AuctionRecord.fts_vector_en, ts_english), 0.0)
+    )
+
+    if _MODEL_CODE_RE.match(code):
+        return SearchPlan(
+            "model_code",
+            or_(
+                AuctionRecord.model_code == code,
+                _contains(AuctionRecord.model_code, code),
+                _contains(AuctionRecord.chassis_no, code),
+                text_condition,
+            ),
+            case((AuctionRecord.model_code == code, 2.0), else_=0.0)
+            + func.coalesce(func.similarity(AuctionRecord.model_code, code), 0.0)
+            + text_rank,
+        )
+
+    return SearchPlan("text", text_condition, text_rank)
+
+
+def _contains(column, value: str) -> ColumnElement:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+def _tsquery_lexeme(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "''") + "'"
@@ -32,3 +32,20 @@ def decode_access_token(token: str) -> Dict[str, Any]:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError as exc:
         raise ValueError("Invalid token") from exc
+
+
+def create_upload_token(user_id: str, key: str, expires_seconds: int) -> str:
+    """Bind a presigned upload's object key to the user it was issued to.
+
+    There is no ``sub`` claim, so the token can never pass as an access token.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(seconds=expires_seconds)
+    to_encode: Dict[str, Any] = {"typ": "upload", "uid": user_id, "key": key, "exp": expire}
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_upload_token(token: str) -> Dict[str, Any]:
+    payload = decode_access_token(token)
+    if payload.get("typ") != "upload" or not payload.get("uid") or not payload.get("key"):
+        raise ValueError("Invalid token")
+    return payload
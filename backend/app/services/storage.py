@@ -1,7 +1,12 @@
+import asyncio
+import hashlib
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from app.config import settings
@@ -14,6 +19,16 @@ class StorageClient:
             endpoint_url=settings.S3_ENDPOINT_URL,
             aws_access_key_id=settings.S3_ACCESS_KEY,
             aws_secret_access_key=settings.S3_SECRET_KEY,
+            config=Config(max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS),
+        )
+        # Presigned URLs embed the host in the signature, so browsers need one
+        # signed for the endpoint they can reach.
+        self._public_client = boto3.client(
+            "s3",
+            endpoint_url=settings.S3_PUBLIC_ENDPOINT_URL or settings.S3_ENDPOINT_URL,
+            aws_access_key_id=settings.S3_ACCESS_KEY,
+            aws_secret_access_key=settings.S3_SECRET_KEY,
+            config=Config(signature_version="s3v4"),
         )
 
     @property
@@ -31,6 +46,11 @@ class StorageClient:
         self._client.put_object(Bucket=self.bucket, Key=key, Body=data, **(extra or {}))
         return key
 
+    def upload_fileobj(self, key: str, fileobj, content_type: str | None = None) -> str:
+        extra = {"ContentType": content_type} if content_type else None
+        self._client.upload_fileobj(fileobj, self.bucket, key, ExtraArgs=extra)
+        return key
+
     def download_bytes(self, key: str) -> bytes:
         response = self._client.get_object(Bucket=self.bucket, Key=key)
         return response["Body"].read()
@@ -43,8 +63,93 @@ class StorageClient:
         )
         return dest_key
 
+    def presigned_put_url(
+        self, key: str, content_type: str | None = None, expires_in: int = 900
+    ) -> str:
+        params = {"Bucket": self.bucket, "Key": key}
+        if content_type:
+            params["ContentType"] = content_type
+        return self._public_client.generate_presigned_url(
+            "put_object", Params=params, ExpiresIn=expires_in
+        )
+
+    def head_object(self, key: str) -> dict | None:
+        try:
+            return self._client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def sha256_object(self, key: str, chunk_size: int = 1024 * 1024) -> str:
+        digest = hashlib.sha256()
+        response = self._client.get_object(Bucket=self.bucket, Key=key)
+        for chunk in response["Body"].iter_chunks(chunk_size):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def delete_objects(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        self._client.delete_objects(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+
+
+class AsyncStorageClient:
+    """Awaitable ``StorageClient`` for the API process.
+
+    Calls run on a bounded thread pool sized to the boto3 connection pool,
+    so the event loop never waits on S3 and every worker thread has a
+    pooled connection to use.
+    """
+
+    def __init__(self, client: StorageClient, max_workers: int) -> None:
+        self._client = client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="storage")
+
+    @property
+    def bucket(self) -> str:
+        return self._client.bucket
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def ensure_bucket(self) -> None:
+        await self._run(self._client.ensure_bucket)
+
+    async def upload_bytes(self, key: str, data: bytes, content_type: str | None = None) -> str:
+        return await self._run(self._client.upload_bytes, key, data, content_type)
+
+    async def upload_fileobj(self, key: str, fileobj, content_type: str | None = None) -> str:
+        return await self._run(self._client.upload_fileobj, key, fileobj, content_type)
+
+    async def download_bytes(self, key: str) -> bytes:
+        return await self._run(self._client.download_bytes, key)
+
+    async def copy_object(self, source_key: str, dest_key: str) -> str:
+        return await self._run(self._client.copy_object, source_key, dest_key)
+
+    async def head_object(self, key: str) -> dict | None:
+        return await self._run(self._client.head_object, key)
+
+    async def sha256_object(self, key: str) -> str:
+        return await self._run(self._client.sha256_object, key)
+
+    def presigned_put_url(
+        self, key: str, content_type: str | None = None, expires_in: int = 900
+    ) -> str:
+        # Signing is local computation; no request is made.
+        return self._client.presigned_put_url(key, content_type, expires_in)
+
+    async def delete_objects(self, keys: list[str]) -> None:
+        await self._run(self._client.delete_objects, keys)
+
 
 storage_client = StorageClient()
+async_storage_client = AsyncStorageClient(storage_client, settings.S3_MAX_POOL_CONNECTIONS)
 
 
 def generate_key(prefix: str, filename: str | None = None) -> str:
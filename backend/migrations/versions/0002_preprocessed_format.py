@@ -0,0 +1,25 @@
+"""documents.preprocessed_format
+
+Revision ID: 0002_preprocessed_format
+Revises: 0001_initial
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002_preprocessed_format"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # NULL means a legacy PNG written before the format was recorded.
+    op.add_column("documents", sa.Column("preprocessed_format", sa.String(length=20)))
+
+
+def downgrade() -> None:
+    op.drop_column("documents", "preprocessed_format")
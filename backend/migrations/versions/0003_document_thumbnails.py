@@ -0,0 +1,25 @@
+"""documents.thumbnails
+
+Revision ID: 0003_document_thumbnails
+Revises: 0002_preprocessed_format
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0003_document_thumbnails"
+down_revision = "0002_preprocessed_format"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("documents", sa.Column("thumbnails", postgresql.JSONB()))
+
+
+def downgrade() -> None:
+    op.drop_column("documents", "thumbnails")
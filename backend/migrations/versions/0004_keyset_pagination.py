@@ -0,0 +1,41 @@
+"""(created_at, id) indexes for keyset pagination
+
+Revision ID: 0004_keyset_pagination
+Revises: 0003_document_thumbnails
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0004_keyset_pagination"
+down_revision = "0003_document_thumbnails"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_documents_created", table_name="documents")
+    op.create_index(
+        "idx_documents_created", "documents", [sa.text("created_at DESC"), sa.text("id DESC")]
+    )
+    op.create_index(
+        "idx_records_created",
+        "auction_records",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "idx_records_review_created",
+        "auction_records",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        postgresql_where=sa.text("needs_review = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_records_review_created", table_name="auction_records")
+    op.drop_index("idx_records_created", table_name="auction_records")
+    op.drop_index("idx_documents_created", table_name="documents")
+    op.create_index("idx_documents_created", "documents", [sa.text("created_at DESC")])
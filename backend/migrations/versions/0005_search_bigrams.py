@@ -0,0 +1,67 @@
+"""auction_records.search_bigrams for Japanese-aware search
+
+Revision ID: 0005_search_bigrams
+Revises: 0004_keyset_pagination
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0005_search_bigrams"
+down_revision = "0004_keyset_pagination"
+branch_labels = None
+depends_on = None
+
+
+SEARCH_TEXT_SQL = (
+    "coalesce(lot_no, '') || ' ' || "
+    "coalesce(auction_venue, '') || ' ' || "
+    "coalesce(auction_venue_round, '') || ' ' || "
+    "coalesce(make_model, '') || ' ' || "
+    "coalesce(make_ja, '') || ' ' || "
+    "coalesce(make_en, '') || ' ' || "
+    "coalesce(model_ja, '') || ' ' || "
+    "coalesce(model_en, '') || ' ' || "
+    "coalesce(model_code, '') || ' ' || "
+    "coalesce(chassis_no, '') || ' ' || "
+    "coalesce(notes_text, '') || ' ' || "
+    "coalesce(options_text, '')"
+)
+
+
+def upgrade() -> None:
+    # Must match app.services.search.bigrams(), which tokenizes queries.
+    op.execute(
+        r"""
+        CREATE FUNCTION auction_bigrams(input text) RETURNS tsvector
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(array_to_tsvector(array_agg(DISTINCT substr(word, i, 2))), ''::tsvector)
+            FROM regexp_split_to_table(lower(normalize(coalesce(input, ''), NFKC)), '\s+') AS word,
+                 generate_series(1, char_length(word) - 1) AS i
+        $$
+        """
+    )
+    op.add_column(
+        "auction_records",
+        sa.Column(
+            "search_bigrams",
+            postgresql.TSVECTOR(),
+            sa.Computed(f"auction_bigrams({SEARCH_TEXT_SQL})", persisted=True),
+        ),
+    )
+    op.create_index(
+        "idx_records_search_bigrams",
+        "auction_records",
+        ["search_bigrams"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_records_search_bigrams", table_name="auction_records")
+    op.drop_column("auction_records", "search_bigrams")
+    op.execute("DROP FUNCTION auction_bigrams(text)")
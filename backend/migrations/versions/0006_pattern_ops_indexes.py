@@ -0,0 +1,42 @@
+"""text_pattern_ops indexes for field-targeted prefix search
+
+Revision ID: 0006_pattern_ops_indexes
+Revises: 0005_search_bigrams
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0006_pattern_ops_indexes"
+down_revision = "0005_search_bigrams"
+branch_labels = None
+depends_on = None
+
+
+# text_pattern_ops still serves "=" and IN lookups, and adds bytewise range scans
+# (~>=~ / ~<~) for "chassis:WP0ZZ*"-style prefixes regardless of the database collation.
+INDEXES = {
+    "idx_records_auction_venue": "auction_venue",
+    "idx_records_lot": "lot_no",
+    "idx_records_model_code": "model_code",
+    "idx_records_chassis_no": "chassis_no",
+}
+
+
+def upgrade() -> None:
+    for name, column in INDEXES.items():
+        op.drop_index(name, table_name="auction_records")
+        op.create_index(
+            name,
+            "auction_records",
+            [column],
+            postgresql_ops={column: "text_pattern_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, column in INDEXES.items():
+        op.drop_index(name, table_name="auction_records")
+        op.create_index(name, "auction_records", [column])
@@ -0,0 +1,58 @@
+"""market_price_stats materialized view
+
+Revision ID: 0007_market_price_stats
+Revises: 0006_pattern_ops_indexes
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0007_market_price_stats"
+down_revision = "0006_pattern_ops_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per make_model and every combination of grade, model year and score
+    # (CUBE), so percentiles, which cannot be merged across groups, exist for each
+    # level. grouping_level is GROUPING(grade, model_year_gregorian, score_numeric):
+    # 4, 2 and 1 mark those columns as rolled up.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW market_price_stats AS
+        SELECT
+            make_model,
+            grade,
+            model_year_gregorian,
+            score_numeric,
+            GROUPING(grade, model_year_gregorian, score_numeric) AS grouping_level,
+            count(*) AS sale_count,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY final_bid_yen) AS median_yen,
+            percentile_cont(0.1) WITHIN GROUP (ORDER BY final_bid_yen) AS p10_yen,
+            percentile_cont(0.9) WITHIN GROUP (ORDER BY final_bid_yen) AS p90_yen,
+            avg(mileage_km) AS avg_mileage_km,
+            regr_count(final_bid_yen, mileage_km) AS mileage_samples,
+            regr_slope(final_bid_yen, mileage_km) AS yen_per_km,
+            min(auction_date) AS first_auction_date,
+            max(auction_date) AS last_auction_date,
+            now() AS refreshed_at
+        FROM auction_records
+        WHERE make_model IS NOT NULL AND final_bid_yen IS NOT NULL
+        GROUP BY make_model, CUBE (grade, model_year_gregorian, score_numeric)
+        """
+    )
+    # REFRESH ... CONCURRENTLY needs a unique index covering every row.
+    op.execute(
+        """
+        CREATE UNIQUE INDEX idx_market_price_stats_key ON market_price_stats
+        (make_model, grouping_level, grade, model_year_gregorian, score_numeric)
+        NULLS NOT DISTINCT
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS market_price_stats")
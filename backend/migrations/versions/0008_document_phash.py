@@ -0,0 +1,40 @@
+"""documents.phash, phash_bands and duplicate_of
+
+Revision ID: 0008_document_phash
+Revises: 0007_market_price_stats
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0008_document_phash"
+down_revision = "0007_market_price_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("documents", sa.Column("phash", sa.String(length=64)))
+    op.add_column("documents", sa.Column("phash_bands", postgresql.ARRAY(sa.Integer())))
+    op.add_column(
+        "documents",
+        sa.Column(
+            "duplicate_of",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("documents.id", ondelete="SET NULL"),
+        ),
+    )
+    op.create_index(
+        "idx_documents_phash_bands", "documents", ["phash_bands"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_documents_phash_bands", table_name="documents")
+    op.drop_column("documents", "duplicate_of")
+    op.drop_column("documents", "phash_bands")
+    op.drop_column("documents", "phash")
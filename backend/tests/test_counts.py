@@ -0,0 +1,59 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.record import AuctionRecord
+from app.services import cache as cache_module
+from app.services.cache import TTLCache
+from app.services.counts import explain
+from app.services.search import RecordFilters, apply_record_filters
+
+
+def test_ttl_cache_expires_entries(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=30)
+    cache.set("records", 42)
+
+    now[0] += 29
+    assert cache.get("records") == 42
+    now[0] += 2
+    assert cache.get("records") is None
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(ttl=30, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_filter_cache_key_ignores_venue_order() -> None:
+    first = RecordFilters(auction_venue=["USS東京", "TAA近畿", "USS東京"], mileage_min=0)
+    second = RecordFilters(auction_venue=["TAA近畿", "USS東京"], mileage_min=0)
+
+    assert first.cache_key() == second.cache_key()
+    assert RecordFilters(q="").cache_key() == RecordFilters().cache_key()
+    assert RecordFilters(mileage_min=0).cache_key() != RecordFilters().cache_key()
+
+
+def test_explain_keeps_bound_parameters() -> None:
+    query = apply_record_filters(
+        select(AuctionRecord),
+        RecordFilters(auction_date_from=date(2024, 1, 1), auction_venue=["USS東京"]),
+    )
+    compiled = explain(query).compile(dialect=postgresql.dialect())
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert date(2024, 1, 1) in compiled.params.values()
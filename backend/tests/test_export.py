@@ -0,0 +1,106 @@
+import asyncio
+import csv
+import sys
+import uuid
+from datetime import date
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from app.services.export import CSV_FIELDS, resolve_fields, stream_arrow, stream_csv
+
+
+async def _rows(count: int):
+    for idx in range(count):
+        yield (idx, "doc", None, "東京", str(idx), "タイカン", None, None, 2022, 1000, "4.5", 1, False)
+
+
+def _collect(count: int, chunk_rows: int) -> list[str]:
+    async def collect() -> list[str]:
+        return [chunk async for chunk in stream_csv(_rows(count), chunk_rows=chunk_rows)]
+
+    return asyncio.run(collect())
+
+
+def test_stream_csv_batches_rows_per_chunk() -> None:
+    chunks = _collect(25, chunk_rows=10)
+
+    assert len(chunks) == 3
+    rows = list(csv.reader(StringIO("".join(chunks))))
+    assert rows[0] == CSV_FIELDS
+    assert len(rows) == 26
+    assert rows[1][3] == "東京"
+    assert rows[1][2] == ""
+
+
+def test_stream_csv_without_rows_yields_header() -> None:
+    assert _collect(0, chunk_rows=10) == [",".join(CSV_FIELDS) + "\r\n"]
+
+
+def test_resolve_fields_accepts_comma_separated_and_rejects_unknown() -> None:
+    assert resolve_fields(["lot_no,score_numeric", "year"], CSV_FIELDS) == [
+        "lot_no",
+        "score_numeric",
+        "year",
+    ]
+    assert resolve_fields(None, CSV_FIELDS) == CSV_FIELDS
+    with pytest.raises(ValueError):
+        resolve_fields(["evidence"], CSV_FIELDS)
+
+
+COLUMNAR_FIELDS = ["id", "auction_date", "score_numeric", "final_bid_yen", "auction_venue"]
+
+
+async def _columnar_rows(count: int):
+    for idx in range(count):
+        yield (uuid.uuid4(), date(2026, 1, idx + 1), Decimal("4.5"), 1_000_000 + idx, "東京")
+
+
+def _collect_columnar(count: int, fmt: str, batch_rows: int) -> bytes:
+    async def collect() -> bytes:
+        body = stream_arrow(_columnar_rows(count), COLUMNAR_FIELDS, fmt, batch_rows=batch_rows)
+        return b"".join([chunk async for chunk in body])
+
+    return asyncio.run(collect())
+
+
+def test_stream_arrow_parquet_keeps_types() -> None:
+    parquet = pq.ParquetFile(BytesIO(_collect_columnar(25, "parquet", batch_rows=10)))
+    table = parquet.read()
+
+    assert parquet.num_row_groups == 3
+    assert table.num_rows == 25
+    assert str(table.schema.field("auction_date").type) == "date32[day]"
+    assert str(table.schema.field("score_numeric").type) == "double"
+    assert str(table.schema.field("final_bid_yen").type) == "int64"
+    assert table.column("score_numeric")[0].as_py() == 4.5
+    assert table.schema.names == COLUMNAR_FIELDS
+
+
+def test_stream_arrow_ipc_stream_reads_back() -> None:
+    reader = pa.ipc.open_stream(_collect_columnar(25, "arrow", batch_rows=10))
+    batches = list(reader)
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    assert table.num_rows == 25
+    assert table.schema.names == COLUMNAR_FIELDS
+    assert str(table.schema.field("id").type) == "string"
+    assert str(table.schema.field("auction_date").type) == "date32[day]"
+    assert str(table.schema.field("final_bid_yen").type) == "int64"
+    assert table.column("auction_venue")[24].as_py() == "東京"
+    assert table.column("auction_date")[24].as_py() == date(2026, 1, 25)
+
+
+def test_stream_arrow_without_rows_writes_schema() -> None:
+    table = pq.read_table(BytesIO(_collect_columnar(0, "parquet", batch_rows=10)))
+
+    assert table.num_rows == 0
+    assert table.schema.names == COLUMNAR_FIELDS
@@ -0,0 +1,53 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.services.facets import _price_band, facet_query, facet_select
+from app.services.search import RecordFilters, apply_record_filters
+
+
+def test_facets_are_one_grouping_sets_query() -> None:
+    query = apply_record_filters(facet_select(), RecordFilters(q="price:>=300万"))
+    sql = str(facet_query(query).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("SELECT") == 2
+    assert "GROUP BY GROUPING SETS((anon_1.auction_venue), (anon_1.score), " in sql
+    assert "(anon_1.price_band), ())" in sql
+    assert "auction_records.final_bid_yen >=" in sql
+
+
+def test_facet_select_bands_prices_in_man() -> None:
+    compiled = facet_select().compile(dialect=postgresql.dialect())
+
+    assert "CASE WHEN (auction_records.final_bid_man >=" in str(compiled)
+    assert list(compiled.params.values())[:2] == [1000, 1000]
+    assert select(facet_select().subquery()).selected_columns.keys() == [
+        "auction_venue",
+        "score",
+        "model_year_gregorian",
+        "price_band",
+    ]
+
+
+def test_price_band_bounds() -> None:
+    assert _price_band({"value": 200, "count": 3}) == {"min_man": 200, "max_man": 300, "count": 3}
+    assert _price_band({"value": 1000, "count": 1})["max_man"] is None
+    assert _price_band({"value": None, "count": 5})["min_man"] is None
+
+
+def test_list_facets_and_exports_take_the_same_filters() -> None:
+    from app.main import app
+
+    def query_params(path: str) -> set[str]:
+        operation = app.openapi()["paths"][path]["get"]
+        return {param["name"] for param in operation["parameters"] if param["in"] == "query"}
+
+    filters = query_params("/v1/records/facets")
+    assert "auction_venue" in filters
+    assert filters <= query_params("/v1/records")
+    assert filters <= query_params("/v1/exports/records.csv")
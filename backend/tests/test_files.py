@@ -0,0 +1,28 @@
+import sys
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from worker.ocr.image_utils import render_thumbnails
+
+
+def test_render_thumbnails_from_decoded_image() -> None:
+    image = np.full((2000, 3000, 3), 128, dtype=np.uint8)
+
+    thumbnails = render_thumbnails(image, {"list": 400, "detail": 1200})
+
+    sizes = {name: Image.open(BytesIO(data)).size for name, data in thumbnails.items()}
+    assert sizes == {"list": (400, 267), "detail": (1200, 800)}
+
+
+def test_render_thumbnails_never_upscales() -> None:
+    image = np.full((200, 300, 3), 128, dtype=np.uint8)
+
+    thumbnails = render_thumbnails(image, {"list": 400})
+
+    assert Image.open(BytesIO(thumbnails["list"])).size == (300, 200)
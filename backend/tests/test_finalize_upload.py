@@ -0,0 +1,95 @@
+import asyncio
+import hashlib
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from app.api import documents as documents_api
+from app.schemas.document import FinalizeUploadRequest
+from app.services.security import create_upload_token
+
+STORED = b"uploaded sheet"
+STORED_HASH = hashlib.sha256(STORED).hexdigest()
+OTHER_HASH = hashlib.sha256(b"someone else's sheet").hexdigest()
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.deleted: list[str] = []
+
+    async def head_object(self, key: str) -> dict:
+        return {"ContentLength": len(STORED)}
+
+    async def sha256_object(self, key: str) -> str:
+        return STORED_HASH
+
+    async def delete_objects(self, keys: list[str]) -> None:
+        self.deleted.extend(keys)
+
+
+class FakeSession:
+    """Answers the hash lookup from ``documents``, a hash -> Document map."""
+
+    def __init__(self, documents: dict) -> None:
+        self.documents = documents
+
+    async def get(self, model, ident):
+        return None
+
+    async def execute(self, query):
+        file_hash = query.whereclause.right.value
+        return SimpleNamespace(scalar_one_or_none=lambda: self.documents.get(file_hash))
+
+
+@pytest.fixture
+def storage(monkeypatch) -> FakeStorage:
+    fake = FakeStorage()
+    monkeypatch.setattr(documents_api, "async_storage_client", fake)
+    return fake
+
+
+def _finalize(sha256: str | None, documents: dict, token_user_id: str | None = None):
+    user = SimpleNamespace(id=uuid.uuid4())
+    document_id = uuid.uuid4()
+    upload_token = create_upload_token(
+        token_user_id or str(user.id), documents_api._direct_upload_key(document_id), 60
+    )
+    payload = FinalizeUploadRequest(upload_token=upload_token, sha256=sha256)
+    return asyncio.run(
+        documents_api.finalize_upload(document_id, payload, FakeSession(documents), user)
+    )
+
+
+def test_finalize_rejects_token_issued_to_another_user(storage) -> None:
+    with pytest.raises(HTTPException) as excinfo:
+        _finalize(STORED_HASH, {}, token_user_id=str(uuid.uuid4()))
+
+    assert excinfo.value.status_code == 403
+    assert storage.deleted == []
+
+
+def test_finalize_rejects_client_hash_that_does_not_match_object(storage) -> None:
+    existing = SimpleNamespace(id=uuid.uuid4())
+
+    with pytest.raises(HTTPException) as excinfo:
+        _finalize(OTHER_HASH, {OTHER_HASH: existing})
+
+    assert excinfo.value.status_code == 400
+    assert storage.deleted == []
+
+
+def test_finalize_dedupes_on_the_stored_object_hash(storage) -> None:
+    existing = SimpleNamespace(id=uuid.uuid4())
+
+    response = _finalize(STORED_HASH.upper(), {STORED_HASH: existing})
+
+    assert response.status == "duplicate"
+    assert response.existing_id == existing.id
+    assert len(storage.deleted) == 1
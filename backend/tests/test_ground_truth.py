@@ -24,7 +24,15 @@ IMAGES_DIR = ROOT / "example_images"
 
 sys.path.insert(0, str(ROOT / "backend"))
 
-from worker.ocr import decode_image, detect_rois, extract_header, extract_sheet
+from worker.ocr import (
+    decode_image,
+    detect_rois,
+    extract_header,
+    extract_sheet,
+    run_vl_ocr_stacked,
+)
+from worker.ocr.image_utils import crop_image
+from worker.ocr.preprocessing import PREPROCESS_PROFILES, preprocess_auction_image
 from worker.ocr.parsing import (
     build_record_fields,
     merge_fields,
@@ -82,13 +90,23 @@ def _load_rows() -> list[dict[str, str]]:
         return [dict(row) for row in reader]
 
 
-def _build_record(image_path: Path) -> dict:
+def _build_record(
+    image_path: Path, vl_mode: str = "split", profile: str | None = None
+) -> dict:
     from worker.ocr.parsing import _extract_header_by_patterns, ParsedField
 
     image = decode_image(image_path.read_bytes())
+    if profile is not None:
+        # Mirror the worker: preprocess the whole image once, then OCR its crops.
+        image = preprocess_auction_image(image, profile=profile)
     rois = detect_rois(image)
-    header = extract_header(image, rois.header_bbox)
-    sheet = extract_sheet(image, rois.sheet_bbox)
+    header_vl = sheet_vl = None
+    if vl_mode == "stacked":
+        header_vl, sheet_vl = run_vl_ocr_stacked(
+            [crop_image(image, rois.header_bbox), crop_image(image, rois.sheet_bbox)]
+        )
+    header = extract_header(image, rois.header_bbox, vl_result=header_vl)
+    sheet = extract_sheet(image, rois.sheet_bbox, vl_result=sheet_vl)
 
     # Collect all tokens from both primary and fallback
     all_tokens = list(header.primary.tokens)
@@ -161,8 +179,12 @@ def test_ground_truth_row(row: dict[str, str]) -> None:
     image_path = IMAGES_DIR / filename
     assert image_path.exists(), f"Missing image: {image_path}"
 
-    record = _build_record(image_path)
+    mismatches = _mismatches(row, _build_record(image_path))
+    if mismatches:
+        pytest.fail("\n".join(mismatches))
+
 
+def _mismatches(row: dict[str, str], record: dict) -> list[str]:
     mismatches: list[str] = []
 
     expected_date = _parse_date(row.get("auction_date"))
@@ -276,5 +298,85 @@ def test_ground_truth_row(row: dict[str, str]) -> None:
             f"notes_text expected {row.get('notes_text')} got {record.get('notes_text')}"
         )
 
-    if mismatches:
-        pytest.fail("\n".join(mismatches))
+    return mismatches
+
+
+@pytest.mark.parametrize("row", _load_rows(), ids=lambda row: row.get("filename", ""))
+def test_stacked_vl_matches_split(row: dict[str, str]) -> None:
+    """OCR_VL_MODE=stacked must produce the same record fields as split mode."""
+    image_path = IMAGES_DIR / row["filename"]
+    split_record = _build_record(image_path, vl_mode="split")
+    stacked_record = _build_record(image_path, vl_mode="stacked")
+
+    differences = [
+        f"{key}: split={split_record.get(key)!r} stacked={stacked_record.get(key)!r}"
+        for key in sorted(set(split_record) | set(stacked_record))
+        if split_record.get(key) != stacked_record.get(key)
+    ]
+    if differences:
+        pytest.fail("\n".join(differences))
+
+
+GROUND_TRUTH_FIELDS = (
+    "auction_date",
+    "auction_venue",
+    "auction_venue_round",
+    "lot_no",
+    "model_year_reiwa",
+    "make_model",
+    "grade",
+    "shift",
+    "engine_cc",
+    "mileage_km",
+    "inspection",
+    "color",
+    "model_code",
+    "result",
+    "final_bid_yen",
+    "starting_bid_yen",
+    "score",
+    "chassis_no",
+    "notes_text",
+)
+
+
+def _mismatched_fields(row: dict[str, str], record: dict) -> set[str]:
+    return {mismatch.split(" ", 1)[0] for mismatch in _mismatches(row, record)}
+
+
+@pytest.mark.parametrize("profile", [p for p in PREPROCESS_PROFILES if p != "full"])
+@pytest.mark.parametrize("row", _load_rows(), ids=lambda row: row.get("filename", ""))
+def test_preprocess_profile_matches_full(row: dict[str, str], profile: str) -> None:
+    """A lighter profile must not lose any ground-truth field that ``full`` reads correctly.
+
+    Run this before adding a profile to ``PREPROCESS_AUTO_PROFILES``.
+    """
+    image_path = IMAGES_DIR / row["filename"]
+    full_misses = _mismatched_fields(row, _build_record(image_path, profile="full"))
+    profile_record = _build_record(image_path, profile=profile)
+
+    regressions = [
+        mismatch
+        for mismatch in _mismatches(row, profile_record)
+        if mismatch.split(" ", 1)[0] not in full_misses
+    ]
+    if regressions:
+        pytest.fail("\n".join(regressions))
+
+
+def test_preprocess_profile_accuracy() -> None:
+    """Report field accuracy per preprocessing profile (run with ``-s`` to see the table)."""
+    rows = _load_rows()
+    accuracy: dict[str, float] = {}
+    for profile in PREPROCESS_PROFILES:
+        checked = failed = 0
+        for row in rows:
+            record = _build_record(IMAGES_DIR / row["filename"], profile=profile)
+            checked += sum(1 for field in GROUND_TRUTH_FIELDS if row.get(field))
+            failed += len(_mismatches(row, record))
+        accuracy[profile] = 1.0 - failed / checked if checked else 0.0
+
+    print()
+    for profile, value in accuracy.items():
+        print(f"preprocess profile {profile:<5} field accuracy {value:.1%}")
+    assert all(0.0 <= value <= 1.0 for value in accuracy.values())
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+from typing import get_args
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from app.config import PreprocessedFormat, Settings
+from worker.ocr.intermediate import (
+    INTERMEDIATE_FORMATS,
+    decode_intermediate,
+    encode_intermediate,
+    intermediate_key,
+)
+
+
+def _image() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(37, 53, 3), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("fmt", INTERMEDIATE_FORMATS)
+def test_intermediate_round_trip_is_lossless(fmt: str) -> None:
+    image = _image()
+
+    decoded = decode_intermediate(encode_intermediate(image, fmt), fmt)
+
+    assert decoded.shape == image.shape
+    assert np.array_equal(decoded, image)
+
+
+def test_missing_format_decodes_as_png() -> None:
+    image = _image()
+
+    payload = encode_intermediate(image, "png", png_level=9)
+
+    assert np.array_equal(decode_intermediate(payload), image)
+
+
+def test_intermediate_key_uses_format_extension() -> None:
+    assert intermediate_key("preprocessed", "abc", "raw-lz4") == "preprocessed/abc.npr.lz4"
+    with pytest.raises(ValueError):
+        intermediate_key("preprocessed", "abc", "bmp")
+
+
+def test_preprocessed_format_setting_rejects_unknown_formats() -> None:
+    assert Settings(PREPROCESSED_FORMAT="raw-lz4").PREPROCESSED_FORMAT == "raw-lz4"
+    with pytest.raises(ValidationError):
+        Settings(PREPROCESSED_FORMAT="raw_lz4")
+
+
+def test_preprocessed_format_setting_matches_intermediate_formats() -> None:
+    assert get_args(PreprocessedFormat) == INTERMEDIATE_FORMATS
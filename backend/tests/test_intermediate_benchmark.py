@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+if not RUN_BENCHMARKS:
+    pytest.skip("Set RUN_BENCHMARKS=1 to run format benchmarks.", allow_module_level=True)
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+import numpy as np
+
+from worker.ocr import decode_image
+from worker.ocr.intermediate import INTERMEDIATE_FORMATS, decode_intermediate, encode_intermediate
+from worker.ocr.preprocessing import preprocess_auction_image
+
+IMAGES_DIR = ROOT / "example_images"
+ROUNDS = int(os.getenv("INTERMEDIATE_BENCH_ROUNDS", "3"))
+# (format, png_level) pairs; png levels besides the OpenCV default are listed explicitly.
+VARIANTS = [(fmt, None) for fmt in INTERMEDIATE_FORMATS] + [("png", 0), ("png", 1), ("png", 6)]
+
+
+def _pages() -> list[np.ndarray]:
+    paths = sorted(IMAGES_DIR.glob("*.jpeg"))[: int(os.getenv("INTERMEDIATE_BENCH_PAGES", "3"))]
+    return [
+        preprocess_auction_image(decode_image(path.read_bytes()), profile="fast") for path in paths
+    ]
+
+
+def _timed(fn) -> tuple[float, object]:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        result = fn()
+    return (time.perf_counter() - started) / ROUNDS, result
+
+
+def test_intermediate_format_costs() -> None:
+    pages = _pages()
+    assert pages, "No example images to benchmark"
+
+    print(f"\n{'format':<12}{'encode ms':>11}{'decode ms':>11}{'size KiB':>11}")
+    for fmt, level in VARIANTS:
+        encode_s = decode_s = size = 0.0
+        for page in pages:
+            seconds, payload = _timed(lambda: encode_intermediate(page, fmt, png_level=level))
+            encode_s += seconds
+            seconds, decoded = _timed(lambda: decode_intermediate(payload, fmt))
+            decode_s += seconds
+            size += len(payload)
+            assert np.array_equal(decoded, page)
+        label = fmt if level is None else f"{fmt}-{level}"
+        count = len(pages)
+        print(
+            f"{label:<12}{encode_s / count * 1e3:>11.1f}{decode_s / count * 1e3:>11.1f}"
+            f"{size / count / 1024:>11.0f}"
+        )
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.market_stats import mileage_adjusted_median, mileage_trend, stats_query
+
+
+def _compiled(query):
+    return query.compile(dialect=postgresql.dialect())
+
+
+@pytest.mark.parametrize(
+    ("filters", "group_by", "level"),
+    [
+        ({}, (), 7),
+        ({"grade": "GR"}, (), 3),
+        ({"grade": None}, ("model_year_gregorian",), 5),
+        ({"model_year_gregorian": 2022}, ("score_numeric",), 4),
+        ({}, ("grade", "model_year_gregorian", "score_numeric"), 0),
+    ],
+)
+def test_stats_query_picks_rollup_level(filters, group_by, level) -> None:
+    compiled = _compiled(stats_query("NX", filters=filters, group_by=group_by))
+
+    assert compiled.params["grouping_level_1"] == level
+    assert compiled.params["make_model_1"] == "NX"
+    assert "FROM market_price_stats" in str(compiled)
+
+
+def test_stats_query_rejects_unknown_dimension() -> None:
+    with pytest.raises(ValueError):
+        stats_query("NX", group_by=("color",))
+
+
+def test_mileage_adjustment_needs_enough_samples() -> None:
+    row = SimpleNamespace(
+        yen_per_km=-20.0, mileage_samples=12, median_yen=5_000_000, avg_mileage_km=30_000
+    )
+
+    assert mileage_trend(row) == -200_000
+    assert mileage_adjusted_median(row, 50_000) == 4_600_000
+    row.mileage_samples = 2
+    assert mileage_adjusted_median(row, 50_000) is None
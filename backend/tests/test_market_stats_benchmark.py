@@ -0,0 +1,136 @@
+import importlib.util
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+if not RUN_BENCHMARKS:
+    pytest.skip("Set RUN_BENCHMARKS=1 to run market stats benchmarks.", allow_module_level=True)
+
+# A scratch Postgres database (sync SQLAlchemy URL); the benchmark works in its own schema.
+DSN = os.getenv("MARKET_STATS_BENCH_DSN")
+if not DSN:
+    pytest.skip("Set MARKET_STATS_BENCH_DSN to a scratch database.", allow_module_level=True)
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import create_engine, text
+
+from app.services.market_stats import REFRESH_SQL, stats_query
+
+ROWS = int(os.getenv("MARKET_STATS_BENCH_ROWS", "5000000"))
+ROUNDS = int(os.getenv("MARKET_STATS_BENCH_ROUNDS", "20"))
+SCHEMA = "market_bench"
+MIGRATION = ROOT / "backend" / "migrations" / "versions" / "0007_market_price_stats.py"
+
+# 200 models x 5 grades x 15 years x 5 scores; price falls with mileage plus noise.
+SEED_SQL = """
+INSERT INTO auction_records (
+    make_model, grade, model_year_gregorian, score_numeric, mileage_km, final_bid_yen, auction_date
+)
+SELECT
+    'model-' || (i % 200),
+    'grade-' || (i / 200 % 5),
+    2010 + (i / 1000 % 15),
+    3.0 + (i / 15000 % 5) * 0.5,
+    mileage,
+    greatest(100000, 1000000 + (i % 200) * 25000 - mileage * 20 + (random() * 400000)::int),
+    DATE '2020-01-01' + (i % 1500)
+FROM generate_series(1, :rows) AS i,
+     LATERAL (SELECT (random() * 150000)::int + i * 0 AS mileage) AS m
+"""
+
+ADHOC_SQL = """
+SELECT model_year_gregorian, count(*),
+       percentile_cont(0.5) WITHIN GROUP (ORDER BY final_bid_yen),
+       percentile_cont(0.1) WITHIN GROUP (ORDER BY final_bid_yen),
+       percentile_cont(0.9) WITHIN GROUP (ORDER BY final_bid_yen),
+       regr_slope(final_bid_yen, mileage_km)
+FROM auction_records
+WHERE make_model = :make_model AND final_bid_yen IS NOT NULL
+GROUP BY model_year_gregorian
+"""
+
+
+def _run_migration(conn) -> None:
+    spec = importlib.util.spec_from_file_location("market_price_stats_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with Operations.context(MigrationContext.configure(conn)):
+        module.upgrade()
+
+
+def _median_ms(conn, statement, params=None) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        conn.execute(statement, params or {}).all()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1e3
+
+
+@pytest.fixture(scope="module")
+def conn():
+    engine = create_engine(DSN)
+    with engine.connect() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        connection.execute(text(f"SET search_path TO {SCHEMA}"))
+        connection.execute(
+            text(
+                """
+                CREATE TABLE auction_records (
+                    id bigserial PRIMARY KEY,
+                    make_model varchar(255),
+                    grade varchar(255),
+                    model_year_gregorian integer,
+                    score_numeric numeric(3, 1),
+                    mileage_km integer,
+                    final_bid_yen integer,
+                    auction_date date
+                )
+                """
+            )
+        )
+        started = time.perf_counter()
+        connection.execute(text(SEED_SQL), {"rows": ROWS})
+        connection.execute(text("CREATE INDEX ON auction_records (make_model)"))
+        connection.execute(text("ANALYZE auction_records"))
+        connection.commit()
+        print(f"\nseeded {ROWS} rows in {time.perf_counter() - started:.1f} s")
+        yield connection
+        connection.rollback()
+        connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        connection.commit()
+    engine.dispose()
+
+
+def test_market_stats_view_vs_adhoc(conn) -> None:
+    started = time.perf_counter()
+    _run_migration(conn)
+    conn.commit()
+    print(f"built market_price_stats in {time.perf_counter() - started:.1f} s")
+
+    groups = conn.execute(text("SELECT count(*) FROM market_price_stats")).scalar_one()
+    adhoc_ms = _median_ms(conn, text(ADHOC_SQL), {"make_model": "model-42"})
+    view_ms = _median_ms(conn, stats_query("model-42", group_by=("model_year_gregorian",)))
+    print(f"{groups} stats rows; one model by year:")
+    print(f"ad-hoc {adhoc_ms:.1f} ms, market_price_stats {view_ms:.2f} ms")
+
+    conn.execute(
+        text("UPDATE auction_records SET final_bid_yen = final_bid_yen + 1000 WHERE id % 100 = 0")
+    )
+    conn.commit()
+    started = time.perf_counter()
+    conn.execute(REFRESH_SQL)
+    conn.commit()
+    print(f"REFRESH CONCURRENTLY after touching 1% of rows: {time.perf_counter() - started:.1f} s")
+    assert view_ms < adhoc_ms
@@ -0,0 +1,101 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from worker.ocr.model_server import BatchCoalescer
+
+
+class FakePredict:
+    """Echoes each image's marker value and records every model call."""
+
+    def __init__(self, fail_key: str | None = None) -> None:
+        self.fail_key = fail_key
+        self.calls: list[tuple[str, list[int]]] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, images: list[np.ndarray], key: str) -> list[dict]:
+        markers = [int(image[0, 0]) for image in images]
+        with self.lock:
+            self.calls.append((key, markers))
+        if key == self.fail_key:
+            raise RuntimeError(f"{key} model failed")
+        return [{"marker": marker, "key": key} for marker in markers]
+
+
+def _images(*markers: int) -> list[np.ndarray]:
+    return [np.full((2, 2), marker, dtype=np.uint8) for marker in markers]
+
+
+def _submit_all(coalescer: BatchCoalescer, requests: list[tuple[list[int], str]]) -> list:
+    """Submit every request from its own thread; returns results or raised errors in order."""
+
+    def call(request):
+        markers, key = request
+        try:
+            return coalescer.submit(_images(*markers), key)
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+        return list(pool.map(call, requests))
+
+
+def test_coalescer_batches_by_key_and_pairs_results_with_requests() -> None:
+    predict = FakePredict()
+    # The batch closes once all four images are queued, well before max_wait.
+    coalescer = BatchCoalescer(predict, max_batch=4, max_wait_ms=5000)
+
+    outcomes = _submit_all(coalescer, [([1, 2], "japan"), ([3], "en"), ([4], "japan")])
+
+    assert [[result["marker"] for result in outcome] for outcome in outcomes] == [[1, 2], [3], [4]]
+    assert [{result["key"] for result in outcome} for outcome in outcomes] == [
+        {"japan"},
+        {"en"},
+        {"japan"},
+    ]
+    assert sorted((key, sorted(markers)) for key, markers in predict.calls) == [
+        ("en", [3]),
+        ("japan", [1, 2, 4]),
+    ]
+
+
+def test_coalescer_raises_model_errors_in_every_waiting_caller() -> None:
+    predict = FakePredict(fail_key="en")
+    coalescer = BatchCoalescer(predict, max_batch=3, max_wait_ms=5000)
+
+    outcomes = _submit_all(coalescer, [([1], "en"), ([2], "japan"), ([3], "en")])
+
+    assert isinstance(outcomes[0], RuntimeError)
+    assert outcomes[2] is outcomes[0]
+    assert outcomes[1] == [{"marker": 2, "key": "japan"}]
+    assert sorted(key for key, _ in predict.calls) == ["en", "japan"]
+
+    # The worker thread survives the failure and serves later requests.
+    predict.fail_key = None
+    assert [result["marker"] for result in coalescer.submit(_images(5, 6, 7), "en")] == [5, 6, 7]
+
+
+def test_coalescer_stops_waiting_after_max_wait() -> None:
+    predict = FakePredict()
+    coalescer = BatchCoalescer(predict, max_batch=8, max_wait_ms=10)
+
+    assert coalescer.submit(_images(7), "japan") == [{"marker": 7, "key": "japan"}]
+    assert predict.calls == [("japan", [7])]
+
+
+@pytest.mark.parametrize("max_batch", [0, -3])
+def test_coalescer_runs_single_requests_when_max_batch_is_not_positive(max_batch: int) -> None:
+    predict = FakePredict()
+    coalescer = BatchCoalescer(predict, max_batch=max_batch, max_wait_ms=5000)
+
+    assert coalescer.submit(_images(1, 2), "japan") == [
+        {"marker": 1, "key": "japan"},
+        {"marker": 2, "key": "japan"},
+    ]
@@ -0,0 +1,98 @@
+import importlib
+import sys
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+# worker.tasks re-exports the tasks under their module names.
+extract_module = importlib.import_module("worker.tasks.extract")
+ocr_module = importlib.import_module("worker.tasks.ocr")
+
+
+class FakeQuery:
+    def __init__(self, docs: list) -> None:
+        self.docs = docs
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    order_by = limit = with_for_update = filter
+
+    def all(self) -> list:
+        return self.docs
+
+
+class FakeSession:
+    def __init__(self, docs: list) -> None:
+        self.docs = docs
+        self.committed: list[list[str]] = []
+
+    def query(self, model):
+        return FakeQuery(self.docs)
+
+    def commit(self) -> None:
+        self.committed.append([doc.status for doc in self.docs])
+
+
+def _doc() -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), status="ocr_queued", model_version=None, retry_count=0)
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    docs = [_doc() for _ in range(4)]
+    session = FakeSession(docs)
+    calls = {"extract": [], "ocr_batch": 0}
+
+    @contextmanager
+    def get_session():
+        yield session
+
+    def extract_header(image, bbox, **kwargs):
+        # The soft limit fires while the third document is being parsed.
+        if image is docs[2]:
+            raise SoftTimeLimitExceeded()
+        return SimpleNamespace(primary=SimpleNamespace(engine="vl"))
+
+    def load_preprocessed(doc):
+        if doc is docs[1]:
+            raise ValueError("corrupt image")
+        return doc
+
+    monkeypatch.setattr(ocr_module.settings, "OCR_BATCH_SIZE", 4)
+    monkeypatch.setattr(ocr_module, "get_session", get_session)
+    monkeypatch.setattr(ocr_module, "_load_preprocessed", load_preprocessed)
+    monkeypatch.setattr(ocr_module, "_resolve_rois", lambda doc, image: ((0, 0, 1, 1),) * 2)
+    monkeypatch.setattr(ocr_module, "crop_image", lambda image, bbox: image)
+    monkeypatch.setattr(ocr_module, "run_vl_for_rois", lambda pairs: [(None, None) for _ in pairs])
+    monkeypatch.setattr(ocr_module, "extract_header", extract_header)
+    monkeypatch.setattr(ocr_module, "extract_sheet", lambda image, bbox, **kwargs: None)
+    monkeypatch.setattr(ocr_module, "build_ocr_results", lambda *args: {})
+    monkeypatch.setattr(ocr_module, "_store_ocr_results", lambda document_id, results: None)
+    monkeypatch.setattr(ocr_module.ocr, "apply_async", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        ocr_module.ocr_batch,
+        "delay",
+        lambda: calls.__setitem__("ocr_batch", calls["ocr_batch"] + 1),
+    )
+    monkeypatch.setattr(extract_module.extract, "delay", calls["extract"].append)
+    return docs, session, calls
+
+
+def test_ocr_batch_releases_unfinished_documents_on_soft_time_limit(batch) -> None:
+    docs, session, calls = batch
+
+    with pytest.raises(SoftTimeLimitExceeded):
+        ocr_module.ocr_batch.run()
+
+    assert [doc.status for doc in docs] == ["ocr", "failed", "ocr_queued", "ocr_queued"]
+    assert session.committed[-1] == ["ocr", "failed", "ocr_queued", "ocr_queued"]
+    assert calls["extract"] == [str(docs[0].id)]
+    assert calls["ocr_batch"] == 1
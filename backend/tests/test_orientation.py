@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from worker.ocr.orientation import (
+    VERTICAL_TEXT_MARGIN,
+    _profile_scores,
+    _thumbnail_mask,
+    rank_rotations,
+)
+
+
+def _text_page() -> np.ndarray:
+    """Horizontal lines of word-sized ink blocks on a white page."""
+    rng = np.random.default_rng(0)
+    image = np.full((800, 600, 3), 255, dtype=np.uint8)
+    for y in range(60, 760, 40):
+        x = 40
+        while x < 540:
+            width = int(rng.integers(30, 120))
+            cv2.rectangle(image, (x, y), (min(x + width, 560), y + 14), (0, 0, 0), -1)
+            x += width + int(rng.integers(12, 30))
+    return image
+
+
+def _grid_page() -> np.ndarray:
+    """An empty 8x8 table whose column profile is slightly sharper than its row profile."""
+    image = np.full((800, 600, 3), 255, dtype=np.uint8)
+    for x in np.linspace(20, 580, 8).astype(int):
+        cv2.line(image, (int(x), 20), (int(x), 780), (0, 0, 0), 3)
+    for y in np.linspace(20, 780, 8).astype(int):
+        cv2.line(image, (20, int(y)), (580, int(y)), (0, 0, 0), 3)
+    return image
+
+
+def test_upright_text_ranks_no_rotation_first() -> None:
+    assert rank_rotations(_text_page()) == [0, 180, 90, 270]
+
+
+@pytest.mark.parametrize("rotate", [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE])
+def test_sideways_text_ranks_a_quarter_turn_first(rotate: int) -> None:
+    assert rank_rotations(cv2.rotate(_text_page(), rotate)) == [90, 270, 0, 180]
+
+
+def test_column_profile_within_margin_keeps_upright_order() -> None:
+    image = _grid_page()
+    row_score, col_score = _profile_scores(_thumbnail_mask(image))
+
+    assert row_score < col_score < row_score * VERTICAL_TEXT_MARGIN
+    assert rank_rotations(image) == [0, 180, 90, 270]
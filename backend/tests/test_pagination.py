@@ -0,0 +1,83 @@
+import asyncio
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.deps import PageParams
+from app.models.document import Document
+from app.services.pagination import decode_cursor, encode_cursor, paginate
+
+
+class FakeSession:
+    """Records the executed query and returns ``rows`` for it."""
+
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.queries: list = []
+
+    async def execute(self, query):
+        self.queries.append(query)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: self.rows))
+
+
+def _compile(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip_keeps_microseconds_and_timezone() -> None:
+    created_at = datetime(2026, 3, 1, 9, 30, 15, 123456, tzinfo=timezone(timedelta(hours=9)))
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+    assert decode_cursor(encode_cursor(created_at, row_id))[0].utcoffset() == timedelta(hours=9)
+
+
+def test_bad_cursor_is_a_400() -> None:
+    with pytest.raises(HTTPException) as excinfo:
+        PageParams(cursor="not-a-cursor")
+
+    assert excinfo.value.status_code == 400
+
+
+def test_keyset_page_reads_one_row_past_the_page() -> None:
+    now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    rows = [
+        SimpleNamespace(created_at=now - timedelta(seconds=i), id=uuid.uuid4()) for i in range(3)
+    ]
+    session = FakeSession(rows)
+    after = (now, uuid.uuid4())
+
+    page = asyncio.run(
+        paginate(session, select(Document), Document, per_page=2, after=after, include_total=False)
+    )
+
+    compiled = session.queries[0].compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert "(documents.created_at, documents.id) < (" in sql
+    assert "OFFSET" not in sql
+    assert "ORDER BY documents.created_at DESC, documents.id DESC" in sql
+    assert 3 in compiled.params.values()
+    assert page.items == rows[:2]
+    assert decode_cursor(page.next_cursor) == (rows[1].created_at, rows[1].id)
+
+
+def test_last_page_has_no_next_cursor() -> None:
+    session = FakeSession([SimpleNamespace(created_at=datetime.now(timezone.utc), id=uuid.uuid4())])
+
+    page = asyncio.run(
+        paginate(session, select(Document), Document, per_page=2, include_total=False)
+    )
+
+    assert page.next_cursor is None
+    assert "OFFSET" in _compile(session.queries[0])
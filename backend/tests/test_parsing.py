@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from worker.ocr.image_utils import OCRToken
+from worker.ocr.parsing import RowIndex, find_value_for_label, group_tokens_by_row, parse_header
+
+
+def _token(text: str, x: int, y: int, w: int = 60, h: int = 20) -> OCRToken:
+    return OCRToken(text=text, confidence=0.9, bbox=(x, y, x + w, y + h))
+
+
+def test_group_tokens_by_row_uses_running_centroid() -> None:
+    tokens = [
+        _token("b", 100, 2),
+        _token("a", 0, 0),
+        _token("c", 200, 6),
+        _token("next", 0, 40),
+    ]
+
+    rows = group_tokens_by_row(tokens)
+
+    assert [[t.text for t in row] for row in rows] == [["a", "b", "c"], ["next"]]
+
+
+def test_group_tokens_by_row_empty() -> None:
+    assert group_tokens_by_row([]) == []
+
+
+def test_row_index_sorts_rows_left_to_right() -> None:
+    index = RowIndex([_token("右", 200, 0), _token("左", 0, 1), _token("下", 0, 50)])
+
+    assert [[t.text for t in row] for row in index.rows] == [["左", "右"], ["下"]]
+    assert index.normalized == [["左", "右"], ["下"]]
+
+
+def test_find_value_for_label_accepts_tokens_or_index() -> None:
+    tokens = [_token("出品番号", 0, 0), _token("12345", 100, 0), _token("評価点", 0, 40)]
+
+    from_tokens = find_value_for_label(tokens, [r"出品番号"])
+    from_index = find_value_for_label(RowIndex(tokens), [r"出品番号"])
+
+    assert from_tokens is not None and from_tokens.value == "12345"
+    assert from_index == from_tokens
+
+
+def test_parse_header_reads_inline_and_adjacent_values() -> None:
+    tokens = [
+        _token("出品番号", 0, 0),
+        _token("12345", 100, 0),
+        _token("評価点4.5", 0, 40),
+    ]
+
+    fields = parse_header(tokens)
+
+    assert fields["lot_no"].value == "12345"
+    assert fields["score"].value == "4.5"
@@ -0,0 +1,120 @@
+import csv
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+if not RUN_BENCHMARKS:
+    pytest.skip("Set RUN_BENCHMARKS=1 to run parsing benchmarks.", allow_module_level=True)
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from worker.ocr.image_utils import OCRToken
+from worker.ocr.parsing import (
+    build_record_fields,
+    merge_fields,
+    parse_header,
+    parse_header_tokens_vl,
+    parse_primary_header,
+    parse_sheet,
+)
+
+CSV_PATH = ROOT / "example_images" / "ground_truth.csv"
+# Optional directory of ocr_raw/<id>.json dumps copied from storage.
+DUMPS_DIR = os.getenv("PARSING_BENCH_DIR")
+ROUNDS = int(os.getenv("PARSING_BENCH_ROUNDS", "50"))
+
+
+def _tokens(payload: list[dict]) -> list[OCRToken]:
+    return [
+        OCRToken(
+            text=token["text"],
+            confidence=float(token.get("confidence", 0.0)),
+            bbox=tuple(token.get("bbox", [0, 0, 0, 0])),
+        )
+        for token in payload
+    ]
+
+
+def _row_tokens(rows: list[list[str]], x0: int = 0, y0: int = 0) -> list[dict]:
+    payload = []
+    for row_idx, row in enumerate(rows):
+        x = x0
+        y = y0 + row_idx * 28
+        for text in row:
+            width = 14 * max(len(text), 1)
+            payload.append({"text": text, "confidence": 0.9, "bbox": [x, y, x + width, y + 22]})
+            x += width + 12
+    return payload
+
+
+def _dump_from_row(row: dict[str, str]) -> dict:
+    """Build an ocr_raw-shaped dump laid out like the VL output for a ground-truth row."""
+    header_rows = [
+        [f"開催日 {row['auction_date'].replace('-', '/')}", f"会場 {row['auction_venue']}"],
+        [f"開催回 {row['auction_venue_round']}", f"出品番号 {row['lot_no']}"],
+        [f"車種名/グレード {row['make_model']} {row['grade']}"],
+        [f"年式 {row['model_year_reiwa']}", f"シフト/排気量 {row['shift']} {row['engine_cc']}"],
+        [f"走行/車検 {row['mileage_km']} {row['inspection']}", f"色 {row['color']}"],
+        [f"型式 {row['model_code']} AAC ナビ", f"セリ結果 {row['result']}"],
+        [f"応札額/スタート金額 {row['final_bid_yen']} {row['starting_bid_yen']}"],
+        [f"評価点 {row['score']}"],
+    ]
+    sheet_rows = [
+        ["輸入車", "評価点", row["score"]],
+        ["車台番号", row["chassis_no"]],
+        ["走行", f"{row['mileage_km']}km", "車検", row["inspection"]],
+        ["検査員報告", "小キズ", "A1", "U2"],
+        ["注意事項", row["notes_text"] or "なし"],
+        ["装備", "AAC", "ナビ", "SR", "AW"],
+        ["リサイクル", "12,340円"],
+    ]
+    return {
+        "header": {"tokens": _row_tokens(header_rows), "table_cells": None, "table_cell_count": 0},
+        "sheet": {"tokens": _row_tokens(sheet_rows, y0=300)},
+    }
+
+
+def _load_dumps() -> list[dict]:
+    if DUMPS_DIR:
+        paths = sorted(Path(DUMPS_DIR).glob("*.json"))
+        return [json.loads(path.read_text("utf-8")) for path in paths]
+    with CSV_PATH.open("r", encoding="utf-8") as f:
+        return [_dump_from_row(row) for row in csv.DictReader(f)]
+
+
+def _parse_dump(dump: dict) -> dict:
+    header = dump.get("header", {})
+    header_tokens = _tokens(header.get("tokens", []))
+    fallback_tokens = _tokens(header.get("fallback", {}).get("tokens", []))
+    header_fields = parse_primary_header(
+        header_tokens, header.get("table_cells") or {}, int(header.get("table_cell_count") or 0)
+    )
+    header_fields = merge_fields(header_fields, parse_header_tokens_vl(header_tokens))
+    if fallback_tokens:
+        header_fields = merge_fields(header_fields, parse_header(fallback_tokens))
+    sheet_fields = parse_sheet(_tokens(dump.get("sheet", {}).get("tokens", [])))
+    return build_record_fields(header_fields, sheet_fields)
+
+
+def test_parse_throughput() -> None:
+    dumps = _load_dumps()
+    assert dumps, "No token dumps to benchmark"
+
+    for dump in dumps:
+        _parse_dump(dump)
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for dump in dumps:
+            _parse_dump(dump)
+    elapsed = time.perf_counter() - started
+
+    per_document_us = elapsed / (ROUNDS * len(dumps)) * 1e6
+    print(f"\nparsed {len(dumps)} dumps x {ROUNDS} rounds: {per_document_us:.0f} us/document")
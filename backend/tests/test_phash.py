@@ -0,0 +1,165 @@
+import importlib
+import itertools
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import cv2
+from sqlalchemy.dialects import postgresql
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from app.config import settings
+from app.models.document import Document
+from worker.ocr.image_utils import hamming_distance, perceptual_hash, phash_bands
+
+# worker.tasks re-exports the preprocess task under the module's name.
+preprocess_module = importlib.import_module("worker.tasks.preprocess")
+
+IMAGES = sorted((ROOT / "example_images").glob("*.jpeg"))
+
+
+def _forwarded(image, scale: float = 0.75, quality: int = 70):
+    height, width = image.shape[:2]
+    size = (int(width * scale), int(height * scale))
+    small = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    _, encoded = cv2.imencode(".jpg", small, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+
+
+def test_recompressed_sheets_are_near_duplicates() -> None:
+    for path in IMAGES:
+        image = cv2.imread(str(path))
+        twice = _forwarded(_forwarded(image))
+        distance = hamming_distance(perceptual_hash(image), perceptual_hash(twice))
+        assert distance <= settings.NEAR_DUPLICATE_MAX_DISTANCE, path.name
+
+
+def test_different_sheets_are_not_near_duplicates() -> None:
+    hashes = [perceptual_hash(cv2.imread(str(path))) for path in IMAGES]
+    for first, second in itertools.combinations(hashes, 2):
+        assert hamming_distance(first, second) > 2 * settings.NEAR_DUPLICATE_MAX_DISTANCE
+
+
+def test_close_hashes_share_a_band() -> None:
+    phash = perceptual_hash(cv2.imread(str(IMAGES[0])))
+    value = int(phash, 16)
+    # Flip 15 bits, one in each of the first 15 bands: only the last band still matches.
+    flipped = value
+    for band in range(15):
+        flipped ^= 1 << (band * 16 + 3)
+    other = f"{flipped:064x}"
+
+    assert hamming_distance(phash, other) == 15
+    assert len(set(phash_bands(phash)) & set(phash_bands(other))) == 1
+    assert len(phash_bands(phash)) == 16
+    assert all(0 <= key < 2**31 for key in phash_bands(phash))
+
+
+def _flip(phash: str, bits: int) -> str:
+    value = int(phash, 16)
+    for bit in range(bits):
+        value ^= 1 << (bit * 16 + 5)
+    return f"{value:064x}"
+
+
+def _document(phash: str) -> Document:
+    return Document(
+        id=uuid.uuid4(),
+        phash=phash,
+        phash_bands=phash_bands(phash),
+        created_at=datetime(2026, 1, 25, 15, 33, tzinfo=timezone.utc),
+    )
+
+
+class FakeSession:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.statements: list = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+def test_near_duplicate_candidates_are_earlier_columns_only() -> None:
+    doc = _document(perceptual_hash(cv2.imread(str(IMAGES[0]))))
+    compiled = preprocess_module.near_duplicate_candidates(doc).compile(
+        dialect=postgresql.dialect()
+    )
+    sql = str(compiled)
+
+    assert sql.startswith(
+        "SELECT documents.id, documents.phash, documents.created_at \nFROM documents"
+    )
+    assert "documents.phash_bands && " in sql
+    assert "(documents.created_at, documents.id) < (" in sql
+    assert "documents.duplicate_of IS NULL" in sql
+    assert "documents.status NOT IN" in sql
+    assert doc.created_at in compiled.params.values()
+
+
+def test_find_near_duplicate_picks_closest_then_oldest() -> None:
+    phash = perceptual_hash(cv2.imread(str(IMAGES[0])))
+    doc = _document(phash)
+    earlier = doc.created_at - timedelta(days=1)
+    far = SimpleNamespace(id=uuid.uuid4(), phash=_flip(phash, 13), created_at=earlier)
+    close_new = SimpleNamespace(id=uuid.uuid4(), phash=_flip(phash, 2), created_at=earlier)
+    close_old = SimpleNamespace(
+        id=uuid.uuid4(), phash=_flip(phash, 2), created_at=earlier - timedelta(hours=1)
+    )
+    session = FakeSession([far, close_new, close_old, SimpleNamespace(phash=None)])
+
+    assert preprocess_module.find_near_duplicate(session, doc, 12) is close_old
+    assert preprocess_module.find_near_duplicate(FakeSession([far]), doc, 12) is None
+
+
+def test_release_stranded_duplicates_requeues_for_a_fresh_check() -> None:
+    watchdog_module = importlib.import_module("worker.tasks.watchdog")
+    stranded = Document(id=uuid.uuid4(), status="duplicate", duplicate_of=uuid.uuid4())
+
+    class FakeQuery:
+        def outerjoin(self, *args):
+            return self
+
+        filter = outerjoin
+
+        def all(self):
+            return [stranded]
+
+    session = SimpleNamespace(query=lambda model: FakeQuery(), commit=lambda: None)
+
+    assert watchdog_module.release_stranded_duplicates(session) == [str(stranded.id)]
+    assert stranded.status == "queued"
+    assert stranded.duplicate_of is None
+
+
+def test_duplicate_check_runs_under_the_lock_and_commits_the_hash(monkeypatch) -> None:
+    image_bytes = IMAGES[0].read_bytes()
+    original = SimpleNamespace(id=uuid.uuid4())
+    events: list[str] = []
+
+    class RecordingSession:
+        def execute(self, statement):
+            events.append("lock" if "pg_advisory_xact_lock" in str(statement) else "query")
+
+        def commit(self):
+            events.append("commit")
+
+    def find(session, doc, max_distance):
+        events.append("lookup")
+        assert doc.phash and doc.phash_bands
+        return original
+
+    monkeypatch.setattr(preprocess_module.storage_client, "download_bytes", lambda key: image_bytes)
+    monkeypatch.setattr(preprocess_module, "_store_thumbnails", lambda doc, image, upload: None)
+    monkeypatch.setattr(preprocess_module, "find_near_duplicate", find)
+    doc = Document(id=uuid.uuid4(), original_path="originals/copy.jpeg", status="preprocessing")
+
+    assert preprocess_module.preprocess_document(doc, session=RecordingSession()) is None
+    assert events == ["lock", "lookup", "commit"]
+    assert doc.status == "duplicate"
+    assert doc.duplicate_of == original.id
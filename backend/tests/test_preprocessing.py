@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from worker.ocr.image_utils import rotate_image
+from worker.ocr.preprocessing import (
+    PREPROCESS_PROFILES,
+    _PreprocessCache,
+    is_preprocessed,
+    mark_preprocessed,
+    select_preprocess_profile,
+)
+
+
+def _array(nbytes: int) -> np.ndarray:
+    return np.zeros(nbytes, dtype=np.uint8)
+
+
+def test_preprocess_cache_evicts_to_stay_under_byte_budget() -> None:
+    cache = _PreprocessCache(max_entries=8, max_bytes=1000)
+
+    for key in range(4):
+        cache.put((key,), _array(400))
+
+    assert cache.nbytes == 800
+    assert cache.get((0,)) is None and cache.get((1,)) is None
+    assert cache.get((3,)) is not None
+
+
+def test_preprocess_cache_skips_results_larger_than_budget() -> None:
+    cache = _PreprocessCache(max_entries=8, max_bytes=1000)
+    cache.put(("small",), _array(100))
+
+    cache.put(("page",), _array(1001))
+
+    assert cache.get(("page",)) is None
+    assert cache.get(("small",)) is not None
+    assert cache.nbytes == 100
+
+
+def test_crops_keep_the_preprocessed_marker_but_rotations_do_not() -> None:
+    image = mark_preprocessed(np.zeros((40, 60, 3), dtype=np.uint8))
+
+    assert is_preprocessed(image[5:20, 10:30])
+    assert not is_preprocessed(rotate_image(image, 90))
+
+
+@pytest.mark.parametrize(
+    ("allowed", "expected"),
+    [
+        (["full"], "full"),
+        (["full", "fast"], "fast"),
+        (PREPROCESS_PROFILES, "none"),
+    ],
+)
+def test_auto_profile_falls_back_to_allowed_profiles(allowed, expected) -> None:
+    clean = np.full((60, 80, 3), 200, dtype=np.uint8)
+
+    profile, metrics = select_preprocess_profile(clean, allowed=allowed)
+
+    assert profile == expected
+    assert metrics["suggested_profile"] == "none"
@@ -0,0 +1,85 @@
+import sys
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.query_syntax import FieldTerm, parse_query, term_condition
+
+
+def _sql(term: FieldTerm) -> tuple[str, dict]:
+    compiled = term_condition(term).compile(dialect=postgresql.dialect())
+    return str(compiled), compiled.params
+
+
+def test_parse_query_splits_terms_and_free_text() -> None:
+    parsed = parse_query('chassis:wp0zz* ポル model_code:J1NE venue:"USS 東京" タイカン')
+
+    assert parsed.terms == (
+        FieldTerm("chassis", "prefix", "WP0ZZ"),
+        FieldTerm("model_code", "=", "J1NE"),
+        FieldTerm("venue", "=", "USS 東京"),
+    )
+    assert parsed.text == "ポル タイカン"
+
+
+@pytest.mark.parametrize(
+    ("query", "term"),
+    [
+        ("price:>3000000", FieldTerm("price", ">", 3_000_000)),
+        ("price:<=3,500,000", FieldTerm("price", "<=", 3_500_000)),
+        ("price:300万..450.5万", FieldTerm("price", "range", 3_000_000, 4_505_000)),
+        ("score:4.5", FieldTerm("score", "=", Decimal("4.5"))),
+        ("km:..50000", FieldTerm("km", "range", None, 50_000)),
+        ("date:2024/05/01..", FieldTerm("date", "range", date(2024, 5, 1), None)),
+        ("Year:>=2020", FieldTerm("year", ">=", 2020)),
+        ("lot:１２３", FieldTerm("lot", "=", "123")),
+    ],
+)
+def test_parse_query_values(query: str, term: FieldTerm) -> None:
+    assert parse_query(query).terms == (term,)
+
+
+@pytest.mark.parametrize(
+    ("query", "text"),
+    [
+        ("note: 12:30", "note: 12:30"),
+        ("colour:white タイカン", "colour:white タイカン"),
+        ('title:"GT3 RS" lot:12', "title:GT3 RS"),
+    ],
+)
+def test_parse_query_keeps_unknown_fields_as_free_text(query: str, text: str) -> None:
+    assert parse_query(query).text == text
+
+
+@pytest.mark.parametrize("query", ["price:cheap", "date:2024-13-01", "chassis:*", "score:.."])
+def test_parse_query_rejects_bad_terms(query: str) -> None:
+    with pytest.raises(ValueError):
+        parse_query(query)
+
+
+def test_prefix_compiles_to_bytewise_range() -> None:
+    sql, params = _sql(FieldTerm("chassis", "prefix", "WP0ZZ"))
+
+    assert "auction_records.chassis_no ~>=~" in sql
+    assert "auction_records.chassis_no ~<~" in sql
+    assert list(params.values()) == ["WP0ZZ", "WP0Z["]
+
+
+def test_japanese_prefix_upper_bound() -> None:
+    _, params = _sql(FieldTerm("venue", "prefix", "USS東京"))
+
+    assert list(params.values()) == ["USS東京", "USS東亭"]
+
+
+def test_comparison_uses_dedicated_column() -> None:
+    sql, params = _sql(FieldTerm("price", ">", 3_000_000))
+
+    assert sql.startswith("auction_records.final_bid_yen >")
+    assert list(params.values()) == [3_000_000]
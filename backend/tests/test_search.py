@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.models.record import AuctionRecord
+from app.services.search import (
+    RecordFilters,
+    apply_record_filters,
+    bigram_tsquery,
+    bigrams,
+    plan_search,
+)
+
+
+def test_bigrams_normalize_width_and_case() -> None:
+    assert bigrams("ﾎﾟﾙ　タイカン") == ["ポル", "タイ", "イカ", "カン"]
+    assert bigrams("ＧＲ86") == ["gr", "r8", "86"]
+    assert bigrams("ランドランド") == ["ラン", "ンド", "ドラ"]
+    assert bigrams("a b") == []
+
+
+def test_bigram_tsquery_quotes_lexemes() -> None:
+    assert bigram_tsquery("タイカン") == "'タイ' & 'イカ' & 'カン'"
+    assert bigram_tsquery("it's") == "'it' & 't''' & '''s'"
+
+
+@pytest.mark.parametrize(
+    ("query", "kind"),
+    [
+        ("AAZA20-6001762", "chassis"),
+        ("wp0zzzy1zpsa85157", "chassis"),
+        ("AAZA20", "model_code"),
+        ("３BA-AAZA20", "model_code"),
+        ("GR86", "model_code"),
+        ("ポル タイカン", "text"),
+        ("ランドクルーザ", "text"),
+        ("NX", "text"),
+        ("BMW 4シリーズ", "text"),
+        ("BMW 4 シリーズ", "substring"),
+    ],
+)
+def test_plan_search_routes_by_shape(query: str, kind: str) -> None:
+    assert plan_search(query).kind == kind
+
+
+def test_plan_search_ignores_blank_queries() -> None:
+    assert plan_search("  　") is None
+    query = apply_record_filters(select(AuctionRecord), RecordFilters(q=" "))
+    assert query.whereclause is None
+
+
+def test_text_search_uses_bigram_index() -> None:
+    query = apply_record_filters(select(AuctionRecord), RecordFilters(q="タイカン"))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+
+    assert "auction_records.search_bigrams @@ CAST(" in sql
+    assert "ILIKE" not in sql
+
+
+def test_substring_search_escapes_like_wildcards() -> None:
+    plan = plan_search("100% 白")
+    params = plan.condition.compile(dialect=postgresql.dialect()).params
+
+    assert "%100\\% 白%" in params.values()
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+RUN_BENCHMARKS = os.getenv("RUN_BENCHMARKS") == "1"
+if not RUN_BENCHMARKS:
+    pytest.skip("Set RUN_BENCHMARKS=1 to run storage benchmarks.", allow_module_level=True)
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+import httpx
+from fastapi import FastAPI, Request
+
+from app.config import settings
+from app.services.storage import AsyncStorageClient, StorageClient
+
+# Point at a running MinIO with STORAGE_BENCH_ENDPOINT; otherwise a moto server is started.
+ENDPOINT = os.getenv("STORAGE_BENCH_ENDPOINT")
+REQUESTS = int(os.getenv("STORAGE_BENCH_REQUESTS", "256"))
+CONCURRENCY = int(os.getenv("STORAGE_BENCH_CONCURRENCY", "32"))
+PROBE_INTERVAL = 0.02
+PAYLOAD = os.urandom(int(os.getenv("STORAGE_BENCH_PAYLOAD_KB", "256")) * 1024)
+
+
+@pytest.fixture(scope="module")
+def storage():
+    server = None
+    endpoint = ENDPOINT
+    if not endpoint:
+        moto_server = pytest.importorskip("moto.server")
+        server = moto_server.ThreadedMotoServer(port=0)
+        server.start()
+        host, port = server.get_host_and_port()
+        endpoint = f"http://{host}:{port}"
+        os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+    settings.S3_ENDPOINT_URL = endpoint
+    client = StorageClient()
+    client.ensure_bucket()
+    yield client
+    if server:
+        server.stop()
+
+
+def _app(storage: StorageClient) -> FastAPI:
+    async_storage = AsyncStorageClient(storage, settings.S3_MAX_POOL_CONNECTIONS)
+    app = FastAPI()
+
+    @app.put("/blocking/{key}")
+    async def blocking(key: str, request: Request):
+        storage.upload_bytes(f"bench/{key}", await request.body())
+        return {}
+
+    @app.put("/async/{key}")
+    async def non_blocking(key: str, request: Request):
+        await async_storage.upload_bytes(f"bench/{key}", await request.body())
+        return {}
+
+    @app.get("/health")
+    async def health():
+        return {}
+
+    return app
+
+
+async def _run(app: FastAPI, route: str) -> tuple[list[float], list[float]]:
+    """Upload latencies counted from a common start, plus /health latencies during the load."""
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    uploads: list[float] = []
+    probes: list[float] = []
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+
+        async def upload(idx: int) -> None:
+            async with semaphore:
+                response = await client.put(f"/{route}/{idx}", content=PAYLOAD)
+                uploads.append(time.perf_counter() - started)
+                assert response.status_code == 200
+
+        async def probe(scheduled: float) -> None:
+            await client.get("/health")
+            probes.append(time.perf_counter() - scheduled)
+
+        async def ticker() -> None:
+            # Probes are timed from when they were due, so a stalled event loop counts.
+            tasks = []
+            tick = 0
+            while not done.is_set():
+                scheduled = started + tick * PROBE_INTERVAL
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                tasks.append(asyncio.create_task(probe(scheduled)))
+                tick += 1
+            await asyncio.gather(*tasks)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.gather(*(upload(idx) for idx in range(REQUESTS)))
+        done.set()
+        await ticker_task
+    return sorted(uploads), sorted(probes)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def test_upload_latency_under_concurrency(storage) -> None:
+    app = _app(storage)
+    print(f"\n{REQUESTS} uploads of {len(PAYLOAD) // 1024} KiB, {CONCURRENCY} in flight")
+    for route in ("blocking", "async"):
+        uploads, probes = asyncio.run(_run(app, route))
+        print(
+            f"{route:<9} upload p50 {_percentile(uploads, 0.50) * 1e3:7.1f} ms"
+            f"  p99 {_percentile(uploads, 0.99) * 1e3:7.1f} ms"
+            f"  | /health p50 {_percentile(probes, 0.50) * 1e3:6.1f} ms"
+            f"  p99 {_percentile(probes, 0.99) * 1e3:6.1f} ms ({len(probes)} probes)"
+        )
@@ -0,0 +1,27 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+
+from worker.ocr.vl_engine import _tokens_from_blocks
+
+
+def test_tokens_from_blocks_keeps_array_geometry_at_the_origin() -> None:
+    bbox = np.array([0, 0, 40, 10])
+    polygon = np.array([[0, 0], [5, 0], [5, 5], [0, 5]])
+    blocks = [
+        {"block_label": "text", "block_content": "売主 山田", "block_bbox": bbox},
+        {"label": "text", "content": "済", "block_polygon_points": polygon},
+    ]
+
+    tokens, meta = _tokens_from_blocks(blocks)
+
+    assert [(token.text, token.bbox) for token in tokens] == [
+        ("売主", (0, 0, 20, 10)),
+        ("山田", (20, 0, 40, 10)),
+        ("済", (0, 0, 5, 5)),
+    ]
+    assert meta == {}
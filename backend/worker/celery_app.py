@@ -1,7 +1,12 @@
+import logging
+
 from celery import Celery
+from celery.signals import worker_process_init, worker_ready
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 celery_app = Celery(
     "auction_ocr",
     broker=settings.REDIS_URL,
@@ -17,11 +22,44 @@ celery_app.conf.update(
     task_default_queue="default",
 )
 
+if settings.OCR_PRELOAD_MODELS:
+    celery_app.conf.worker_proc_alive_timeout = settings.OCR_PRELOAD_TIMEOUT
+
 celery_app.conf.beat_schedule = {
     "watchdog-stuck-documents": {
         "task": "worker.tasks.watchdog.watchdog_stuck_documents",
         "schedule": 300.0,
-    }
+    },
+    "refresh-market-stats": {
+        "task": "worker.tasks.market_stats.refresh_market_stats",
+        "schedule": settings.MARKET_STATS_REFRESH_SECONDS,
+    },
 }
 
 celery_app.autodiscover_tasks(["worker.tasks"])
+
+
+@worker_process_init.connect
+def _preload_models_in_child(**kwargs):
+    if settings.OCR_PRELOAD_MODELS:
+        _preload_models()
+
+
+@worker_ready.connect
+def _preload_models_in_main(sender=None, **kwargs):
+    # Solo and thread pools run tasks in the main process, which never sees
+    # worker_process_init; prefork children are handled above.
+    if not settings.OCR_PRELOAD_MODELS:
+        return
+    pool_cls = getattr(getattr(sender, "controller", None), "pool_cls", None)
+    if getattr(pool_cls, "__module__", "") == "celery.concurrency.prefork":
+        return
+    _preload_models()
+
+
+def _preload_models() -> None:
+    from worker.ocr.warmup import warm_up_models
+
+    timings = warm_up_models()
+    if timings:
+        logger.info("OCR models preloaded in %.1fs", sum(timings.values()))
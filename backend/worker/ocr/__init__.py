@@ -12,6 +12,12 @@ from worker.ocr.parsing import (
 from worker.ocr.preprocessing import binarize_image, preprocess_auction_image
 from worker.ocr.roi import RoiResult, detect_rois
 from worker.ocr.sheet_extraction import extract_sheet
+from worker.ocr.vl_engine import (
+    run_vl_ocr,
+    run_vl_ocr_batch,
+    run_vl_ocr_stacked,
+    run_vl_ocr_stacked_batch,
+)
 
 __all__ = [
     "OCRToken",
@@ -26,6 +32,10 @@ __all__ = [
     "extract_header",
     "extract_sheet",
     "run_ocr",
+    "run_vl_ocr",
+    "run_vl_ocr_batch",
+    "run_vl_ocr_stacked",
+    "run_vl_ocr_stacked_batch",
     "parse_header",
     "parse_header_cells",
     "parse_sheet",
@@ -6,6 +6,7 @@ import re
 
 from worker.ocr.image_utils import OCRToken, crop_image
 from worker.ocr.ocr_engine import OCRResult, run_ocr
+from worker.ocr.parsing import missing_p0, parse_primary_header
 from worker.ocr.vl_engine import run_vl_ocr
 from worker.ocr.preprocessing import binarize_image
 
@@ -17,12 +18,29 @@ class HeaderExtraction:
     table_cells: dict[str, str] | None
     table_cell_count: int
     method: str
+    fallback_skipped: bool = False
 
 
-def extract_header(image, header_bbox) -> HeaderExtraction:
+FALLBACK_POLICIES = ("always", "auto")
+
+
+def extract_header(
+    image,
+    header_bbox,
+    vl_result: OCRResult | None = None,
+    fallback_policy: str = "always",
+) -> HeaderExtraction:
+    """OCR the header ROI with VL and, depending on ``fallback_policy``, a fallback pass.
+
+    ``"always"`` runs the binarized PaddleOCR/Tesseract fallback on every header.
+    ``"auto"`` skips it when the VL output already yields every P0 field, which
+    is the only case where extraction ignores the fallback tokens anyway.
+    """
+    if fallback_policy not in FALLBACK_POLICIES:
+        raise ValueError(f"Unknown header fallback policy: {fallback_policy}")
     crop = crop_image(image, header_bbox)
 
-    primary = run_vl_ocr(crop)
+    primary = vl_result if vl_result is not None else run_vl_ocr(crop)
     table_cells = {}
     table_cell_count = 0
     method = "vl"
@@ -34,17 +52,21 @@ def extract_header(image, header_bbox) -> HeaderExtraction:
         if table_cells:
             method = "ppstructure"
 
-    # Always run fallback OCR to get additional tokens
-    # The VL OCR often has table parsing issues with auction headers
+    # The VL OCR often has table parsing issues with auction headers, so the
+    # fallback OCR provides additional tokens unless VL is already complete.
     fallback = None
-    try:
-        fallback = run_ocr(
-            binarize_image(crop),
-            lang="japan",
-            engine_preference=["paddle", "tesseract"],
-        )
-    except Exception:
-        fallback = None
+    fallback_skipped = fallback_policy == "auto" and not missing_p0(
+        parse_primary_header(primary.tokens, table_cells, table_cell_count)
+    )
+    if not fallback_skipped:
+        try:
+            fallback = run_ocr(
+                binarize_image(crop),
+                lang="japan",
+                engine_preference=["paddle", "tesseract"],
+            )
+        except Exception:
+            fallback = None
 
     primary = _offset_result(primary, header_bbox)
     if fallback:
@@ -56,6 +78,7 @@ def extract_header(image, header_bbox) -> HeaderExtraction:
         table_cells=table_cells or None,
         table_cell_count=table_cell_count,
         method=method,
+        fallback_skipped=fallback_skipped,
     )
 
 
@@ -29,6 +29,65 @@ def encode_png(image: np.ndarray) -> bytes:
     return encoded.tobytes()
 
 
+def render_thumbnails(
+    image: np.ndarray, sizes: dict[str, int], quality: int = 80
+) -> dict[str, bytes]:
+    """JPEG thumbnails of a decoded image, one per named maximum side length.
+
+    Sizes are rendered largest first and each smaller one is shrunk from the
+    previous result, so the full-resolution image is only resampled once.
+    """
+    thumbnails = {}
+    for name, max_size in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+        height, width = image.shape[:2]
+        scale = max_size / max(height, width)
+        if scale < 1.0:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        success, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not success:
+            raise ValueError("Failed to encode image")
+        thumbnails[name] = encoded.tobytes()
+    return thumbnails
+
+
+# 16x16 difference hash: 256 bits, split into 16-bit bands for the index lookup.
+PHASH_SIZE = 16
+PHASH_BAND_BITS = 16
+
+
+def perceptual_hash(image: np.ndarray) -> str:
+    """256-bit difference hash (dHash) of a decoded image, as 64 hex digits.
+
+    The image is shrunk to 17x16 grey pixels and each bit records whether a
+    pixel is brighter than its left neighbour, so recompression and resizing
+    move only a few bits.
+    """
+    grey = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    small = cv2.resize(grey, (PHASH_SIZE + 1, PHASH_SIZE), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return np.packbits(bits).tobytes().hex()
+
+
+def phash_bands(phash: str) -> list[int]:
+    """Index keys for ``phash``: each 16-bit band tagged with its position.
+
+    Hashes within distance 15 share at least one band (pigeonhole), so an
+    overlap lookup on these keys finds every candidate up to that distance.
+    """
+    value = int(phash, 16)
+    band_count = PHASH_SIZE * PHASH_SIZE // PHASH_BAND_BITS
+    mask = (1 << PHASH_BAND_BITS) - 1
+    return [
+        (idx << PHASH_BAND_BITS) | ((value >> (idx * PHASH_BAND_BITS)) & mask)
+        for idx in range(band_count)
+    ]
+
+
+def hamming_distance(first: str, second: str) -> int:
+    return (int(first, 16) ^ int(second, 16)).bit_count()
+
+
 def crop_image(image: np.ndarray, bbox: tuple[int, int, int, int]) -> np.ndarray:
     x0, y0, x1, y1 = bbox
     x0 = max(0, x0)
@@ -40,6 +99,17 @@ def crop_image(image: np.ndarray, bbox: tuple[int, int, int, int]) -> np.ndarray
     return image[y0:y1, x0:x1]
 
 
+def rotate_image(image: np.ndarray, rotation: int) -> np.ndarray:
+    """Rotate clockwise by 0, 90, 180 or 270 degrees."""
+    if rotation == 90:
+        return cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
+    if rotation == 180:
+        return cv2.rotate(image, cv2.ROTATE_180)
+    if rotation == 270:
+        return cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
+    return image
+
+
 def scale_bbox(bbox: tuple[int, int, int, int], scale: float) -> tuple[int, int, int, int]:
     x0, y0, x1, y1 = bbox
     return (
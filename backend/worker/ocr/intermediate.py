@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import struct
+from typing import Literal, get_args
+
+import cv2
+import lz4.frame
+import numpy as np
+
+from worker.ocr.image_utils import decode_image
+
+
+# Formats for the preprocessed page kept between pipeline stages.  All are lossless.
+# "png": PNG at ``png_level`` (0-9; None keeps OpenCV's default), readable anywhere.
+# "webp": WebP lossless.
+# "raw": the ndarray bytes behind a small header, no compression.
+# "raw-lz4": "raw" wrapped in an LZ4 frame.
+IntermediateFormat = Literal["png", "webp", "raw", "raw-lz4"]
+INTERMEDIATE_FORMATS = get_args(IntermediateFormat)
+DEFAULT_FORMAT = "png"
+
+FORMAT_EXTENSIONS = {"png": "png", "webp": "webp", "raw": "npr", "raw-lz4": "npr.lz4"}
+FORMAT_CONTENT_TYPES = {
+    "png": "image/png",
+    "webp": "image/webp",
+    "raw": "application/octet-stream",
+    "raw-lz4": "application/octet-stream",
+}
+
+# magic, dtype string (e.g. "|u1"), ndim; followed by ndim little-endian uint32 dims.
+_RAW_MAGIC = b"ANDR"
+_RAW_HEADER = struct.Struct("<4s4sB")
+
+
+def encode_intermediate(
+    image: np.ndarray, fmt: str = DEFAULT_FORMAT, png_level: int | None = None
+) -> bytes:
+    if fmt == "png":
+        params = [] if png_level is None else [cv2.IMWRITE_PNG_COMPRESSION, png_level]
+        return _imencode(".png", image, params)
+    if fmt == "webp":
+        # Quality above 100 selects lossless WebP in OpenCV.
+        return _imencode(".webp", image, [cv2.IMWRITE_WEBP_QUALITY, 101])
+    if fmt == "raw":
+        return _encode_raw(image)
+    if fmt == "raw-lz4":
+        return lz4.frame.compress(_encode_raw(image))
+    raise ValueError(f"Unknown intermediate format: {fmt}")
+
+
+def decode_intermediate(data: bytes, fmt: str | None = None) -> np.ndarray:
+    """Decode an intermediate image; ``None`` means a legacy PNG."""
+    fmt = fmt or DEFAULT_FORMAT
+    if fmt in ("png", "webp"):
+        return decode_image(data)
+    if fmt == "raw":
+        return _decode_raw(data)
+    if fmt == "raw-lz4":
+        return _decode_raw(lz4.frame.decompress(data))
+    raise ValueError(f"Unknown intermediate format: {fmt}")
+
+
+def intermediate_key(prefix: str, document_id: str, fmt: str) -> str:
+    if fmt not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unknown intermediate format: {fmt}")
+    return f"{prefix}/{document_id}.{FORMAT_EXTENSIONS[fmt]}"
+
+
+def _imencode(ext: str, image: np.ndarray, params: list[int]) -> bytes:
+    success, encoded = cv2.imencode(ext, image, params)
+    if not success:
+        raise ValueError("Failed to encode image")
+    return encoded.tobytes()
+
+
+def _encode_raw(image: np.ndarray) -> bytes:
+    image = np.ascontiguousarray(image)
+    header = _RAW_HEADER.pack(_RAW_MAGIC, image.dtype.str.encode("ascii"), image.ndim)
+    dims = struct.pack(f"<{image.ndim}I", *image.shape)
+    return header + dims + image.tobytes()
+
+
+def _decode_raw(data: bytes) -> np.ndarray:
+    magic, dtype, ndim = _RAW_HEADER.unpack_from(data)
+    if magic != _RAW_MAGIC:
+        raise ValueError("Failed to decode image")
+    offset = _RAW_HEADER.size
+    shape = struct.unpack_from(f"<{ndim}I", data, offset)
+    offset += 4 * ndim
+    array = np.frombuffer(data, dtype=np.dtype(dtype.rstrip(b"\0").decode("ascii")), offset=offset)
+    return array.reshape(shape)
+
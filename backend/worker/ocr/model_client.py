@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import urllib.error
+import urllib.request
+from urllib.parse import urlencode
+
+import numpy as np
+
+
+DEFAULT_TIMEOUT_SECONDS = 300.0
+
+
+def model_server_url() -> str | None:
+    """Base URL of the shared OCR model server, if one is configured.
+
+    When ``OCR_MODEL_SERVER_URL`` is set (e.g. ``http://127.0.0.1:8765``) the
+    engines forward inference to that process instead of loading models in
+    the calling worker.
+    """
+    url = os.getenv("OCR_MODEL_SERVER_URL")
+    return url.rstrip("/") if url else None
+
+
+def remote_predict(
+    base_url: str,
+    endpoint: str,
+    images: list[np.ndarray],
+    params: dict[str, str] | None = None,
+) -> list[dict]:
+    """POST images to the model server and return one JSON payload per image."""
+    url = f"{base_url}/v1/{endpoint}"
+    if params:
+        url = f"{url}?{urlencode(params)}"
+    request = urllib.request.Request(
+        url,
+        data=encode_images(images),
+        method="POST",
+        headers={"Content-Type": "application/x-npz"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=_timeout()) as response:
+            payload = json.loads(response.read().decode("utf-8"))
+    except urllib.error.HTTPError as exc:
+        try:
+            payload = json.loads(exc.read().decode("utf-8"))
+        except ValueError:
+            payload = {"error": str(exc)}
+    if "error" in payload:
+        raise RuntimeError(f"OCR model server error: {payload['error']}")
+    results = payload.get("results") or []
+    if len(results) != len(images):
+        raise RuntimeError("OCR model server returned a mismatched result count")
+    return results
+
+
+def encode_images(images: list[np.ndarray]) -> bytes:
+    buffer = io.BytesIO()
+    np.savez(buffer, *images)
+    return buffer.getvalue()
+
+
+def decode_images(data: bytes) -> list[np.ndarray]:
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        return [archive[f"arr_{idx}"] for idx in range(len(archive.files))]
+
+
+def _timeout() -> float:
+    value = os.getenv("OCR_MODEL_SERVER_TIMEOUT")
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return DEFAULT_TIMEOUT_SECONDS
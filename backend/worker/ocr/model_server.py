@@ -0,0 +1,202 @@
+"""Local inference server that owns the OCR models for a whole worker host.
+
+Run one instance next to the Celery workers::
+
+    python -m worker.ocr.model_server --host 127.0.0.1 --port 8765
+
+and point the workers at it with ``OCR_MODEL_SERVER_URL=http://127.0.0.1:8765``.
+PaddleOCR-VL and PaddleOCR are then loaded once in this process, while the
+prefork children stay small CPU processes.  Concurrent requests are coalesced
+into batched ``predict`` calls.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from worker.ocr.model_client import decode_images
+from worker.ocr.ocr_engine import _run_paddle_batch, result_to_dict
+from worker.ocr.vl_engine import predict_vl_payloads
+from worker.ocr.warmup import warm_up_models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 8
+DEFAULT_MAX_WAIT_MS = 25
+
+
+@dataclass
+class _Pending:
+    images: list[np.ndarray]
+    key: str
+    done: threading.Event = field(default_factory=threading.Event)
+    results: list[dict] | None = None
+    error: Exception | None = None
+
+
+class BatchCoalescer:
+    """Collect concurrent requests and run them through one model call.
+
+    A single background thread owns the model, so inference is never run
+    concurrently on the same predictor.  Requests with different keys
+    (e.g. OCR language) are never mixed within one call.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[list[np.ndarray], str], list[dict]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+    ) -> None:
+        self._predict = predict
+        self._max_batch = max(max_batch, 1)
+        self._max_wait = max(max_wait_ms, 0) / 1000.0
+        self._queue: queue.Queue[_Pending] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, images: list[np.ndarray], key: str = "") -> list[dict]:
+        pending = _Pending(images=images, key=key)
+        self._queue.put(pending)
+        pending.done.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.results or []
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while sum(len(item.images) for item in batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            by_key: dict[str, list[_Pending]] = {}
+            for item in batch:
+                by_key.setdefault(item.key, []).append(item)
+            for key, items in by_key.items():
+                self._run_group(key, items)
+
+    def _run_group(self, key: str, items: list[_Pending]) -> None:
+        images = [image for item in items for image in item.images]
+        started = time.perf_counter()
+        try:
+            results = self._predict(images, key)
+        except Exception as exc:
+            logger.exception("OCR model server batch failed")
+            for item in items:
+                item.error = exc
+                item.done.set()
+            return
+        logger.debug(
+            "Ran batch of %d images from %d requests in %.3fs",
+            len(images),
+            len(items),
+            time.perf_counter() - started,
+        )
+        offset = 0
+        for item in items:
+            item.results = results[offset : offset + len(item.images)]
+            offset += len(item.images)
+            item.done.set()
+
+
+def _predict_vl(images: list[np.ndarray], key: str) -> list[dict]:
+    return predict_vl_payloads(images)
+
+
+def _predict_ocr(images: list[np.ndarray], key: str) -> list[dict]:
+    return [result_to_dict(result) for result in _run_paddle_batch(images, lang=key or "japan")]
+
+
+def build_handler(coalescers: dict[str, BatchCoalescer]) -> type[BaseHTTPRequestHandler]:
+    class ModelRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if urlparse(self.path).path == "/health":
+                self._send_json(200, {"status": "healthy"})
+                return
+            self._send_json(404, {"error": "Not found"})
+
+        def do_POST(self) -> None:
+            parsed = urlparse(self.path)
+            endpoint = parsed.path.removeprefix("/v1/")
+            coalescer = coalescers.get(endpoint)
+            if coalescer is None:
+                self._send_json(404, {"error": "Not found"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                images = decode_images(self.rfile.read(length))
+            except Exception as exc:
+                self._send_json(400, {"error": f"Invalid payload: {exc}"})
+                return
+            key = parse_qs(parsed.query).get("lang", [""])[0]
+            try:
+                results = coalescer.submit(images, key=key)
+            except Exception as exc:
+                self._send_json(500, {"error": str(exc)})
+                return
+            self._send_json(200, {"results": results})
+
+        def log_message(self, format: str, *args) -> None:
+            logger.debug(format, *args)
+
+        def _send_json(self, status: int, payload: dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return ModelRequestHandler
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    max_batch: int = DEFAULT_MAX_BATCH,
+    max_wait_ms: int = DEFAULT_MAX_WAIT_MS,
+) -> None:
+    warm_up_models()
+    coalescers = {
+        "vl": BatchCoalescer(_predict_vl, max_batch=max_batch, max_wait_ms=max_wait_ms),
+        "ocr": BatchCoalescer(_predict_ocr, max_batch=max_batch, max_wait_ms=max_wait_ms),
+    }
+    server = ThreadingHTTPServer((host, port), build_handler(coalescers))
+    logger.info("OCR model server listening on %s:%d", host, port)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve OCR models to local workers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=int, default=DEFAULT_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    serve(host=args.host, port=args.port, max_batch=args.max_batch, max_wait_ms=args.max_wait_ms)
+
+
+if __name__ == "__main__":
+    main()
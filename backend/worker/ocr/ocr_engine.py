@@ -9,6 +9,7 @@ from typing import List
 import numpy as np
 
 from worker.ocr.image_utils import OCRToken, to_int_bbox
+from worker.ocr.model_client import model_server_url, remote_predict
 
 _PADDLE_INSTANCE = None
 
@@ -77,7 +78,63 @@ def run_ocr(
     return last_result if last_result is not None else OCRResult(engine="none", tokens=[])
 
 
+def run_ocr_batch(
+    images: list[np.ndarray],
+    lang: str = "japan",
+    engine_preference: list[str] | None = None,
+) -> list[OCRResult]:
+    """Batched ``run_ocr``: PaddleOCR sees every image in one ``predict`` call.
+
+    Images that come back empty fall through to the next engine one by one,
+    so each result matches what ``run_ocr`` returns for that image alone.
+    """
+    order = engine_preference or ["paddle", "tesseract"]
+    results: list[OCRResult | None] = [None] * len(images)
+    pending = list(range(len(images)))
+    for engine in order:
+        if not pending:
+            break
+        if engine == "paddle":
+            try:
+                batch = _run_paddle_many([images[idx] for idx in pending], lang=lang)
+            except Exception:
+                continue
+        elif engine == "tesseract":
+            batch = []
+            for idx in pending:
+                try:
+                    batch.append(_run_tesseract(images[idx], lang=lang))
+                except Exception:
+                    batch.append(None)
+        else:
+            continue
+        still_pending = []
+        for idx, result in zip(pending, batch):
+            if result is not None and (result.tokens or results[idx] is None):
+                results[idx] = result
+            if result is None or not result.tokens:
+                still_pending.append(idx)
+        pending = still_pending
+
+    return [
+        result if result is not None else OCRResult(engine="none", tokens=[])
+        for result in results
+    ]
+
+
+def _run_paddle_many(images: list[np.ndarray], lang: str) -> list[OCRResult]:
+    server_url = model_server_url()
+    if server_url:
+        payloads = remote_predict(server_url, "ocr", images, {"lang": lang})
+        return [result_from_dict(payload) for payload in payloads]
+    return _run_paddle_batch(images, lang=lang)
+
+
 def _run_paddle(image: np.ndarray, lang: str) -> OCRResult:
+    return _run_paddle_many([image], lang=lang)[0]
+
+
+def _get_paddle_instance(lang: str):
     global _PADDLE_INSTANCE
     try:
         from paddleocr import PaddleOCR
@@ -91,12 +148,23 @@ def _run_paddle(image: np.ndarray, lang: str) -> OCRResult:
             ocr_version="PP-OCRv3",
             device=get_paddle_device(),
         )
+    return _PADDLE_INSTANCE
+
+
+def _run_paddle_batch(images: list[np.ndarray], lang: str) -> list[OCRResult]:
+    if not images:
+        return []
+    results = list(_get_paddle_instance(lang).predict(list(images)) or [])
+    return [
+        _result_from_paddle(results[idx] if idx < len(results) else None)
+        for idx in range(len(images))
+    ]
 
-    results = _PADDLE_INSTANCE.predict([image])
-    if not results:
+
+def _result_from_paddle(result) -> OCRResult:
+    if result is None:
         return OCRResult(engine="paddle", tokens=[])
 
-    result = results[0]
     if hasattr(result, "get"):
         texts = result.get("rec_texts") or []
         scores = result.get("rec_scores") or []
@@ -160,14 +228,31 @@ def _run_tesseract(image: np.ndarray, lang: str) -> OCRResult:
     return OCRResult(engine="tesseract", tokens=tokens)
 
 
-def result_to_json(result: OCRResult) -> str:
-    return json.dumps(
-        {
-            "engine": result.engine,
-            "meta": result.meta,
-            "tokens": [
-                {"text": token.text, "confidence": token.confidence, "bbox": list(token.bbox)}
-                for token in result.tokens
-            ],
-        }
+def result_to_dict(result: OCRResult) -> dict:
+    return {
+        "engine": result.engine,
+        "meta": result.meta,
+        "tokens": [
+            {"text": token.text, "confidence": token.confidence, "bbox": list(token.bbox)}
+            for token in result.tokens
+        ],
+    }
+
+
+def result_from_dict(payload: dict) -> OCRResult:
+    return OCRResult(
+        engine=payload.get("engine") or "none",
+        tokens=[
+            OCRToken(
+                text=token["text"],
+                confidence=float(token.get("confidence", 0.0)),
+                bbox=tuple(token.get("bbox", [0, 0, 0, 0])),
+            )
+            for token in payload.get("tokens", [])
+        ],
+        meta=payload.get("meta"),
     )
+
+
+def result_to_json(result: OCRResult) -> str:
+    return json.dumps(result_to_dict(result))
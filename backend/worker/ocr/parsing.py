@@ -3,9 +3,12 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass
+from functools import cached_property
 from statistics import median
 from typing import Iterable
 
+import numpy as np
+
 from worker.ocr.date_parsing import parse_auction_date, parse_reiwa_year, parse_reiwa_year_month
 from worker.ocr.image_utils import OCRToken
 
@@ -38,9 +41,133 @@ LABEL_MAP = {
     "score": [r"評価点"],
 }
 
+P0_HEADER_KEYS = {"lot_no", "auction_date", "auction_venue", "score"}
+# VL table parses with fewer cells than this are too fragmentary to trust.
+MIN_TABLE_CELLS = 8
+
 EQUIPMENT_CODES = {"AAC", "ナビ", "SR", "AW", "革", "PS", "PW", "DR"}
 
 
+def _any_of(patterns: Iterable[str], flags: int = 0) -> re.Pattern[str]:
+    """Compile a list of alternatives into one pattern (``search`` == any match)."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+# Precompiled patterns.  Parsing runs per token and per label, and again in bulk
+# when ocr_raw is reprocessed, so nothing below is compiled at call time.
+LABEL_REGEX = {key: _any_of(patterns) for key, patterns in LABEL_MAP.items()}
+
+_NON_ALNUM_RE = re.compile(r"[^0-9A-Z]")
+_NON_DIGIT_RE = re.compile(r"\D")
+_GROUPED_NUMBER_RE = re.compile(r"\d+(?:,\d{3})*")
+_DECIMAL_NUMBER_RE = re.compile(r"\d+(?:,\d{3})*(?:\.\d+)?")
+_NUMBER_RUN_RE = re.compile(r"(\d[\d,]*)")
+_SCORE_DIGIT_RE = re.compile(r"(\d(?:\.\d)?)")
+_SCORE_RA_RE = re.compile(r"R\s*A", re.IGNORECASE)
+_SCORE_R_RE = re.compile(r"R$", re.IGNORECASE)
+_TRANSMISSION_RE = re.compile(r"(AT|FA|CA|CVT)", re.IGNORECASE)
+_TRANSMISSION_MT_RE = re.compile(r"(AT|FA|CA|CVT|MT)", re.IGNORECASE)
+_ENGINE_CC_RE = re.compile(r"(\d{3,4})")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Free-text header patterns (_extract_header_by_patterns).
+_TEXT_DATE_RE = re.compile(r"\b(\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2})\b")
+_TEXT_ROUND_RE = re.compile(r"(\d{3,4})回")
+_TEXT_LOT_RE = re.compile(r"(?:出品番号|No\.?)\s*[:\s]*(\d{4,6})")
+_TEXT_LOT_STANDALONE_RE = re.compile(r"\b(\d{4,6})\b")
+_TEXT_YEAR_RE = re.compile(r"\bR\s*(\d{1,2})(?!回|\d)")
+_TEXT_TRANSMISSION_RE = re.compile(r"\b(AT|FA|CA|CVT|MT)\b", re.IGNORECASE)
+_TEXT_ENGINE_RE = re.compile(r"(\d{3,4})\s*(?:cc)?", re.IGNORECASE)
+_TEXT_SCORE_RA_RE = re.compile(r"\b(RA?)\b(?!\d)")
+_TEXT_SCORE_RE = re.compile(r"\b([1-5](?:\.[05])?)\b")
+_TEXT_BID_MAN_RE = re.compile(r"(\d{1,4}(?:,\d{3})*)万")
+_TEXT_BID_YEN_RE = re.compile(r"(\d{7,9})")
+_TEXT_MILEAGE_RE = re.compile(r"(\d{2,6})(?:,\d{3})*\s*(?:km|㎞|ｋｍ)", re.IGNORECASE)
+_TEXT_INSPECTION_RE = re.compile(r"R\s*(\d{1,2})[./](\d{1,2})")
+_TEXT_MODEL_CODE_RES = (
+    re.compile(r"\b([A-Z]{2,4}\d{1,3}[A-Z]?)\b"),  # e.g., MXUA80, VJA300W
+    re.compile(r"\b(\d{5,6}[A-Z])\b"),  # e.g., 118347M
+    re.compile(r"\b([A-Z]\d[A-Z]{2})\b"),  # e.g., J1NE
+)
+
+# Combined "label value" VL tokens (_extract_from_combined_token).
+_TOKEN_DATE_RE = re.compile(r"開催日\s*[:\s]*(\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2})")
+_TOKEN_LEADING_DATE_RE = re.compile(r"^(\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2})\b")
+_TOKEN_LOT_RE = re.compile(r"出品番号\s*[:\s]*(\d{3,8})")
+_TOKEN_LEADING_LOT_RE = re.compile(r"^(\d{4,6})\b")
+_TOKEN_VENUE_RE = re.compile(r"会場\s*[:\s]*([\u4E00-\u9FFF]+)")
+_TOKEN_ROUND_RE = re.compile(r"開催回?\s*[:\s]*(\d+回?)")
+_TOKEN_YEAR_RE = re.compile(r"年式\s*[:\s]*(R?\d{1,2})")
+_MAKE_MODEL_LABELS_RE = re.compile(r"車種名|グレード|/")
+_SHIFT_LABELS_RE = re.compile(r"シフト|排気量|ミッション|/")
+_MILEAGE_LABELS_RE = re.compile(r"走行|車検|/|距離|km|㎞", re.IGNORECASE)
+_COLOR_LABELS_RE = re.compile(r"色|カラー")
+_COLOR_VALUE_RE = re.compile(
+    r"(パール|ホワイト|ブラック|クロ|グレー|シルバー|レッド|ブルー|ゴールド|ベージュ)",
+    re.IGNORECASE,
+)
+_MODEL_LABELS_RE = re.compile(r"型式|エアコン|装備|/")
+_BID_LABELS_RE = re.compile(r"応札額?|スタート金額|/|万円|円")
+_SCORE_LABELS_RE = re.compile(r"評価点?|瑕疵")
+
+# Compound cell value splitting.
+_GRADE_SPLIT_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # Grade starts with a model variant code (letters + numbers)
+        r"^(.+?)\s+([A-Z]{1,3}\d{2,4}[A-Z]?\s*.*)$",
+        # Grade starts with a short code like "RZ", "GTS", "G", "S"
+        r"^(.+?)\s+([A-Z]{1,3}(?:\s+.*)?)$",
+        # Grade with specific keywords
+        r"^(.+?)\s+(バージョン.*)$",
+        r"^(.+?)\s+(Fスポーツ.*)$",
+        r"^(.+?)\s+(Mスポ.*)$",
+        r"^(.+?)\s+(AMG.*)$",
+        r"^(.+?)\s+(レザー.*)$",
+        r"^(.+?)\s+(Cパッケージ.*)$",
+    )
+)
+_MAKE_HINT_RE = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]|MB|BMW|ポル|GR")
+_INSPECTION_RE = re.compile(r"R\d{1,2}[./年]\d{1,2}")
+_INSPECTION_LOOSE_RE = re.compile(r"(?:令和)?(\d{1,2})[./年](\d{1,2})")
+_MODEL_CODE_PREFIX_RE = re.compile(r"^([A-Z0-9]{3,12})", re.IGNORECASE)
+_MODEL_CODE_RES = (
+    re.compile(r"(\d{5,6}[A-Z])"),  # Like 118347M
+    re.compile(r"([A-Z]{2,4}\d{2,3}[A-Z]?)"),  # Like AAZA20, VJA300W
+    re.compile(r"([A-Z]{1,2}\d[A-Z]{1,2})"),  # Like J1NE
+)
+
+# Record assembly.
+_VENUE_ROUND_RE = re.compile(r"(.+?)(\d+回)")
+_LOT_VENUE_ROUND_RE = re.compile(r"(?P<lot>\d{3,8})?(?P<venue>[^\d]+)?(?P<round>\d+回)?")
+_CLEAN_ROUND_RE = re.compile(r"\d+回")
+_DAMAGE_CODE_RE = re.compile(r"[A-Z]{1,2}\d")
+
+# Sheet labels, values and chassis formats (parse_sheet).
+_CHASSIS_LABEL_RE = _any_of([r"車台", r"車体", r"車台No", r"車台番号", r"車両No", r"車体番号"])
+_CHASSIS_VALUE_RE = re.compile(r"[A-HJ-NPR-Z0-9=-]{8,20}")
+_CHASSIS_INLINE_RE = re.compile(r"(?:車台|車体)[:\s]*([A-HJ-NPR-Z0-9=-]{8,20})")
+_CHASSIS_ANY_RE = re.compile(r"\b([A-HJ-NPR-Z0-9=-]{8,20})\b")
+_VIN_RE = re.compile(r"[A-HJ-NPR-Z0-9]{17}", re.IGNORECASE)
+_JP_CHASSIS_RE = re.compile(r"([A-Z]{2,6}\d{1,3}[A-Z]?)[-=]?(\d{5,8})", re.IGNORECASE)
+_SHORT_CHASSIS_RE = re.compile(r"([A-Z]{2,4}\d?)[-=]?(\d{5,7})", re.IGNORECASE)
+_EURO_VIN_RE = re.compile(r"W[A-Z0-9]{2}[A-Z0-9]{11,14}", re.IGNORECASE)
+_PORSCHE_VIN_RE = re.compile(r"WP0[A-Z0-9]{14}", re.IGNORECASE)
+_MILEAGE_LABEL_RE = _any_of([r"走行", r"走行距離", r"走行km", r"走行Ｋｍ", r"走行㎞"])
+_MILEAGE_VALUE_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_MILEAGE_INLINE_RE = re.compile(r"走行[:\s]*([0-9,]+)\s*(?:km|㎞|ｋｍ|KM)?")
+_MILEAGE_SUFFIX_RE = re.compile(r"(\d{2,6})(?:km|kふ|㎞|ｋｍ|KM)", re.IGNORECASE)
+_RECYCLE_FEE_RE = re.compile(r"リサイクル[:\s]*([0-9,]+)\s*円")
+_INSPECTOR_LABEL_RES = tuple(re.compile(p) for p in (r"検査員報告", r"検査報告", r"検査員コメント"))
+_INSPECTOR_STOP_RE = _any_of(
+    [r"車台", r"走行", r"注意", r"備考", r"装備", r"オプション", r"リサイクル"]
+)
+_NOTES_LABEL_RES = tuple(re.compile(p) for p in (r"注意事項", r"注意", r"特記事項", r"備考"))
+_NOTES_STOP_RE = _any_of([r"車台", r"走行", r"検査員報告", r"装備", r"オプション", r"リサイクル"])
+_OPTIONS_LABEL_RES = tuple(re.compile(p) for p in (r"装備", r"オプション", r"OP", r"セールスポイント"))
+_OPTIONS_STOP_RE = _any_of([r"車台", r"走行", r"注意", r"検査員報告", r"リサイクル"])
+
+
 def normalize_text(text: str) -> str:
     if text is None:
         return ""
@@ -64,7 +191,7 @@ def normalize_alnum(text: str) -> str:
         return ""
     text = unicodedata.normalize("NFKC", text)
     text = text.upper().replace(" ", "").replace("　", "")
-    return re.sub(r"[^0-9A-Z]", "", text)
+    return _NON_ALNUM_RE.sub("", text)
 
 
 def normalize_digits(text: str) -> str:
@@ -75,10 +202,17 @@ def normalize_digits(text: str) -> str:
         {"O": "0", "o": "0", "I": "1", "l": "1", "|": "1", "!": "1", "S": "5", "B": "8"}
     )
     text = text.translate(trans)
-    return re.sub(r"\D", "", text)
+    return _NON_DIGIT_RE.sub("", text)
 
 
 def group_tokens_by_row(tokens: Iterable[OCRToken]) -> list[list[OCRToken]]:
+    """Group tokens into visual rows by centre-y.
+
+    Tokens are swept top to bottom and each joins the first row whose
+    running centroid is within the threshold, otherwise it starts a new row.
+    Centroids are kept as running sums in an array, so placing a token is
+    one vectorised comparison instead of re-averaging every row.
+    """
     tokens_list = list(tokens)
     if not tokens_list:
         return []
@@ -87,30 +221,58 @@ def group_tokens_by_row(tokens: Iterable[OCRToken]) -> list[list[OCRToken]]:
     threshold = max(6, row_height * 0.6)
 
     tokens_sorted = sorted(tokens_list, key=lambda t: (t.bbox[1], t.bbox[0]))
+    size = len(tokens_sorted)
+    sums = np.zeros(size, dtype=np.float64)
+    counts = np.zeros(size, dtype=np.int64)
+    centroids = np.zeros(size, dtype=np.float64)
     rows: list[list[OCRToken]] = []
     for token in tokens_sorted:
         cy = (token.bbox[1] + token.bbox[3]) / 2
-        placed = False
-        for row in rows:
-            row_cy = sum((t.bbox[1] + t.bbox[3]) / 2 for t in row) / len(row)
-            if abs(cy - row_cy) <= threshold:
-                row.append(token)
-                placed = True
-                break
-        if not placed:
-            rows.append([token])
+        row_count = len(rows)
+        if row_count:
+            hits = np.flatnonzero(np.abs(centroids[:row_count] - cy) <= threshold)
+            if hits.size:
+                idx = int(hits[0])
+                rows[idx].append(token)
+                sums[idx] += cy
+                counts[idx] += 1
+                centroids[idx] = sums[idx] / counts[idx]
+                continue
+        rows.append([token])
+        sums[row_count] = cy
+        counts[row_count] = 1
+        centroids[row_count] = cy
     return rows
 
 
-def find_value_for_label(tokens: list[OCRToken], patterns: list[str]) -> ParsedField | None:
-    rows = group_tokens_by_row(tokens)
-    for row in rows:
-        row_sorted = sorted(row, key=lambda t: t.bbox[0])
+class RowIndex:
+    """Tokens grouped into rows once, for repeated label lookups.
+
+    ``rows`` holds each row sorted left to right and ``normalized`` the
+    matching ``normalize_text`` values.
+    """
+
+    def __init__(self, tokens: Iterable[OCRToken]) -> None:
+        self.rows = [
+            sorted(row, key=lambda t: t.bbox[0]) for row in group_tokens_by_row(tokens)
+        ]
+
+    @cached_property
+    def normalized(self) -> list[list[str]]:
+        return [[normalize_text(t.text) for t in row] for row in self.rows]
+
+
+def find_value_for_label(
+    tokens: list[OCRToken] | RowIndex, patterns: list[str] | re.Pattern[str]
+) -> ParsedField | None:
+    index = tokens if isinstance(tokens, RowIndex) else RowIndex(tokens)
+    label_re = patterns if isinstance(patterns, re.Pattern) else _any_of(patterns)
+    for row_sorted, row_norm in zip(index.rows, index.normalized):
         for idx, token in enumerate(row_sorted):
-            text_norm = normalize_text(token.text)
-            if any(re.search(pat, text_norm) for pat in patterns):
+            text_norm = row_norm[idx]
+            if label_re.search(text_norm):
                 # Try inline value
-                value = re.sub("|".join(patterns), "", text_norm)
+                value = label_re.sub("", text_norm)
                 value = value.strip(":/ ")
                 if value:
                     return ParsedField(value=value, confidence=token.confidence, bbox=token.bbox, raw=token.text)
@@ -130,7 +292,7 @@ def parse_price_pair(text: str | None) -> tuple[int | None, int | None]:
     if not text:
         return None, None
     cleaned = normalize_text(text)
-    numbers = re.findall(r"\d+(?:,\d{3})*", cleaned)
+    numbers = _GROUPED_NUMBER_RE.findall(cleaned)
     if not numbers:
         return None, None
     values = [int(num.replace(",", "")) for num in numbers]
@@ -151,7 +313,7 @@ def parse_yen(text: str | None) -> int | None:
     if not text:
         return None
     cleaned = normalize_text(text)
-    numbers = re.findall(r"\d+(?:,\d{3})*", cleaned)
+    numbers = _GROUPED_NUMBER_RE.findall(cleaned)
     if not numbers:
         digits = normalize_digits(cleaned)
         if not digits:
@@ -170,7 +332,7 @@ def parse_mileage(text: str | None) -> tuple[int | None, int | None, str | None]
     if not text:
         return None, None, None
     cleaned = normalize_text(text)
-    numbers = re.findall(r"\d+(?:,\d{3})*(?:\.\d+)?", cleaned)
+    numbers = _DECIMAL_NUMBER_RE.findall(cleaned)
     if not numbers:
         digits = normalize_digits(cleaned)
         if not digits:
@@ -211,7 +373,7 @@ def parse_score(text: str | None) -> tuple[str | None, float | None]:
         return "RA", None
     if "R" in cleaned.upper():
         return "R", None
-    match = re.search(r"\d(?:\.\d)?", cleaned)
+    match = _SCORE_DIGIT_RE.search(cleaned)
     if not match:
         return cleaned, None
     score_str = match.group(0)
@@ -225,9 +387,9 @@ def parse_shift_engine(text: str | None) -> tuple[str | None, int | None]:
     if not text:
         return None, None
     cleaned = normalize_text(text)
-    trans_match = re.search(r"(AT|FA|CA|CVT)", cleaned, re.IGNORECASE)
+    trans_match = _TRANSMISSION_RE.search(cleaned)
     trans = trans_match.group(1).upper() if trans_match else None
-    engine_match = re.search(r"(\d{3,4})", cleaned)
+    engine_match = _ENGINE_CC_RE.search(cleaned)
     engine = int(engine_match.group(1)) if engine_match else None
     return trans, engine
 
@@ -242,8 +404,9 @@ def parse_equipment(text: str | None) -> str | None:
 
 def parse_header(tokens: list[OCRToken]) -> dict[str, ParsedField]:
     results: dict[str, ParsedField] = {}
-    for key, patterns in LABEL_MAP.items():
-        field = find_value_for_label(tokens, patterns)
+    index = RowIndex(tokens)
+    for key, label_re in LABEL_REGEX.items():
+        field = find_value_for_label(index, label_re)
         if field:
             results[key] = field
 
@@ -264,13 +427,37 @@ def parse_header_cells(cells: dict[str, str]) -> dict[str, ParsedField]:
 
         # Fall back to simple label matching for non-compound labels
         if not parsed:
-            for key, patterns in LABEL_MAP.items():
-                if any(re.search(pat, label_norm) for pat in patterns):
+            for key, label_re in LABEL_REGEX.items():
+                if label_re.search(label_norm):
                     if key not in results:
                         results[key] = ParsedField(value=value, confidence=0.97, bbox=None, raw=value)
     return results
 
 
+def parse_primary_header(
+    tokens: list[OCRToken],
+    table_cells: dict[str, str] | None = None,
+    table_cell_count: int = 0,
+) -> dict[str, ParsedField]:
+    """Parse the primary (VL) header output, preferring table cells when usable."""
+    fields = parse_header(tokens)
+    if table_cells and table_cell_count >= MIN_TABLE_CELLS:
+        fields = merge_fields(parse_header_cells(table_cells), fields)
+    return fields
+
+
+def missing_p0(fields: dict[str, ParsedField]) -> bool:
+    """True when a P0 header field or both bid values are missing."""
+    if any(key not in fields or not getattr(fields[key], "value", None) for key in P0_HEADER_KEYS):
+        return True
+    has_bid = False
+    for key in ("final_bid", "bid_start"):
+        if key in fields and getattr(fields[key], "value", None):
+            has_bid = True
+            break
+    return not has_bid
+
+
 def parse_header_tokens_vl(tokens: list[OCRToken]) -> dict[str, ParsedField]:
     """Parse header tokens from VL OCR that combine 'label value' in single tokens."""
     results: dict[str, ParsedField] = {}
@@ -302,7 +489,7 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
 
     # Date pattern (e.g., "24/10/18" or "2024-10-18")
     if "auction_date" not in results:
-        date_match = re.search(r"\b(\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2})\b", text_norm)
+        date_match = _TEXT_DATE_RE.search(text_norm)
         if date_match:
             results["auction_date"] = ParsedField(
                 value=date_match.group(1), confidence=0.7, bbox=None, raw=date_match.group(0)
@@ -320,7 +507,7 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
 
     # Round pattern (e.g., "2057回" or "1488回")
     if "auction_venue_round" not in results:
-        round_match = re.search(r"(\d{3,4})回", text_norm)
+        round_match = _TEXT_ROUND_RE.search(text_norm)
         if round_match:
             results["auction_venue_round"] = ParsedField(
                 value=round_match.group(0), confidence=0.8, bbox=None, raw=round_match.group(0)
@@ -328,14 +515,14 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
 
     # Lot number pattern (5-digit number, usually near 出品番号)
     if "lot_no" not in results:
-        lot_match = re.search(r"(?:出品番号|No\.?)\s*[:\s]*(\d{4,6})", text_norm)
+        lot_match = _TEXT_LOT_RE.search(text_norm)
         if lot_match:
             results["lot_no"] = ParsedField(
                 value=lot_match.group(1), confidence=0.8, bbox=None, raw=lot_match.group(0)
             )
         else:
             # Look for standalone 5-digit number that's NOT a round number
-            lot_standalone = re.findall(r"\b(\d{4,6})\b", text_norm)
+            lot_standalone = _TEXT_LOT_STANDALONE_RE.findall(text_norm)
             for lot_candidate in lot_standalone:
                 # Skip if it's part of a round pattern (ends with 回)
                 if f"{lot_candidate}回" in text_norm:
@@ -351,7 +538,7 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
     # Year pattern (e.g., "R05", "R03", "令和5年")
     # Must NOT be followed by 回 (that's the round pattern)
     if "model_year" not in results:
-        year_match = re.search(r"\bR\s*(\d{1,2})(?!回|\d)", text_norm)
+        year_match = _TEXT_YEAR_RE.search(text_norm)
         if year_match:
             year_val = year_match.group(1)
             # Year should be reasonable (1-10 for Reiwa, started 2019)
@@ -363,10 +550,10 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
 
     # Transmission pattern (AT, FA, CA, CVT, MT)
     if "shift_engine" not in results:
-        trans_match = re.search(r"\b(AT|FA|CA|CVT|MT)\b", text_norm, re.IGNORECASE)
+        trans_match = _TEXT_TRANSMISSION_RE.search(text_norm)
         if trans_match:
             # Also try to find engine CC nearby
-            engine_match = re.search(r"(\d{3,4})\s*(?:cc)?", text_norm, re.IGNORECASE)
+            engine_match = _TEXT_ENGINE_RE.search(text_norm)
             engine_val = engine_match.group(1) if engine_match else ""
             combined = f"{trans_match.group(1).upper()} {engine_val}".strip()
             results["shift_engine"] = ParsedField(
@@ -376,14 +563,14 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
     # Score pattern (e.g., "4.5", "5", "R", "RA")
     if "score" not in results:
         # First check for R or RA (problem cars)
-        ra_match = re.search(r"\b(RA?)\b(?!\d)", text_norm)
+        ra_match = _TEXT_SCORE_RA_RE.search(text_norm)
         if ra_match and "評価" in text_norm:
             results["score"] = ParsedField(
                 value=ra_match.group(1), confidence=0.7, bbox=None, raw=ra_match.group(0)
             )
         else:
             # Numeric score
-            score_match = re.search(r"\b([1-5](?:\.[05])?)\b", text_norm)
+            score_match = _TEXT_SCORE_RE.search(text_norm)
             if score_match:
                 results["score"] = ParsedField(
                     value=score_match.group(1), confidence=0.6, bbox=None, raw=score_match.group(0)
@@ -403,7 +590,7 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
     # Bid pattern (e.g., "3,040万円" or "30400000")
     if "final_bid" not in results:
         # Look for 万円 format first
-        man_match = re.search(r"(\d{1,4}(?:,\d{3})*)万", text_norm)
+        man_match = _TEXT_BID_MAN_RE.search(text_norm)
         if man_match:
             results["final_bid"] = ParsedField(
                 value=man_match.group(1).replace(",", ""),
@@ -411,7 +598,7 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
             )
         else:
             # Look for raw large numbers (likely in yen)
-            large_num = re.search(r"(\d{7,9})", text_norm)
+            large_num = _TEXT_BID_YEN_RE.search(text_norm)
             if large_num:
                 results["final_bid"] = ParsedField(
                     value=large_num.group(1), confidence=0.5, bbox=None, raw=large_num.group(0)
@@ -429,7 +616,7 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
 
     # Mileage pattern (digits + km or ㎞)
     if "mileage" not in results:
-        mileage_match = re.search(r"(\d{2,6})(?:,\d{3})*\s*(?:km|㎞|ｋｍ)", text_norm, re.IGNORECASE)
+        mileage_match = _TEXT_MILEAGE_RE.search(text_norm)
         if mileage_match:
             results["mileage"] = ParsedField(
                 value=mileage_match.group(1), confidence=0.7, bbox=None, raw=mileage_match.group(0)
@@ -437,7 +624,7 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
 
     # Inspection expiry pattern (e.g., "R08.03", "R07.12")
     if "inspection" not in results:
-        insp_match = re.search(r"R\s*(\d{1,2})[./](\d{1,2})", text_norm)
+        insp_match = _TEXT_INSPECTION_RE.search(text_norm)
         if insp_match:
             results["inspection"] = ParsedField(
                 value=f"R{insp_match.group(1).zfill(2)}.{insp_match.group(2).zfill(2)}",
@@ -446,13 +633,8 @@ def _extract_header_by_patterns(text: str) -> dict[str, ParsedField]:
 
     # Model code pattern (alphanumeric, e.g., "MXUA80", "VJA300W", "ZN8")
     if "model_code" not in results:
-        model_patterns = [
-            r"\b([A-Z]{2,4}\d{1,3}[A-Z]?)\b",  # e.g., MXUA80, VJA300W
-            r"\b(\d{5,6}[A-Z])\b",  # e.g., 118347M
-            r"\b([A-Z]\d[A-Z]{2})\b",  # e.g., J1NE
-        ]
-        for pattern in model_patterns:
-            match = re.search(pattern, text_norm)
+        for pattern in _TEXT_MODEL_CODE_RES:
+            match = pattern.search(text_norm)
             if match:
                 model_code = match.group(1)
                 # Skip if it looks like a chassis number (too long)
@@ -472,7 +654,7 @@ def _extract_from_combined_token(
     results: dict[str, ParsedField] = {}
 
     # 開催日 + date pattern (e.g., "開催日 24/10/18")
-    date_match = re.search(r"開催日\s*[:\s]*(\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2})", text_norm)
+    date_match = _TOKEN_DATE_RE.search(text_norm)
     if date_match:
         results["auction_date"] = ParsedField(
             value=date_match.group(1), confidence=0.9, bbox=bbox, raw=raw_text
@@ -480,14 +662,14 @@ def _extract_from_combined_token(
 
     # Also look for standalone date pattern if it starts with a date
     if "開催日" not in text_norm:
-        standalone_date = re.match(r"^(\d{2,4}[/.-]\d{1,2}[/.-]\d{1,2})\b", text_norm)
+        standalone_date = _TOKEN_LEADING_DATE_RE.match(text_norm)
         if standalone_date:
             results["auction_date"] = ParsedField(
                 value=standalone_date.group(1), confidence=0.7, bbox=bbox, raw=raw_text
             )
 
     # 出品番号 + number (e.g., "出品番号 35408")
-    lot_match = re.search(r"出品番号\s*[:\s]*(\d{3,8})", text_norm)
+    lot_match = _TOKEN_LOT_RE.search(text_norm)
     if lot_match:
         results["lot_no"] = ParsedField(
             value=lot_match.group(1), confidence=0.9, bbox=bbox, raw=raw_text
@@ -495,21 +677,21 @@ def _extract_from_combined_token(
 
     # Look for standalone 5-digit lot number at start of token
     if "lot_no" not in results and "出品番号" not in text_norm:
-        lot_standalone = re.match(r"^(\d{4,6})\b", text_norm)
+        lot_standalone = _TOKEN_LEADING_LOT_RE.match(text_norm)
         if lot_standalone:
             results["lot_no"] = ParsedField(
                 value=lot_standalone.group(1), confidence=0.6, bbox=bbox, raw=raw_text
             )
 
     # 会場 + venue name (Japanese chars)
-    venue_match = re.search(r"会場\s*[:\s]*([\u4E00-\u9FFF]+)", text_norm)
+    venue_match = _TOKEN_VENUE_RE.search(text_norm)
     if venue_match:
         results["auction_venue"] = ParsedField(
             value=venue_match.group(1), confidence=0.9, bbox=bbox, raw=raw_text
         )
 
     # 開催回 + round number
-    round_match = re.search(r"開催回?\s*[:\s]*(\d+回?)", text_norm)
+    round_match = _TOKEN_ROUND_RE.search(text_norm)
     if round_match:
         round_val = round_match.group(1)
         if not round_val.endswith("回"):
@@ -519,7 +701,7 @@ def _extract_from_combined_token(
         )
 
     # 年式 + Reiwa year (R## or just digits)
-    year_match = re.search(r"年式\s*[:\s]*(R?\d{1,2})", text_norm)
+    year_match = _TOKEN_YEAR_RE.search(text_norm)
     if year_match:
         year_val = year_match.group(1)
         if not year_val.startswith("R"):
@@ -531,7 +713,7 @@ def _extract_from_combined_token(
     # 車種名/グレード - extract make/model and grade
     if "車種名" in text_norm or "グレード" in text_norm:
         # Remove the labels and get the value
-        value = re.sub(r"車種名|グレード|/", " ", text_norm).strip()
+        value = _MAKE_MODEL_LABELS_RE.sub(" ", text_norm).strip()
         if value:
             make_model, grade = _split_make_model_grade(value)
             if make_model:
@@ -545,7 +727,7 @@ def _extract_from_combined_token(
 
     # シフト/排気量 - extract transmission and engine cc
     if "シフト" in text_norm or "排気量" in text_norm or "ミッション" in text_norm:
-        value = re.sub(r"シフト|排気量|ミッション|/", " ", text_norm).strip()
+        value = _SHIFT_LABELS_RE.sub(" ", text_norm).strip()
         if value:
             trans, engine = _split_shift_engine(value)
             if trans or engine:
@@ -558,7 +740,7 @@ def _extract_from_combined_token(
     # 走行/車検 - extract mileage and inspection
     if "走行" in text_norm:
         # Remove labels
-        value = re.sub(r"走行|車検|/|距離|km|㎞", " ", text_norm, flags=re.IGNORECASE).strip()
+        value = _MILEAGE_LABELS_RE.sub(" ", text_norm).strip()
         if value:
             mileage, inspection = _split_mileage_inspection(value)
             if mileage:
@@ -573,12 +755,9 @@ def _extract_from_combined_token(
     # 色 - color
     if "色" in text_norm and len(text_norm) > 1:
         # Remove the label
-        value = re.sub(r"色|カラー", " ", text_norm).strip()
+        value = _COLOR_LABELS_RE.sub(" ", text_norm).strip()
         # Color values are typically short Japanese words
-        color_match = re.search(
-            r"(パール|ホワイト|ブラック|クロ|グレー|シルバー|レッド|ブルー|ゴールド|ベージュ)",
-            value, re.IGNORECASE
-        )
+        color_match = _COLOR_VALUE_RE.search(value)
         if color_match:
             results["color"] = ParsedField(
                 value=color_match.group(1), confidence=0.85, bbox=bbox, raw=raw_text
@@ -594,7 +773,7 @@ def _extract_from_combined_token(
     # 型式 - model code
     if "型式" in text_norm:
         # Remove labels
-        value = re.sub(r"型式|エアコン|装備|/", " ", text_norm).strip()
+        value = _MODEL_LABELS_RE.sub(" ", text_norm).strip()
         if value:
             model_code, _ = _split_model_equipment(value)
             if model_code:
@@ -615,8 +794,8 @@ def _extract_from_combined_token(
 
     # 応札額/スタート金額 - bids
     if ("応札" in text_norm or "スタート" in text_norm) and "金額" in text_norm:
-        value = re.sub(r"応札額?|スタート金額|/|万円|円", " ", text_norm).strip()
-        numbers = re.findall(r"\d[\d,]*", value)
+        value = _BID_LABELS_RE.sub(" ", text_norm).strip()
+        numbers = _NUMBER_RUN_RE.findall(value)
         if numbers:
             if len(numbers) >= 2:
                 results["final_bid"] = ParsedField(
@@ -632,7 +811,7 @@ def _extract_from_combined_token(
 
     # 評価点 - score
     if "評価" in text_norm or "点" in text_norm:
-        value = re.sub(r"評価点?|瑕疵", " ", text_norm).strip()
+        value = _SCORE_LABELS_RE.sub(" ", text_norm).strip()
         score = _extract_score_value(value)
         if score:
             results["score"] = ParsedField(
@@ -753,32 +932,18 @@ def _split_make_model_grade(value: str) -> tuple[str | None, str | None]:
 
     # Common grade patterns: alphanumeric code at start of grade
     # e.g., "CLA250", "RZ", "GTS", "NX250", etc.
-    patterns = [
-        # Grade starts with a model variant code (letters + numbers)
-        r"^(.+?)\s+([A-Z]{1,3}\d{2,4}[A-Z]?\s*.*)$",
-        # Grade starts with a short code like "RZ", "GTS", "G", "S"
-        r"^(.+?)\s+([A-Z]{1,3}(?:\s+.*)?)$",
-        # Grade with specific keywords
-        r"^(.+?)\s+(バージョン.*)$",
-        r"^(.+?)\s+(Fスポーツ.*)$",
-        r"^(.+?)\s+(Mスポ.*)$",
-        r"^(.+?)\s+(AMG.*)$",
-        r"^(.+?)\s+(レザー.*)$",
-        r"^(.+?)\s+(Cパッケージ.*)$",
-    ]
-
-    for pattern in patterns:
-        match = re.match(pattern, value, re.IGNORECASE)
+    for pattern in _GRADE_SPLIT_RES:
+        match = pattern.match(value)
         if match:
             make_model = match.group(1).strip()
             grade = match.group(2).strip()
             # Validate: make_model should contain Japanese chars or known make names
-            if re.search(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]|MB|BMW|ポル|GR", make_model):
+            if _MAKE_HINT_RE.search(make_model):
                 return make_model, grade
 
     # If no pattern matched, try splitting on common delimiters
     # Look for space followed by uppercase letter or digit
-    parts = re.split(r"\s+", value, maxsplit=1)
+    parts = _WHITESPACE_RE.split(value, maxsplit=1)
     if len(parts) == 2:
         return parts[0].strip(), parts[1].strip()
 
@@ -792,7 +957,7 @@ def _split_shift_engine(value: str) -> tuple[str | None, int | None]:
         return None, None
 
     # Find transmission type
-    trans_match = re.search(r"(AT|FA|CA|CVT|MT)", value, re.IGNORECASE)
+    trans_match = _TRANSMISSION_MT_RE.search(value)
     trans = trans_match.group(1).upper() if trans_match else None
 
     # Find engine displacement - typically 3-4 digit number
@@ -800,7 +965,7 @@ def _split_shift_engine(value: str) -> tuple[str | None, int | None]:
     if "EV" in value.upper():
         return trans, None
 
-    engine_match = re.search(r"(\d{3,4})", value)
+    engine_match = _ENGINE_CC_RE.search(value)
     engine = int(engine_match.group(1)) if engine_match else None
 
     return trans, engine
@@ -817,17 +982,17 @@ def _split_mileage_inspection(value: str) -> tuple[str | None, str | None]:
     inspection = None
 
     # Look for mileage: digits possibly with commas
-    mileage_match = re.search(r"(\d[\d,]*)", value)
+    mileage_match = _NUMBER_RUN_RE.search(value)
     if mileage_match:
         mileage = mileage_match.group(1)
 
     # Look for inspection: R + year + period + month
-    insp_match = re.search(r"R\d{1,2}[./年]\d{1,2}", value)
+    insp_match = _INSPECTION_RE.search(value)
     if insp_match:
         inspection = insp_match.group(0)
     else:
         # Try other date formats like "令和8年3月" or just digits after mileage
-        insp_match2 = re.search(r"(?:令和)?(\d{1,2})[./年](\d{1,2})", value)
+        insp_match2 = _INSPECTION_LOOSE_RE.search(value)
         if insp_match2:
             inspection = f"R{insp_match2.group(1)}.{insp_match2.group(2).zfill(2)}"
 
@@ -844,7 +1009,7 @@ def _split_model_equipment(value: str) -> tuple[str | None, str | None]:
         return None, None
 
     # Model code is typically at the start - alphanumeric pattern
-    model_match = re.match(r"^([A-Z0-9]{3,12})", value, re.IGNORECASE)
+    model_match = _MODEL_CODE_PREFIX_RE.match(value)
     if model_match:
         model_code = model_match.group(1)
         remainder = value[len(model_code):].strip()
@@ -852,14 +1017,8 @@ def _split_model_equipment(value: str) -> tuple[str | None, str | None]:
         return model_code, equipment
 
     # If no clear alphanumeric prefix, look for model code pattern anywhere
-    model_patterns = [
-        r"(\d{5,6}[A-Z])",  # Like 118347M
-        r"([A-Z]{2,4}\d{2,3}[A-Z]?)",  # Like AAZA20, VJA300W
-        r"([A-Z]{1,2}\d[A-Z]{1,2})",  # Like J1NE
-    ]
-
-    for pattern in model_patterns:
-        match = re.search(pattern, value)
+    for pattern in _MODEL_CODE_RES:
+        match = pattern.search(value)
         if match:
             return match.group(1), None
 
@@ -872,7 +1031,7 @@ def _split_bids(value: str) -> tuple[str | None, str | None]:
         return None, None
 
     # Find all numbers in the value (could be with commas or in 万円 format)
-    numbers = re.findall(r"(\d[\d,]*)", value)
+    numbers = _NUMBER_RUN_RE.findall(value)
 
     if not numbers:
         return None, None
@@ -893,13 +1052,13 @@ def _extract_score_value(value: str) -> str | None:
     value_cleaned = value.strip()
 
     # Handle "RA" or "R" scores (problem cars)
-    if re.search(r"R\s*A", value_cleaned, re.IGNORECASE):
+    if _SCORE_RA_RE.search(value_cleaned):
         return "RA"
-    if re.match(r"R$", value_cleaned, re.IGNORECASE):
+    if _SCORE_R_RE.match(value_cleaned):
         return "R"
 
     # Look for numeric score (0-5, possibly with .5)
-    score_match = re.search(r"(\d(?:\.\d)?)", value_cleaned)
+    score_match = _SCORE_DIGIT_RE.search(value_cleaned)
     if score_match:
         return score_match.group(1)
 
@@ -922,10 +1081,8 @@ def parse_sheet(tokens: list[OCRToken]) -> dict[str, ParsedField]:
     if not tokens:
         return results
 
-    rows = group_tokens_by_row(tokens)
     row_entries: list[dict[str, object]] = []
-    for row in rows:
-        row_sorted = sorted(row, key=lambda t: t.bbox[0])
+    for row_sorted in RowIndex(tokens).rows:
         row_text = " ".join([t.text for t in row_sorted if t.text])
         row_entries.append(
             {
@@ -940,14 +1097,10 @@ def parse_sheet(tokens: list[OCRToken]) -> dict[str, ParsedField]:
 
     # Try multiple strategies to find chassis number
     chassis_field = _find_labeled_value(
-        row_entries,
-        [r"車台", r"車体", r"車台No", r"車台番号", r"車両No", r"車体番号"],
-        value_regex=r"[A-HJ-NPR-Z0-9=-]{8,20}",
+        row_entries, _CHASSIS_LABEL_RE, value_regex=_CHASSIS_VALUE_RE
     )
     if not chassis_field:
-        chassis_field = _find_regex_field(
-            full_text, r"(?:車台|車体)[:\s]*([A-HJ-NPR-Z0-9=-]{8,20})"
-        )
+        chassis_field = _find_regex_field(full_text, _CHASSIS_INLINE_RE)
     if not chassis_field:
         # Use improved pattern matching for various chassis formats
         chassis_candidates = _find_chassis_patterns(full_text)
@@ -958,7 +1111,7 @@ def parse_sheet(tokens: list[OCRToken]) -> dict[str, ParsedField]:
                 value=best_candidate, confidence=0.6, bbox=None, raw=best_candidate
             )
     if not chassis_field:
-        chassis_field = _find_regex_field(full_text, r"\b([A-HJ-NPR-Z0-9=-]{8,20})\b")
+        chassis_field = _find_regex_field(full_text, _CHASSIS_ANY_RE)
 
     if chassis_field:
         normalized = _normalize_chassis_value(str(chassis_field.value))
@@ -972,21 +1125,13 @@ def parse_sheet(tokens: list[OCRToken]) -> dict[str, ParsedField]:
         results["chassis"] = chassis_field
 
     mileage_field = _find_labeled_value(
-        row_entries,
-        [r"走行", r"走行距離", r"走行km", r"走行Ｋｍ", r"走行㎞"],
-        value_regex=r"\d[\d,]*(?:\.\d+)?",
+        row_entries, _MILEAGE_LABEL_RE, value_regex=_MILEAGE_VALUE_RE
     )
     if not mileage_field:
-        mileage_field = _find_regex_field(
-            full_text, r"走行[:\s]*([0-9,]+)\s*(?:km|㎞|ｋｍ|KM)?"
-        )
+        mileage_field = _find_regex_field(full_text, _MILEAGE_INLINE_RE)
     if not mileage_field:
         # Look for patterns like "21300km" or digits followed by km suffix
-        mileage_match = re.search(
-            r"(\d{2,6})(?:km|kふ|㎞|ｋｍ|KM)",
-            normalize_text(full_text),
-            re.IGNORECASE,
-        )
+        mileage_match = _MILEAGE_SUFFIX_RE.search(normalize_text(full_text))
         if mileage_match:
             mileage_field = ParsedField(
                 value=mileage_match.group(1),
@@ -997,47 +1142,22 @@ def parse_sheet(tokens: list[OCRToken]) -> dict[str, ParsedField]:
     if mileage_field:
         results["mileage"] = mileage_field
 
-    recycle_field = _find_regex_field(
-        full_text, r"リサイクル[:\s]*([0-9,]+)\s*円"
-    )
+    recycle_field = _find_regex_field(full_text, _RECYCLE_FEE_RE)
     if recycle_field:
         results["recycle_fee"] = recycle_field
 
     inspector_field = _extract_block(
-        row_entries,
-        [r"検査員報告", r"検査報告", r"検査員コメント"],
-        stop_patterns=[
-            r"車台",
-            r"走行",
-            r"注意",
-            r"備考",
-            r"装備",
-            r"オプション",
-            r"リサイクル",
-        ],
+        row_entries, _INSPECTOR_LABEL_RES, stop_pattern=_INSPECTOR_STOP_RE
     )
     if inspector_field:
         results["inspector_report"] = inspector_field
 
-    notes_field = _extract_block(
-        row_entries,
-        [r"注意事項", r"注意", r"特記事項", r"備考"],
-        stop_patterns=[
-            r"車台",
-            r"走行",
-            r"検査員報告",
-            r"装備",
-            r"オプション",
-            r"リサイクル",
-        ],
-    )
+    notes_field = _extract_block(row_entries, _NOTES_LABEL_RES, stop_pattern=_NOTES_STOP_RE)
     if notes_field:
         results["notes"] = notes_field
 
     options_field = _extract_block(
-        row_entries,
-        [r"装備", r"オプション", r"OP", r"セールスポイント"],
-        stop_patterns=[r"車台", r"走行", r"注意", r"検査員報告", r"リサイクル"],
+        row_entries, _OPTIONS_LABEL_RES, stop_pattern=_OPTIONS_STOP_RE
     )
     if options_field:
         results["options"] = options_field
@@ -1062,7 +1182,7 @@ def build_record_fields(header: dict[str, ParsedField], sheet: dict[str, ParsedF
     data["auction_date"] = auction_date
     venue_raw = _value(header, "auction_venue")
     if venue_raw:
-        match = re.search(r"(.+?)(\d+回)", venue_raw)
+        match = _VENUE_ROUND_RE.search(venue_raw)
         if match:
             data["auction_venue"] = match.group(1).strip()
             data["auction_venue_round"] = match.group(2)
@@ -1221,7 +1341,7 @@ def _parse_lot_venue_round(
     if not text:
         return None, None, None
     cleaned = normalize_text(text)
-    match = re.match(r"(?P<lot>\d{3,8})?(?P<venue>[^\d]+)?(?P<round>\d+回)?", cleaned)
+    match = _LOT_VENUE_ROUND_RE.match(cleaned)
     if not match:
         return None, None, None
     lot = match.group("lot")
@@ -1234,13 +1354,13 @@ def _parse_lot_venue_round(
 
 def _is_clean_round(value: object) -> bool:
     text = normalize_text(str(value))
-    return bool(re.fullmatch(r"\d+回", text))
+    return bool(_CLEAN_ROUND_RE.fullmatch(text))
 
 
 def _extract_damage_codes(text: str) -> list[str]:
     if not text:
         return []
-    codes = re.findall(r"[A-Z]{1,2}\d", normalize_alnum(text))
+    codes = _DAMAGE_CODE_RE.findall(normalize_alnum(text))
     seen = []
     for code in codes:
         if code not in seen:
@@ -1283,43 +1403,27 @@ def _find_chassis_patterns(text: str) -> list[str]:
     text_norm = normalize_text(text)
 
     # Pattern 1: Standard VIN format (17 alphanumeric, no I/O/Q)
-    vin_matches = re.findall(r"[A-HJ-NPR-Z0-9]{17}", text_norm, re.IGNORECASE)
+    vin_matches = _VIN_RE.findall(text_norm)
     results.extend(vin_matches)
 
     # Pattern 2: Japanese model code format: PREFIX-SERIAL (e.g., MXUA80-0040656, VJA300-4081487)
-    jp_model_matches = re.findall(
-        r"([A-Z]{2,6}\d{1,3}[A-Z]?)[-=]?(\d{5,8})",
-        text_norm,
-        re.IGNORECASE,
-    )
+    jp_model_matches = _JP_CHASSIS_RE.findall(text_norm)
     for prefix, serial in jp_model_matches:
         results.append(f"{prefix}-{serial}")
 
     # Pattern 3: Short prefix with serial (e.g., ZN8-028109)
-    short_matches = re.findall(
-        r"([A-Z]{2,4}\d?)[-=]?(\d{5,7})",
-        text_norm,
-        re.IGNORECASE,
-    )
+    short_matches = _SHORT_CHASSIS_RE.findall(text_norm)
     for prefix, serial in short_matches:
         combined = f"{prefix}-{serial}"
         if combined not in results:
             results.append(combined)
 
     # Pattern 4: Mercedes/BMW style (e.g., W1K1183472N307785)
-    euro_matches = re.findall(
-        r"W[A-Z0-9]{2}[A-Z0-9]{11,14}",
-        text_norm,
-        re.IGNORECASE,
-    )
+    euro_matches = _EURO_VIN_RE.findall(text_norm)
     results.extend(euro_matches)
 
     # Pattern 5: Porsche style (e.g., WP0ZZZY1ZPSA85157)
-    porsche_matches = re.findall(
-        r"WP0[A-Z0-9]{14}",
-        text_norm,
-        re.IGNORECASE,
-    )
+    porsche_matches = _PORSCHE_VIN_RE.findall(text_norm)
     results.extend(porsche_matches)
 
     return results
@@ -1337,15 +1441,15 @@ def _row_bbox(tokens: list[OCRToken]) -> tuple[int, int, int, int] | None:
 
 def _find_labeled_value(
     rows: list[dict[str, object]],
-    patterns: list[str],
+    label_re: re.Pattern[str],
     *,
-    value_regex: str | None = None,
+    value_regex: re.Pattern[str] | None = None,
 ) -> ParsedField | None:
     for idx, row in enumerate(rows):
         row_tokens = row["tokens"]
         for token_index, token in enumerate(row_tokens):
             token_norm = normalize_text(token.text)
-            if any(re.search(pat, token_norm) for pat in patterns):
+            if label_re.search(token_norm):
                 value_tokens = row_tokens[token_index + 1 :]
                 value_text = " ".join([t.text for t in value_tokens if t.text]).strip()
                 value_bbox = _row_bbox(value_tokens) if value_tokens else None
@@ -1354,7 +1458,7 @@ def _find_labeled_value(
                     value_text = " ".join([t.text for t in next_tokens if t.text]).strip()
                     value_bbox = _row_bbox(next_tokens)
                 if value_regex and value_text:
-                    match = re.search(value_regex, normalize_text(value_text))
+                    match = value_regex.search(normalize_text(value_text))
                     if match:
                         value_text = match.group(0)
                 if value_text:
@@ -1367,10 +1471,10 @@ def _find_labeled_value(
     return None
 
 
-def _find_regex_field(text: str, pattern: str) -> ParsedField | None:
+def _find_regex_field(text: str, pattern: re.Pattern[str]) -> ParsedField | None:
     if not text:
         return None
-    match = re.search(pattern, normalize_text(text))
+    match = pattern.search(normalize_text(text))
     if not match:
         return None
     value = match.group(1) if match.lastindex else match.group(0)
@@ -1379,19 +1483,19 @@ def _find_regex_field(text: str, pattern: str) -> ParsedField | None:
 
 def _extract_block(
     rows: list[dict[str, object]],
-    patterns: list[str],
+    patterns: tuple[re.Pattern[str], ...],
     *,
-    stop_patterns: list[str],
+    stop_pattern: re.Pattern[str],
     max_rows: int = 6,
 ) -> ParsedField | None:
     for idx, row in enumerate(rows):
-        if any(re.search(pat, row["norm"]) for pat in patterns):
+        if any(pat.search(row["norm"]) for pat in patterns):
             lines = []
             bbox = row["bbox"]
             row_text = row["text"]
             if row_text:
                 for pat in patterns:
-                    row_text = re.sub(pat, "", row_text)
+                    row_text = pat.sub("", row_text)
                 row_text = row_text.strip(" :：")
                 if row_text:
                     lines.append(row_text)
@@ -1400,7 +1504,7 @@ def _extract_block(
                 if next_idx >= len(rows):
                     break
                 next_row = rows[next_idx]
-                if any(re.search(pat, next_row["norm"]) for pat in stop_patterns):
+                if stop_pattern.search(next_row["norm"]):
                     break
                 if next_row["text"]:
                     lines.append(next_row["text"])
@@ -1,34 +1,264 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import Iterable
+import hashlib
+import io
+import os
+import threading
+
 import cv2
 import numpy as np
 
+from worker.ocr.image_utils import rotate_image
+
 
 UPSCALE_TARGET_HEIGHT = 1500
+DENOISE_STRENGTH = 6
+CLAHE_CLIP_LIMIT = 2.0
+CLAHE_TILE_GRID = (8, 8)
+
+PREPROCESS_PARAMS = (
+    UPSCALE_TARGET_HEIGHT,
+    DENOISE_STRENGTH,
+    CLAHE_CLIP_LIMIT,
+    CLAHE_TILE_GRID,
+)
+
+# "full": cubic upscale, NL-means denoise, sharpen, CLAHE (the original pipeline).
+# "fast": linear upscale and a bilateral filter instead of NL-means, then sharpen/CLAHE.
+# "none": cubic upscale only, for clean screenshots and already-preprocessed crops.
+PREPROCESS_PROFILES = ("full", "fast", "none")
+DEFAULT_PROFILE = "full"
+_PROFILES_LIGHTEST_FIRST = ("none", "fast", "full")
+
+# Auto selection thresholds: estimated noise sigma (grey levels) and JPEG quality.
+CLEAN_NOISE_SIGMA = 1.5
+FAST_NOISE_SIGMA = 2.5
+CLEAN_JPEG_QUALITY = 92
+FAST_JPEG_QUALITY = 85
+
+# IJG standard luminance quantization table (quality 50), in natural order.
+_STD_LUMA_QTABLE = np.array(
+    [
+        16, 11, 10, 16, 24, 40, 51, 61,
+        12, 12, 14, 19, 26, 58, 60, 55,
+        14, 13, 16, 24, 40, 57, 69, 56,
+        14, 17, 22, 29, 51, 87, 80, 62,
+        18, 22, 37, 56, 68, 109, 103, 77,
+        24, 35, 55, 64, 81, 104, 113, 92,
+        49, 64, 78, 87, 103, 121, 120, 101,
+        72, 92, 95, 98, 112, 100, 103, 99,
+    ],
+    dtype=np.float64,
+)
+
+
+class PreprocessedImage(np.ndarray):
+    """Marker type for images that already went through denoise/sharpen/CLAHE.
+
+    Slices (ROI crops) keep the marker, so re-running ``preprocess_auction_image``
+    on them only applies the upscale step.  OpenCV results, ``rotate_image``
+    included, are plain arrays: pass the rotation to ``preprocess_auction_image``,
+    which checks the marker before rotating, or re-mark the rotated image.
+    """
+
+
+def mark_preprocessed(image: np.ndarray) -> np.ndarray:
+    return image.view(PreprocessedImage)
+
+
+def is_preprocessed(image: np.ndarray) -> bool:
+    return isinstance(image, PreprocessedImage)
+
+
+class _PreprocessCache:
+    """Small per-process LRU of preprocessing results keyed by pixel digest.
+
+    Bounded by entry count and by the total ``nbytes`` of the cached arrays;
+    a result larger than the byte budget is not cached at all.  Every prefork
+    worker process holds its own cache, so the byte budget is per process.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: tuple) -> np.ndarray | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple, value: np.ndarray) -> None:
+        if self._max_entries <= 0 or value.nbytes > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = value
+            self._bytes += value.nbytes
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
 
 
-def preprocess_auction_image(image: np.ndarray) -> np.ndarray:
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+# A 2000x1500 uint8 BGR page is 9 MB, so the default budget holds about seven
+# full pages or many ROI crops.
+PREPROCESS_CACHE_SIZE = _env_int("PREPROCESS_CACHE_SIZE", 8)
+PREPROCESS_CACHE_MAX_BYTES = _env_int("PREPROCESS_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+
+_CACHE = _PreprocessCache(PREPROCESS_CACHE_SIZE, PREPROCESS_CACHE_MAX_BYTES)
+
+
+def image_digest(image: np.ndarray) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str((image.shape, image.dtype.str)).encode("ascii"))
+    digest.update(np.ascontiguousarray(image).data)
+    return digest.hexdigest()
+
+
+def preprocess_auction_image(
+    image: np.ndarray, rotation: int = 0, profile: str = DEFAULT_PROFILE
+) -> np.ndarray:
     """Preprocess USS WhatsApp screenshots for OCR.
 
+    - Rotate clockwise by ``rotation`` degrees
     - Upscale to improve small text
     - Denoise JPEG artifacts
     - Sharpen
     - CLAHE on luminance channel
+
+    ``profile`` selects how much of this runs (see ``PREPROCESS_PROFILES``).
+    Images marked with ``mark_preprocessed`` (and crops of them) only get
+    the upscale.  Results are cached per process keyed by pixel digest,
+    rotation, profile and parameters, so probing the same crop again is free.
     """
+    if profile not in PREPROCESS_PROFILES:
+        raise ValueError(f"Unknown preprocessing profile: {profile}")
+    if is_preprocessed(image):
+        profile = "none"
+    key = (image_digest(image), rotation, profile, PREPROCESS_PARAMS)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    processed = _preprocess(rotate_image(np.asarray(image), rotation), profile)
+    processed = mark_preprocessed(processed)
+    processed.flags.writeable = False
+    _CACHE.put(key, processed)
+    return processed
+
+
+def select_preprocess_profile(
+    image: np.ndarray,
+    image_bytes: bytes | None = None,
+    allowed: Iterable[str] = PREPROCESS_PROFILES,
+) -> tuple[str, dict[str, float | str | None]]:
+    """Pick a profile from the estimated noise level and the JPEG quality.
+
+    Returns the profile and the measurements it was based on, including the
+    ``suggested_profile`` before ``allowed`` is applied.  A suggestion that is
+    not allowed falls back to the next heavier profile, ending at ``full``.
+    Non-JPEG sources (PNG screenshots) have no quality estimate and are judged
+    on noise alone.
+    """
+    sigma = estimate_noise_sigma(image)
+    quality = estimate_jpeg_quality(image_bytes) if image_bytes else None
+
+    if sigma < CLEAN_NOISE_SIGMA and (quality is None or quality >= CLEAN_JPEG_QUALITY):
+        suggested = "none"
+    elif sigma < FAST_NOISE_SIGMA or (quality is not None and quality >= FAST_JPEG_QUALITY):
+        suggested = "fast"
+    else:
+        suggested = "full"
+    metrics = {
+        "noise_sigma": round(sigma, 3),
+        "jpeg_quality": quality,
+        "suggested_profile": suggested,
+    }
+
+    allowed = set(allowed)
+    heavier = _PROFILES_LIGHTEST_FIRST[_PROFILES_LIGHTEST_FIRST.index(suggested) :]
+    return next((profile for profile in heavier if profile in allowed), "full"), metrics
+
+
+def estimate_noise_sigma(image: np.ndarray) -> float:
+    """Immerkaer's fast noise estimate on the grey image."""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    height, width = gray.shape[:2]
+    if height < 3 or width < 3:
+        return 0.0
+    kernel = np.array([[1, -2, 1], [-2, 4, -2], [1, -2, 1]], dtype=np.float32)
+    response = cv2.filter2D(gray.astype(np.float32), -1, kernel)[1:-1, 1:-1]
+    total = float(np.abs(response).sum())
+    return total * float(np.sqrt(0.5 * np.pi)) / (6 * (width - 2) * (height - 2))
+
+
+def estimate_jpeg_quality(image_bytes: bytes) -> int | None:
+    """Approximate IJG quality from the luminance quantization table."""
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as source:
+            tables = getattr(source, "quantization", None) or {}
+    except Exception:
+        return None
+    luma = tables.get(0)
+    if not luma or len(luma) != 64:
+        return None
+    scale = float(np.mean(np.asarray(luma, dtype=np.float64) / _STD_LUMA_QTABLE)) * 100.0
+    if scale <= 0:
+        return 100
+    quality = (200.0 - scale) / 2.0 if scale <= 100.0 else 5000.0 / scale
+    return int(round(min(max(quality, 1.0), 100.0)))
+
+
+def _preprocess(image: np.ndarray, profile: str) -> np.ndarray:
     height, width = image.shape[:2]
 
     if height < UPSCALE_TARGET_HEIGHT:
         scale = UPSCALE_TARGET_HEIGHT / height
-        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_CUBIC)
+        interpolation = cv2.INTER_LINEAR if profile == "fast" else cv2.INTER_CUBIC
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=interpolation)
+
+    if profile == "none":
+        return image
 
-    image = cv2.fastNlMeansDenoisingColored(image, h=6, hColor=6)
+    if profile == "fast":
+        image = cv2.bilateralFilter(image, d=5, sigmaColor=40, sigmaSpace=5)
+    else:
+        image = cv2.fastNlMeansDenoisingColored(
+            image, h=DENOISE_STRENGTH, hColor=DENOISE_STRENGTH
+        )
 
     kernel = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]], dtype=np.float32)
     image = cv2.filter2D(image, -1, kernel)
 
     lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
     l_channel, a_channel, b_channel = cv2.split(lab)
-    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    clahe = cv2.createCLAHE(clipLimit=CLAHE_CLIP_LIMIT, tileGridSize=CLAHE_TILE_GRID)
     l_channel = clahe.apply(l_channel)
     merged = cv2.merge([l_channel, a_channel, b_channel])
     image = cv2.cvtColor(merged, cv2.COLOR_LAB2BGR)
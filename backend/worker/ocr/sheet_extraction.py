@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import cv2
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+import numpy as np
+
 from worker.ocr.image_utils import OCRToken, crop_image
-from worker.ocr.ocr_engine import OCRResult, run_ocr
+from worker.ocr.ocr_engine import OCRResult, run_ocr, run_ocr_batch
+from worker.ocr.orientation import rank_rotations
 from worker.ocr.preprocessing import preprocess_auction_image, binarize_image
 from worker.ocr.vl_engine import run_vl_ocr
 
@@ -13,10 +15,10 @@ from worker.ocr.vl_engine import run_vl_ocr
 MIN_SHEET_TOKENS = 10
 
 
-def extract_sheet(image, sheet_bbox) -> OCRResult:
+def extract_sheet(image, sheet_bbox, vl_result: OCRResult | None = None) -> OCRResult:
     crop = crop_image(image, sheet_bbox)
 
-    best_result = run_vl_ocr(crop)
+    best_result = vl_result if vl_result is not None else run_vl_ocr(crop)
     vl_tokens = best_result.tokens
 
     vl_low_signal = len(vl_tokens) >= MIN_SHEET_TOKENS and not _vl_has_value_signal(vl_tokens)
@@ -91,16 +93,19 @@ def _run_with_fallbacks(image: np.ndarray) -> tuple[OCRResult, int, bool]:
 
 
 def _run_with_rotations(image: np.ndarray) -> tuple[OCRResult, int]:
-    prepped = preprocess_auction_image(image)
-    best = run_ocr(prepped, lang="japan")
-    best_rotation = 0
+    # Try the orientation the projection profile favours first; only when
+    # that comes back thin are the remaining rotations probed, preprocessed
+    # concurrently and OCRed in one batched predict.
+    rotations = rank_rotations(image)
+    best_rotation = rotations[0]
+    best = run_ocr(_prepare_rotation(image, best_rotation), lang="japan")
     if len(best.tokens) >= MIN_SHEET_TOKENS:
         return best, best_rotation
 
-    for rotation in (90, 180, 270):
-        rotated = _rotate_image(image, rotation)
-        rotated_prepped = preprocess_auction_image(rotated)
-        result = run_ocr(rotated_prepped, lang="japan")
+    candidates = rotations[1:]
+    with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+        prepped = list(pool.map(lambda rotation: _prepare_rotation(image, rotation), candidates))
+    for rotation, result in zip(candidates, run_ocr_batch(prepped, lang="japan")):
         if len(result.tokens) > len(best.tokens):
             best = result
             best_rotation = rotation
@@ -108,14 +113,8 @@ def _run_with_rotations(image: np.ndarray) -> tuple[OCRResult, int]:
     return best, best_rotation
 
 
-def _rotate_image(image: np.ndarray, rotation: int) -> np.ndarray:
-    if rotation == 90:
-        return cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
-    if rotation == 180:
-        return cv2.rotate(image, cv2.ROTATE_180)
-    if rotation == 270:
-        return cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
-    return image
+def _prepare_rotation(image: np.ndarray, rotation: int) -> np.ndarray:
+    return preprocess_auction_image(image, rotation=rotation)
 
 
 def _map_tokens_from_rotated(
@@ -9,10 +9,13 @@ import cv2
 import numpy as np
 
 from worker.ocr.image_utils import OCRToken, to_int_bbox
+from worker.ocr.model_client import model_server_url, remote_predict
 from worker.ocr.ocr_engine import OCRResult, get_paddle_device
 
 _VL_INSTANCE = None
 
+STACK_GAP = 16
+
 
 def _patch_paddle_tensor_int() -> None:
     try:
@@ -61,8 +64,149 @@ def _get_vl_instance():
 
 
 def run_vl_ocr(image: np.ndarray) -> OCRResult:
+    return run_vl_ocr_batch([image])[0]
+
+
+def run_vl_ocr_batch(images: list[np.ndarray]) -> list[OCRResult]:
+    """Run PaddleOCR-VL over several crops in a single ``predict`` call.
+
+    Results are returned in input order with the same tokens/meta that
+    ``run_vl_ocr`` produces for each crop on its own.
+    """
+    if not images:
+        return []
+
+    results, error = _predict_vl(images)
+    if error is not None:
+        return [_error_result(error) for _ in images]
+    return [_result_from_blocks(_vl_blocks(result)) for result in results]
+
+
+def run_vl_ocr_stacked(crops: list[np.ndarray]) -> list[OCRResult]:
+    return run_vl_ocr_stacked_batch([crops])[0]
+
+
+def run_vl_ocr_stacked_batch(groups: list[list[np.ndarray]]) -> list[list[OCRResult]]:
+    """Run one VL prediction per group of crops stacked into a single canvas.
+
+    Each group (e.g. the header and sheet ROIs of one document) is stacked
+    vertically, predicted once, and the returned blocks are split back to
+    their source crop by block centre.  Token bboxes are relative to each
+    crop, exactly as if the crop had been passed to ``run_vl_ocr``.
+    """
+    if not groups:
+        return []
+
+    stacked = [stack_crops(crops) for crops in groups]
+    results, error = _predict_vl([canvas for canvas, _ in stacked])
+    if error is not None:
+        return [[_error_result(error) for _ in crops] for crops in groups]
+
+    grouped: list[list[OCRResult]] = []
+    for result, (_, bands) in zip(results, stacked):
+        band_blocks: list[list] = [[] for _ in bands]
+        for block in _vl_blocks(result):
+            band_blocks[_band_for_block(block, bands)].append(block)
+        grouped.append(
+            [
+                _shift_result(_result_from_blocks(blocks), -band[1])
+                for blocks, band in zip(band_blocks, bands)
+            ]
+        )
+    return grouped
+
+
+def stack_crops(
+    crops: list[np.ndarray], gap: int = STACK_GAP
+) -> tuple[np.ndarray, list[tuple[int, int, int, int]]]:
+    """Stack crops top to bottom on a white canvas.
+
+    Returns the canvas and the (x0, y0, x1, y1) band each crop occupies.
+    """
+    width = max(crop.shape[1] for crop in crops)
+    height = sum(crop.shape[0] for crop in crops) + gap * (len(crops) - 1)
+    canvas = np.full((height, width, 3), 255, dtype=np.uint8)
+    bands: list[tuple[int, int, int, int]] = []
+    y = 0
+    for crop in crops:
+        crop_h, crop_w = crop.shape[:2]
+        canvas[y : y + crop_h, :crop_w] = crop
+        bands.append((0, y, crop_w, y + crop_h))
+        y += crop_h + gap
+    return canvas, bands
+
+
+def _predict_vl(images: list[np.ndarray]) -> tuple[list, Exception | None]:
+    server_url = model_server_url()
+    if server_url:
+        try:
+            return remote_predict(server_url, "vl", images), None
+        except Exception as exc:
+            return [], exc
+    return _predict_vl_local(images)
+
+
+def _predict_vl_local(images: list[np.ndarray]) -> tuple[list, Exception | None]:
     _patch_paddle_tensor_int()
     vl = _get_vl_instance()
+    predict_kwargs = _vl_predict_kwargs()
+
+    rgb_images = [cv2.cvtColor(image, cv2.COLOR_BGR2RGB) for image in images]
+    try:
+        results = list(vl.predict(rgb_images, **predict_kwargs) or [])
+    except Exception as exc:
+        return [], exc
+    return [results[idx] if idx < len(results) else None for idx in range(len(images))], None
+
+
+def predict_vl_payloads(images: list[np.ndarray]) -> list[dict]:
+    """Run VL locally and return JSON-safe results for the model server.
+
+    Each payload mirrors the ``parsing_res_list`` shape read by ``_vl_blocks``
+    so clients tokenize remote results exactly like local ones.
+    """
+    results, error = _predict_vl_local(images)
+    if error is not None:
+        raise error
+    return [
+        {"parsing_res_list": [_block_to_dict(block) for block in _vl_blocks(result)]}
+        for result in results
+    ]
+
+
+def _error_result(exc: Exception) -> OCRResult:
+    return OCRResult(
+        engine="paddleocr-vl-1.5",
+        tokens=[],
+        meta={"pipeline": "PaddleOCR-VL-1.5", "block_count": 0, "error": str(exc)},
+    )
+
+
+def _band_for_block(block, bands: list[tuple[int, int, int, int]]) -> int:
+    bbox = _coerce_bbox(*_block_geometry(block))
+    if bbox is None:
+        return 0
+    center_y = (bbox[1] + bbox[3]) / 2
+    distances = [
+        0 if y0 <= center_y < y1 else min(abs(center_y - y0), abs(center_y - y1))
+        for _, y0, _, y1 in bands
+    ]
+    return distances.index(min(distances))
+
+
+def _shift_result(result: OCRResult, dy: int) -> OCRResult:
+    tokens = [
+        OCRToken(
+            text=token.text,
+            confidence=token.confidence,
+            bbox=(token.bbox[0], token.bbox[1] + dy, token.bbox[2], token.bbox[3] + dy),
+        )
+        for token in result.tokens
+    ]
+    return OCRResult(engine=result.engine, tokens=tokens, meta=result.meta)
+
+
+def _vl_predict_kwargs() -> dict:
     predict_kwargs = {"use_queues": False, "use_ocr_for_image_block": True}
 
     max_new_tokens = os.getenv("PADDLEOCR_VL_MAX_NEW_TOKENS")
@@ -90,27 +234,12 @@ def run_vl_ocr(image: np.ndarray) -> OCRResult:
     else:
         predict_kwargs["max_pixels"] = 400000
 
-    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    try:
-        results = vl.predict([rgb_image], **predict_kwargs)
-    except Exception as exc:
-        return OCRResult(
-            engine="paddleocr-vl-1.5",
-            tokens=[],
-            meta={"pipeline": "PaddleOCR-VL-1.5", "block_count": 0, "error": str(exc)},
-        )
+    return predict_kwargs
 
-    if not results:
-        return OCRResult(
-            engine="paddleocr-vl-1.5",
-            tokens=[],
-            meta={"pipeline": "PaddleOCR-VL-1.5", "block_count": 0},
-        )
 
-    result = results[0]
-    tokens, table_meta = _tokens_from_vl_result(result)
-    block_count = _vl_block_count(result)
-    meta = {"pipeline": "PaddleOCR-VL-1.5", "block_count": block_count}
+def _result_from_blocks(blocks: list) -> OCRResult:
+    tokens, table_meta = _tokens_from_blocks(blocks)
+    meta = {"pipeline": "PaddleOCR-VL-1.5", "block_count": len(blocks)}
     if table_meta:
         meta.update(table_meta)
     return OCRResult(
@@ -120,33 +249,68 @@ def run_vl_ocr(image: np.ndarray) -> OCRResult:
     )
 
 
-def _vl_block_count(result) -> int:
+def _vl_blocks(result) -> list:
+    if result is None:
+        return []
     if hasattr(result, "get"):
-        blocks = result.get("parsing_res_list") or []
-    else:
-        blocks = getattr(result, "parsing_res_list", None) or []
-    return len(blocks)
+        return list(result.get("parsing_res_list") or [])
+    return list(getattr(result, "parsing_res_list", None) or [])
 
 
-def _tokens_from_vl_result(result) -> tuple[list[OCRToken], dict]:
-    if hasattr(result, "get"):
-        blocks = result.get("parsing_res_list") or []
+def _block_geometry(block) -> tuple:
+    if isinstance(block, dict):
+        bbox = _first_present(block, "block_bbox", "bbox")
+        polygon = _first_present(block, "block_polygon_points", "polygon_points")
     else:
-        blocks = getattr(result, "parsing_res_list", None) or []
+        bbox = getattr(block, "bbox", None)
+        polygon = getattr(block, "polygon_points", None)
+    return bbox, polygon
+
+
+def _first_present(block: dict, *keys: str):
+    for key in keys:
+        value = block.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _block_text(block) -> tuple:
+    if isinstance(block, dict):
+        return (
+            _first_present(block, "block_label", "label"),
+            _first_present(block, "block_content", "content"),
+        )
+    return getattr(block, "label", None), getattr(block, "content", None)
+
+
+def _block_to_dict(block) -> dict:
+    label, content = _block_text(block)
+    bbox, polygon = _block_geometry(block)
+    return {
+        "block_label": label,
+        "block_content": None if content is None else str(content),
+        "block_bbox": _to_list(bbox),
+        "block_polygon_points": _to_list(polygon),
+    }
+
+
+def _to_list(value):
+    if value is None:
+        return None
+    try:
+        return np.asarray(value, dtype=float).tolist()
+    except (TypeError, ValueError):
+        return None
+
+
+def _tokens_from_blocks(blocks: list) -> tuple[list[OCRToken], dict]:
     tokens: list[OCRToken] = []
     table_cells: dict[str, str] = {}
     table_cell_count = 0
     for block in blocks:
-        if isinstance(block, dict):
-            label = block.get("block_label") or block.get("label")
-            content = block.get("block_content") or block.get("content")
-            bbox = block.get("block_bbox") or block.get("bbox")
-            polygon = block.get("block_polygon_points") or block.get("polygon_points")
-        else:
-            label = getattr(block, "label", None)
-            content = getattr(block, "content", None)
-            bbox = getattr(block, "bbox", None)
-            polygon = getattr(block, "polygon_points", None)
+        label, content = _block_text(block)
+        bbox, polygon = _block_geometry(block)
 
         if label in {"chart", "header_image", "footer_image"}:
             continue
@@ -322,9 +486,9 @@ def _tokens_from_table_rows(
 def _coerce_bbox(
     bbox: list | tuple | None, polygon: Iterable[Iterable[float]] | None
 ) -> tuple[int, int, int, int] | None:
-    if bbox and len(bbox) == 4:
+    if bbox is not None and len(bbox) == 4:
         return (int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3]))
-    if polygon:
+    if polygon is not None and len(polygon):
         try:
             return to_int_bbox(polygon)
         except Exception:
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import logging
+import time
+
+import numpy as np
+
+from worker.ocr.model_client import model_server_url
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up_models() -> dict[str, float]:
+    """Build the PaddleOCR-VL and PaddleOCR predictors and run one dummy predict each.
+
+    Returns the seconds spent per model.  Nothing is loaded when inference is
+    delegated to a model server (``OCR_MODEL_SERVER_URL``).
+    """
+    if model_server_url():
+        logger.info("OCR model server configured; skipping local model warm-up")
+        return {}
+
+    from worker.ocr.ocr_engine import _get_paddle_instance, _run_paddle_batch
+    from worker.ocr.vl_engine import _get_vl_instance, predict_vl_payloads
+
+    image = _synthetic_image()
+    timings: dict[str, float] = {}
+    steps = (
+        ("paddleocr-vl", _get_vl_instance, lambda: predict_vl_payloads([image])),
+        (
+            "paddleocr",
+            lambda: _get_paddle_instance("japan"),
+            lambda: _run_paddle_batch([image], "japan"),
+        ),
+    )
+    for name, load, predict in steps:
+        started = time.perf_counter()
+        try:
+            load()
+            loaded = time.perf_counter()
+            predict()
+        except Exception:
+            logger.exception("Warm-up of %s failed", name)
+            continue
+        timings[name] = time.perf_counter() - started
+        logger.info(
+            "Warmed up %s in %.1fs (load %.1fs, first predict %.1fs)",
+            name,
+            timings[name],
+            loaded - started,
+            time.perf_counter() - loaded,
+        )
+    return timings
+
+
+def _synthetic_image() -> np.ndarray:
+    import cv2
+
+    image = np.full((64, 256, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "R5 12345", (8, 44), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (0, 0, 0), 2)
+    return image
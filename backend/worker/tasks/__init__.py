@@ -1,7 +1,19 @@
 from .extract import extract
-from .ocr import ocr
+from .market_stats import refresh_market_stats
+from .ocr import ocr, ocr_batch
+from .pipeline import dispatch_documents, process_document
 from .preprocess import preprocess
 from .validate import validate
 from .watchdog import watchdog_stuck_documents
 
-__all__ = ["preprocess", "ocr", "extract", "validate", "watchdog_stuck_documents"]
+__all__ = [
+    "preprocess",
+    "ocr",
+    "ocr_batch",
+    "extract",
+    "validate",
+    "process_document",
+    "dispatch_documents",
+    "watchdog_stuck_documents",
+    "refresh_market_stats",
+]
@@ -8,13 +8,15 @@ from app.db.session_sync import get_session
 from app.models.document import Document
 from app.models.record import AuctionRecord
 from app.services.storage import storage_client
-from worker.ocr import OCRToken, decode_image, encode_png
+from worker.ocr import OCRToken, encode_png
 from worker.ocr.image_utils import crop_image
+from worker.ocr.intermediate import decode_intermediate
 from worker.ocr.parsing import (
     build_record_fields,
     merge_fields,
+    missing_p0,
     parse_header,
-    parse_header_cells,
+    parse_primary_header,
     parse_sheet,
     parse_mileage,
 )
@@ -22,7 +24,6 @@ from worker.ocr.parsing import (
 
 P0_FIELDS = {"lot_no", "auction_date", "auction_venue", "score", "final_bid_yen"}
 P0_FIELD_CONF_MAP = {"final_bid_yen": "final_bid"}
-P0_HEADER_KEYS = {"lot_no", "auction_date", "auction_venue", "score"}
 
 
 @celery_app.task(bind=True, max_retries=2, queue="extract", time_limit=120, soft_time_limit=90)
@@ -43,84 +44,7 @@ def extract(self, document_id: str):
             ocr_data = {"header": {"tokens": []}, "sheet": {"tokens": []}}
 
         try:
-            header_tokens = [
-                OCRToken(
-                    text=token["text"],
-                    confidence=float(token.get("confidence", 0.0)),
-                    bbox=tuple(token.get("bbox", [0, 0, 0, 0])),
-                )
-                for token in ocr_data.get("header", {}).get("tokens", [])
-            ]
-            fallback_tokens = [
-                OCRToken(
-                    text=token["text"],
-                    confidence=float(token.get("confidence", 0.0)),
-                    bbox=tuple(token.get("bbox", [0, 0, 0, 0])),
-                )
-                for token in ocr_data.get("header", {}).get("fallback", {}).get("tokens", [])
-            ]
-            sheet_tokens = [
-                OCRToken(
-                    text=token["text"],
-                    confidence=float(token.get("confidence", 0.0)),
-                    bbox=tuple(token.get("bbox", [0, 0, 0, 0])),
-                )
-                for token in ocr_data.get("sheet", {}).get("tokens", [])
-            ]
-
-            header_fields_line = parse_header(header_tokens)
-            header_fields = header_fields_line
-            table_cells = ocr_data.get("header", {}).get("table_cells") or {}
-            table_cell_count = int(ocr_data.get("header", {}).get("table_cell_count") or 0)
-            if table_cells and table_cell_count >= 8:
-                header_fields_table = parse_header_cells(table_cells)
-                header_fields = merge_fields(header_fields_table, header_fields_line)
-
-            if _missing_p0(header_fields) and fallback_tokens:
-                header_fields_fallback = parse_header(fallback_tokens)
-                header_fields = merge_fields(header_fields_fallback, header_fields_line)
-
-            sheet_fields = parse_sheet(sheet_tokens)
-            record_data = build_record_fields(header_fields, sheet_fields)
-
-            full_text = " ".join([token.text for token in header_tokens + sheet_tokens])
-            record_data["full_text"] = full_text
-
-            evidence = {}
-            sheet_mileage_km = None
-            sheet_mileage_raw = None
-            if "mileage" in sheet_fields and sheet_fields["mileage"].value:
-                sheet_mileage_raw = str(sheet_fields["mileage"].value)
-                sheet_mileage_km, _, _ = parse_mileage(sheet_mileage_raw)
-            try:
-                if doc.preprocessed_path:
-                    image_bytes = storage_client.download_bytes(doc.preprocessed_path)
-                    image = decode_image(image_bytes)
-                    evidence = build_evidence(document_id, image, header_fields, sheet_fields)
-            except Exception:
-                evidence = {}
-
-            record = (
-                session.query(AuctionRecord)
-                .filter(AuctionRecord.document_id == doc.id)
-                .one_or_none()
-            )
-            if not record:
-                record = AuctionRecord(document_id=doc.id)
-                session.add(record)
-
-            for key, value in record_data.items():
-                setattr(record, key, value)
-
-            record.evidence = _with_evidence_meta(
-                evidence,
-                header_engine=ocr_data.get("header", {}).get("engine"),
-                sheet_engine=ocr_data.get("sheet", {}).get("engine"),
-                sheet_mileage_km=sheet_mileage_km,
-                sheet_mileage_raw=sheet_mileage_raw,
-            )
-            record.overall_confidence = compute_overall_confidence(header_fields)
-
+            extract_document(session, doc, ocr_data, _load_evidence_image(doc))
             doc.status = "validating"
             session.commit()
         except Exception as exc:
@@ -136,6 +60,72 @@ def extract(self, document_id: str):
     return {"status": "queued", "document_id": document_id}
 
 
+def extract_document(
+    session, doc: Document, ocr_data: dict, image=None, upload=None
+) -> AuctionRecord:
+    """Parse an ``ocr_raw`` payload into the document's ``AuctionRecord``.
+
+    Evidence crops are cut from ``image`` (the preprocessed page) when given
+    and written with ``upload``, which defaults to a synchronous storage upload.
+    """
+    header_tokens = _tokens(ocr_data.get("header", {}).get("tokens", []))
+    fallback_tokens = _tokens(ocr_data.get("header", {}).get("fallback", {}).get("tokens", []))
+    sheet_tokens = _tokens(ocr_data.get("sheet", {}).get("tokens", []))
+
+    header_fields_line = parse_header(header_tokens)
+    header_fields = parse_primary_header(
+        header_tokens,
+        ocr_data.get("header", {}).get("table_cells") or {},
+        int(ocr_data.get("header", {}).get("table_cell_count") or 0),
+    )
+
+    if missing_p0(header_fields) and fallback_tokens:
+        header_fields_fallback = parse_header(fallback_tokens)
+        header_fields = merge_fields(header_fields_fallback, header_fields_line)
+
+    sheet_fields = parse_sheet(sheet_tokens)
+    record_data = build_record_fields(header_fields, sheet_fields)
+
+    full_text = " ".join([token.text for token in header_tokens + sheet_tokens])
+    record_data["full_text"] = full_text
+
+    evidence = {}
+    sheet_mileage_km = None
+    sheet_mileage_raw = None
+    if "mileage" in sheet_fields and sheet_fields["mileage"].value:
+        sheet_mileage_raw = str(sheet_fields["mileage"].value)
+        sheet_mileage_km, _, _ = parse_mileage(sheet_mileage_raw)
+    try:
+        if image is not None:
+            evidence = build_evidence(
+                str(doc.id), image, header_fields, sheet_fields, upload=upload
+            )
+    except Exception:
+        evidence = {}
+
+    record = (
+        session.query(AuctionRecord)
+        .filter(AuctionRecord.document_id == doc.id)
+        .one_or_none()
+    )
+    if not record:
+        record = AuctionRecord(document_id=doc.id)
+        session.add(record)
+
+    for key, value in record_data.items():
+        setattr(record, key, value)
+
+    record.evidence = _with_evidence_meta(
+        evidence,
+        header_engine=ocr_data.get("header", {}).get("engine"),
+        sheet_engine=ocr_data.get("sheet", {}).get("engine"),
+        sheet_mileage_km=sheet_mileage_km,
+        sheet_mileage_raw=sheet_mileage_raw,
+    )
+    record.overall_confidence = compute_overall_confidence(header_fields)
+    return record
+
+
 def compute_overall_confidence(header_fields: dict) -> float | None:
     confidences = [field.confidence for field in header_fields.values() if field.confidence]
     if not confidences:
@@ -184,7 +174,10 @@ def evaluate_review_policy(
     return False, None
 
 
-def build_evidence(document_id: str, image, header_fields: dict, sheet_fields: dict) -> dict:
+def build_evidence(
+    document_id: str, image, header_fields: dict, sheet_fields: dict, upload=None
+) -> dict:
+    upload = upload or storage_client.upload_bytes
     evidence = {}
     for source, fields in ("header", header_fields), ("sheet", sheet_fields):
         for key, field in fields.items():
@@ -196,22 +189,32 @@ def build_evidence(document_id: str, image, header_fields: dict, sheet_fields: d
             if field.bbox is not None:
                 crop_key = f"evidence/{document_id}/{source}_{key}.png"
                 crop = crop_image(image, field.bbox)
-                storage_client.upload_bytes(crop_key, encode_png(crop), "image/png")
+                upload(crop_key, encode_png(crop), "image/png")
                 entry["bbox"] = list(field.bbox)
                 entry["crop_path"] = crop_key
             evidence[key] = entry
     return evidence
 
 
-def _missing_p0(fields: dict[str, object]) -> bool:
-    if any(key not in fields or not getattr(fields[key], "value", None) for key in P0_HEADER_KEYS):
-        return True
-    has_bid = False
-    for key in ("final_bid", "bid_start"):
-        if key in fields and getattr(fields[key], "value", None):
-            has_bid = True
-            break
-    return not has_bid
+def _tokens(payload: list[dict]) -> list[OCRToken]:
+    return [
+        OCRToken(
+            text=token["text"],
+            confidence=float(token.get("confidence", 0.0)),
+            bbox=tuple(token.get("bbox", [0, 0, 0, 0])),
+        )
+        for token in payload
+    ]
+
+
+def _load_evidence_image(doc: Document):
+    if not doc.preprocessed_path:
+        return None
+    try:
+        image_bytes = storage_client.download_bytes(doc.preprocessed_path)
+        return decode_intermediate(image_bytes, doc.preprocessed_format)
+    except Exception:
+        return None
 
 
 def _field_confidence(evidence: dict, field: str) -> float:
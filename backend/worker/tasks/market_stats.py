@@ -0,0 +1,12 @@
+from worker.celery_app import celery_app
+from app.db.session_sync import get_session
+from app.services.market_stats import REFRESH_SQL
+
+
+@celery_app.task(queue="maintenance", time_limit=1800, soft_time_limit=1740)
+def refresh_market_stats():
+    """Rebuild market_price_stats without blocking readers of the previous contents."""
+    with get_session() as session:
+        session.execute(REFRESH_SQL)
+        session.commit()
+    return {"status": "ok"}
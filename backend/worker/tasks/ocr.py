@@ -1,10 +1,22 @@
 import json
 
+from celery.exceptions import SoftTimeLimitExceeded
+
 from worker.celery_app import celery_app
+from app.config import settings
 from app.db.session_sync import get_session
 from app.models.document import Document
 from app.services.storage import storage_client
-from worker.ocr import decode_image, detect_rois, extract_header, extract_sheet
+from worker.ocr import (
+    detect_rois,
+    extract_header,
+    extract_sheet,
+    run_vl_ocr_batch,
+    run_vl_ocr_stacked_batch,
+)
+from worker.ocr.image_utils import crop_image
+from worker.ocr.intermediate import decode_intermediate
+from worker.ocr.preprocessing import mark_preprocessed
 
 
 @celery_app.task(bind=True, max_retries=2, queue="gpu_ocr", time_limit=480, soft_time_limit=420)
@@ -18,68 +30,8 @@ def ocr(self, document_id: str):
         session.commit()
 
         try:
-            if not doc.preprocessed_path:
-                raise ValueError("Missing preprocessed_path")
-            image_bytes = storage_client.download_bytes(doc.preprocessed_path)
-            image = decode_image(image_bytes)
-
-            if not doc.roi:
-                rois = detect_rois(image)
-                header_bbox = rois.header_bbox
-                sheet_bbox = rois.sheet_bbox
-            else:
-                header_bbox = tuple(doc.roi.get("header_bbox"))
-                sheet_bbox = tuple(doc.roi.get("sheet_bbox"))
-
-            header_result = extract_header(image, header_bbox)
-            sheet_result = extract_sheet(image, sheet_bbox)
-            doc.model_version = doc.model_version or header_result.primary.engine
-
-            ocr_results = {
-                "header": {
-                    "engine": header_result.primary.engine,
-                    "tokens": [
-                        {
-                            "text": token.text,
-                            "confidence": token.confidence,
-                            "bbox": list(token.bbox),
-                        }
-                        for token in header_result.primary.tokens
-                    ],
-                    "bbox": list(header_bbox),
-                    "table_cells": header_result.table_cells,
-                    "table_cell_count": header_result.table_cell_count,
-                    "method": header_result.method,
-                },
-                "sheet": {
-                    "engine": sheet_result.engine,
-                    "meta": sheet_result.meta,
-                    "tokens": [
-                        {
-                            "text": token.text,
-                            "confidence": token.confidence,
-                            "bbox": list(token.bbox),
-                        }
-                        for token in sheet_result.tokens
-                    ],
-                    "bbox": list(sheet_bbox),
-                },
-            }
-            if header_result.fallback:
-                ocr_results["header"]["fallback"] = {
-                    "engine": header_result.fallback.engine,
-                    "tokens": [
-                        {
-                            "text": token.text,
-                            "confidence": token.confidence,
-                            "bbox": list(token.bbox),
-                        }
-                        for token in header_result.fallback.tokens
-                    ],
-                }
-
-            key = f"ocr_raw/{document_id}.json"
-            storage_client.upload_bytes(key, json.dumps(ocr_results).encode("utf-8"), "application/json")
+            image = _load_preprocessed(doc)
+            _store_ocr_results(document_id, ocr_document(doc, image))
         except Exception as exc:
             doc.status = "failed"
             doc.error_message = str(exc)
@@ -91,3 +43,200 @@ def ocr(self, document_id: str):
 
     extract.delay(document_id)
     return {"status": "queued", "document_id": document_id}
+
+
+@celery_app.task(bind=True, queue="gpu_ocr", time_limit=900, soft_time_limit=840)
+def ocr_batch(self):
+    """Claim up to ``OCR_BATCH_SIZE`` waiting documents and OCR them as one micro-batch.
+
+    Each ``preprocess`` run in batch mode enqueues one of these triggers, so
+    every waiting document is drained even when a trigger finds the queue
+    already emptied by an earlier batch.
+    """
+    with get_session() as session:
+        docs = (
+            session.query(Document)
+            .filter(Document.status == "ocr_queued")
+            .order_by(Document.updated_at)
+            .limit(max(settings.OCR_BATCH_SIZE, 1))
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        if not docs:
+            return {"status": "empty", "document_ids": []}
+
+        for doc in docs:
+            doc.status = "ocr"
+        session.commit()
+
+        done: list[str] = []
+        try:
+            _ocr_claimed_documents(session, docs, done)
+        except SoftTimeLimitExceeded:
+            # Hand unfinished claims back before the hard limit kills the process;
+            # otherwise they sit in "ocr" until the watchdog sends them to review.
+            _release_batch_documents(session, docs, done)
+            _enqueue_extract(done)
+            ocr_batch.delay()
+            raise
+        session.commit()
+
+    _enqueue_extract(done)
+    return {"status": "queued", "document_ids": done}
+
+
+def ocr_document(doc: Document, image) -> dict:
+    """OCR the header and sheet ROIs of a preprocessed image.
+
+    Returns the ``ocr_raw`` payload and records the model version on ``doc``.
+    """
+    header_bbox, sheet_bbox = _resolve_rois(doc, image)
+
+    header_vl = sheet_vl = None
+    if settings.OCR_VL_MODE == "stacked":
+        header_vl, sheet_vl = run_vl_for_rois(
+            [[crop_image(image, header_bbox), crop_image(image, sheet_bbox)]]
+        )[0]
+
+    header_result = extract_header(
+        image,
+        header_bbox,
+        vl_result=header_vl,
+        fallback_policy=settings.OCR_HEADER_FALLBACK,
+    )
+    sheet_result = extract_sheet(image, sheet_bbox, vl_result=sheet_vl)
+    doc.model_version = doc.model_version or header_result.primary.engine
+    return build_ocr_results(header_bbox, sheet_bbox, header_result, sheet_result)
+
+
+def run_vl_for_rois(crop_pairs: list[list]) -> list[tuple]:
+    """Run VL for [header_crop, sheet_crop] pairs in one model call.
+
+    Returns a (header, sheet) OCRResult pair per input, honouring ``OCR_VL_MODE``.
+    """
+    if settings.OCR_VL_MODE == "stacked":
+        return [tuple(pair) for pair in run_vl_ocr_stacked_batch(crop_pairs)]
+    flat = run_vl_ocr_batch([crop for pair in crop_pairs for crop in pair])
+    return [(flat[2 * idx], flat[2 * idx + 1]) for idx in range(len(crop_pairs))]
+
+
+def build_ocr_results(header_bbox, sheet_bbox, header_result, sheet_result) -> dict:
+    ocr_results = {
+        "header": {
+            "engine": header_result.primary.engine,
+            "tokens": _tokens_payload(header_result.primary.tokens),
+            "bbox": list(header_bbox),
+            "table_cells": header_result.table_cells,
+            "table_cell_count": header_result.table_cell_count,
+            "method": header_result.method,
+            "meta": {"fallback_skipped": header_result.fallback_skipped},
+        },
+        "sheet": {
+            "engine": sheet_result.engine,
+            "meta": sheet_result.meta,
+            "tokens": _tokens_payload(sheet_result.tokens),
+            "bbox": list(sheet_bbox),
+        },
+    }
+    if header_result.fallback:
+        ocr_results["header"]["fallback"] = {
+            "engine": header_result.fallback.engine,
+            "tokens": _tokens_payload(header_result.fallback.tokens),
+        }
+    return ocr_results
+
+
+def _tokens_payload(tokens) -> list[dict]:
+    return [
+        {
+            "text": token.text,
+            "confidence": token.confidence,
+            "bbox": list(token.bbox),
+        }
+        for token in tokens
+    ]
+
+
+def _load_preprocessed(doc: Document):
+    if not doc.preprocessed_path:
+        raise ValueError("Missing preprocessed_path")
+    image_bytes = storage_client.download_bytes(doc.preprocessed_path)
+    return mark_preprocessed(decode_intermediate(image_bytes, doc.preprocessed_format))
+
+
+def _resolve_rois(doc: Document, image):
+    if not doc.roi:
+        rois = detect_rois(image)
+        return rois.header_bbox, rois.sheet_bbox
+    return tuple(doc.roi.get("header_bbox")), tuple(doc.roi.get("sheet_bbox"))
+
+
+def _store_ocr_results(document_id: str, ocr_results: dict) -> None:
+    key = f"ocr_raw/{document_id}.json"
+    storage_client.upload_bytes(key, json.dumps(ocr_results).encode("utf-8"), "application/json")
+
+
+def _fail_batch_document(session, doc: Document, exc: Exception) -> None:
+    doc.status = "failed"
+    doc.error_message = str(exc)
+    doc.retry_count = (doc.retry_count or 0) + 1
+    session.commit()
+    if doc.retry_count <= ocr.max_retries:
+        ocr.apply_async(args=[str(doc.id)], countdown=120)
+
+
+def _ocr_claimed_documents(session, docs: list[Document], done: list[str]) -> None:
+    """OCR claimed documents as one VL batch, appending finished ids to ``done``.
+
+    Per-document errors fail only that document; the soft time limit is left
+    to propagate so the caller can release the rest of the batch.
+    """
+    jobs = []
+    crop_pairs = []
+    for doc in docs:
+        try:
+            image = _load_preprocessed(doc)
+            header_bbox, sheet_bbox = _resolve_rois(doc, image)
+            crop_pairs.append([crop_image(image, header_bbox), crop_image(image, sheet_bbox)])
+            jobs.append((doc, image, header_bbox, sheet_bbox))
+        except SoftTimeLimitExceeded:
+            raise
+        except Exception as exc:
+            _fail_batch_document(session, doc, exc)
+
+    vl_results = run_vl_for_rois(crop_pairs)
+
+    for (doc, image, header_bbox, sheet_bbox), (header_vl, sheet_vl) in zip(jobs, vl_results):
+        try:
+            header_result = extract_header(
+                image,
+                header_bbox,
+                vl_result=header_vl,
+                fallback_policy=settings.OCR_HEADER_FALLBACK,
+            )
+            sheet_result = extract_sheet(image, sheet_bbox, vl_result=sheet_vl)
+            doc.model_version = doc.model_version or header_result.primary.engine
+            _store_ocr_results(
+                str(doc.id),
+                build_ocr_results(header_bbox, sheet_bbox, header_result, sheet_result),
+            )
+            done.append(str(doc.id))
+        except SoftTimeLimitExceeded:
+            raise
+        except Exception as exc:
+            _fail_batch_document(session, doc, exc)
+
+
+def _release_batch_documents(session, docs: list[Document], done: list[str]) -> None:
+    """Return claimed documents that were neither finished nor failed to ``ocr_queued``."""
+    for doc in docs:
+        if doc.status == "ocr" and str(doc.id) not in done:
+            doc.status = "ocr_queued"
+    session.commit()
+
+
+def _enqueue_extract(document_ids: list[str]) -> None:
+    from worker.tasks.extract import extract
+
+    for document_id in document_ids:
+        extract.delay(document_id)
@@ -0,0 +1,128 @@
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable
+
+from worker.celery_app import celery_app
+from app.config import settings
+from app.db.session_sync import get_session
+from app.models.document import Document
+from app.services.storage import storage_client
+from worker.ocr.intermediate import FORMAT_CONTENT_TYPES, intermediate_key
+from worker.tasks.extract import extract_document
+from worker.tasks.ocr import ocr_document
+from worker.tasks.preprocess import encode_preprocessed, preprocess, preprocess_document
+from worker.tasks.validate import validate_record
+
+
+ARTIFACT_UPLOAD_THREADS = 4
+
+_UPLOAD_POOL = ThreadPoolExecutor(
+    max_workers=ARTIFACT_UPLOAD_THREADS, thread_name_prefix="artifact-upload"
+)
+
+
+class ArtifactWriter:
+    """Uploads pipeline artifacts on a shared thread pool while the stages keep running.
+
+    ``upload`` matches ``StorageClient.upload_bytes`` but also accepts a
+    zero-argument callable for the payload, so encoding happens off the
+    task thread too.  ``flush`` waits for every upload and re-raises the
+    first failure.
+    """
+
+    def __init__(self) -> None:
+        self._futures: list[Future] = []
+
+    def upload(self, key: str, data: bytes | Callable[[], bytes], content_type: str) -> None:
+        self._futures.append(_UPLOAD_POOL.submit(_upload, key, data, content_type))
+
+    def flush(self) -> None:
+        futures, self._futures = self._futures, []
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+
+
+def _upload(key: str, data: bytes | Callable[[], bytes], content_type: str) -> None:
+    payload = data() if callable(data) else data
+    storage_client.upload_bytes(key, payload, content_type)
+
+
+@celery_app.task(queue="default", time_limit=60, soft_time_limit=45)
+def dispatch_documents(document_ids: list[str]):
+    """Start the pipeline for documents enqueued together, e.g. by a batch upload."""
+    for document_id in document_ids:
+        if settings.PIPELINE_MODE == "fused":
+            process_document.delay(document_id)
+        else:
+            preprocess.delay(document_id)
+    return {"status": "queued", "document_ids": document_ids}
+
+
+@celery_app.task(bind=True, max_retries=2, queue="gpu_ocr", time_limit=780, soft_time_limit=720)
+def process_document(self, document_id: str, skip_duplicate_check: bool = False):
+    """Run preprocess, OCR, extract and validate for one document in a single task.
+
+    The preprocessed image and the OCR tokens stay in memory between stages
+    instead of round-tripping through storage.  The preprocessed PNG,
+    ``ocr_raw`` JSON and evidence crops are still written, in the background,
+    and the document only reaches ``done``/``review`` once they are stored.
+    """
+    with get_session() as session:
+        doc = session.get(Document, document_id)
+        if not doc:
+            return {"status": "missing", "document_id": document_id}
+
+        doc.status = "preprocessing"
+        doc.processing_started_at = doc.processing_started_at or datetime.now(timezone.utc)
+        doc.pipeline_version = doc.pipeline_version or settings.PIPELINE_VERSION
+        session.commit()
+
+        writer = ArtifactWriter()
+        try:
+            processed = preprocess_document(
+                doc,
+                upload=writer.upload,
+                session=session,
+                check_duplicates=not skip_duplicate_check,
+            )
+            if processed is None:
+                writer.flush()
+                session.commit()
+                return {"status": "duplicate", "document_id": document_id}
+            fmt = settings.PREPROCESSED_FORMAT
+            preprocessed_key = intermediate_key("preprocessed", str(doc.id), fmt)
+            writer.upload(
+                preprocessed_key,
+                lambda: encode_preprocessed(processed, fmt),
+                FORMAT_CONTENT_TYPES[fmt],
+            )
+            doc.status = "ocr"
+            session.commit()
+
+            ocr_data = ocr_document(doc, processed)
+            writer.upload(
+                f"ocr_raw/{document_id}.json",
+                lambda: json.dumps(ocr_data).encode("utf-8"),
+                "application/json",
+            )
+            doc.status = "extracting"
+            session.commit()
+
+            record = extract_document(session, doc, ocr_data, processed, upload=writer.upload)
+            writer.flush()
+            doc.preprocessed_path = preprocessed_key
+            doc.preprocessed_format = fmt
+            validate_record(doc, record)
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            doc.status = "failed"
+            doc.error_message = str(exc)
+            doc.retry_count = (doc.retry_count or 0) + 1
+            session.commit()
+            raise self.retry(exc=exc, countdown=60)
+
+    return {"status": "done", "document_id": document_id}
@@ -1,15 +1,31 @@
+import logging
 from datetime import datetime, timezone
 
+from sqlalchemy import Select, func, select, tuple_
+
 from worker.celery_app import celery_app
 from app.config import settings
 from app.db.session_sync import get_session
 from app.models.document import Document
 from app.services.storage import storage_client
-from worker.ocr import decode_image, detect_rois, encode_png, preprocess_auction_image
+from worker.ocr import decode_image, detect_rois, preprocess_auction_image
+from worker.ocr.image_utils import (
+    hamming_distance,
+    perceptual_hash,
+    phash_bands,
+    render_thumbnails,
+)
+from worker.ocr.intermediate import FORMAT_CONTENT_TYPES, encode_intermediate, intermediate_key
+from worker.ocr.preprocessing import select_preprocess_profile
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory_xact_lock key serialising near-duplicate checks across workers.
+NEAR_DUPLICATE_LOCK_ID = 0x6E647570  # "ndup"
 
 
 @celery_app.task(bind=True, max_retries=3, queue="cpu_preprocess", time_limit=120, soft_time_limit=90)
-def preprocess(self, document_id: str):
+def preprocess(self, document_id: str, skip_duplicate_check: bool = False):
     with get_session() as session:
         doc = session.get(Document, document_id)
         if not doc:
@@ -21,26 +37,20 @@ def preprocess(self, document_id: str):
         session.commit()
 
         try:
-            source_key = doc.original_path
-            if not source_key:
-                raise ValueError("Missing original_path")
-
-            image_bytes = storage_client.download_bytes(source_key)
-            image = decode_image(image_bytes)
-            processed = preprocess_auction_image(image)
-
-            rois = detect_rois(processed)
-            doc.roi = {
-                "header_bbox": list(rois.header_bbox),
-                "sheet_bbox": list(rois.sheet_bbox),
-                "photos_bbox": list(rois.photos_bbox) if rois.photos_bbox else None,
-                "roi_version": rois.roi_version,
-            }
-
-            preprocessed_key = f"preprocessed/{doc.id}.png"
-            storage_client.upload_bytes(preprocessed_key, encode_png(processed), "image/png")
+            processed = preprocess_document(
+                doc, session=session, check_duplicates=not skip_duplicate_check
+            )
+            if processed is None:
+                session.commit()
+                return {"status": "duplicate", "document_id": document_id}
+            fmt = settings.PREPROCESSED_FORMAT
+            preprocessed_key = intermediate_key("preprocessed", str(doc.id), fmt)
+            storage_client.upload_bytes(
+                preprocessed_key, encode_preprocessed(processed, fmt), FORMAT_CONTENT_TYPES[fmt]
+            )
             doc.preprocessed_path = preprocessed_key
-            doc.status = "ocr"
+            doc.preprocessed_format = fmt
+            doc.status = "ocr_queued" if settings.OCR_BATCH_SIZE > 1 else "ocr"
             session.commit()
         except Exception as exc:
             doc.status = "failed"
@@ -49,7 +59,125 @@ def preprocess(self, document_id: str):
             session.commit()
             raise self.retry(exc=exc, countdown=60)
 
-    from worker.tasks.ocr import ocr
+    from worker.tasks.ocr import ocr, ocr_batch
 
-    ocr.delay(document_id)
+    if settings.OCR_BATCH_SIZE > 1:
+        ocr_batch.delay()
+    else:
+        ocr.delay(document_id)
     return {"status": "queued", "document_id": document_id}
+
+
+def preprocess_document(doc: Document, upload=None, session=None, check_duplicates: bool = True):
+    """Download the original, preprocess it and store the detected ROIs on ``doc.roi``.
+
+    Also renders the thumbnails from the decoded original and writes them
+    with ``upload`` (a synchronous storage upload by default).  Returns the
+    preprocessed image; persisting it is left to the caller.
+
+    With ``session`` and ``check_duplicates``, the image's perceptual hash is
+    compared against earlier documents first; a near-duplicate is linked
+    through ``duplicate_of``, marked "duplicate" and ``None`` is returned so
+    OCR is skipped.  The check commits ``session`` so the hash is visible to
+    the next check straight away.
+    """
+    source_key = doc.original_path
+    if not source_key:
+        raise ValueError("Missing original_path")
+
+    image_bytes = storage_client.download_bytes(source_key)
+    image = decode_image(image_bytes)
+    _store_thumbnails(doc, image, upload or storage_client.upload_bytes)
+    doc.phash = perceptual_hash(image)
+    doc.phash_bands = phash_bands(doc.phash)
+    doc.duplicate_of = None
+    if (
+        check_duplicates
+        and session is not None
+        and settings.NEAR_DUPLICATE_MAX_DISTANCE is not None
+    ):
+        # Copies forwarded together are preprocessed concurrently.  Holding the
+        # lock from the lookup until this document's hash is committed makes
+        # each check see every hash stored before it.
+        session.execute(select(func.pg_advisory_xact_lock(NEAR_DUPLICATE_LOCK_ID)))
+        original = find_near_duplicate(session, doc, settings.NEAR_DUPLICATE_MAX_DISTANCE)
+        if original is not None:
+            doc.duplicate_of = original.id
+            doc.status = "duplicate"
+            doc.error_message = None
+            doc.processing_completed_at = datetime.now(timezone.utc)
+        session.commit()
+        if original is not None:
+            return None
+    profile, profile_metrics = _resolve_profile(image, image_bytes)
+    processed = preprocess_auction_image(image, profile=profile)
+
+    rois = detect_rois(processed)
+    doc.roi = {
+        "header_bbox": list(rois.header_bbox),
+        "sheet_bbox": list(rois.sheet_bbox),
+        "photos_bbox": list(rois.photos_bbox) if rois.photos_bbox else None,
+        "roi_version": rois.roi_version,
+        "preprocess_profile": profile,
+        **profile_metrics,
+    }
+    return processed
+
+
+def near_duplicate_candidates(doc: Document) -> Select:
+    """Earlier, non-duplicate documents sharing at least one hash band with ``doc``.
+
+    "Earlier" is ``(created_at, id)`` order, so documents inserted in one
+    statement by a batch upload still have a fixed original.  Only the
+    columns the distance check needs are selected: sheets share a template,
+    so band overlaps are common.
+    """
+    return (
+        select(Document.id, Document.phash, Document.created_at)
+        .where(Document.phash_bands.overlap(doc.phash_bands))
+        .where(tuple_(Document.created_at, Document.id) < tuple_(doc.created_at, doc.id))
+        .where(Document.duplicate_of.is_(None))
+        .where(Document.status.notin_(("failed", "duplicate")))
+    )
+
+
+def find_near_duplicate(session, doc: Document, max_distance: int):
+    """The closest earlier document whose perceptual hash is within ``max_distance`` bits.
+
+    Returns its ``(id, phash, created_at)`` row, or ``None``.  Duplicates are
+    never returned, so chains always point at the first copy.
+    """
+    matches = [
+        (hamming_distance(doc.phash, candidate.phash), candidate.created_at, candidate)
+        for candidate in session.execute(near_duplicate_candidates(doc)).all()
+        if candidate.phash
+    ]
+    matches = [match for match in matches if match[0] <= max_distance]
+    if not matches:
+        return None
+    return min(matches, key=lambda match: (match[0], match[1]))[2]
+
+
+def encode_preprocessed(image, fmt: str) -> bytes:
+    return encode_intermediate(image, fmt, png_level=settings.PREPROCESSED_PNG_LEVEL)
+
+
+def _store_thumbnails(doc: Document, image, upload) -> None:
+    try:
+        thumbnails = render_thumbnails(image, settings.THUMBNAIL_SIZES)
+    except Exception:
+        # Thumbnails are not needed for OCR, so the document carries on without them.
+        logger.exception("Thumbnail rendering failed for document %s", doc.id)
+        return
+    keys = {}
+    for name, data in thumbnails.items():
+        keys[name] = f"thumbs/{doc.id}_{name}.jpg"
+        upload(keys[name], data, "image/jpeg")
+    doc.thumbnails = keys
+    doc.thumb_path = keys.get("list", doc.thumb_path)
+
+
+def _resolve_profile(image, image_bytes: bytes) -> tuple[str, dict]:
+    if settings.PREPROCESS_PROFILE == "auto":
+        return select_preprocess_profile(image, image_bytes, settings.PREPROCESS_AUTO_PROFILES)
+    return settings.PREPROCESS_PROFILE, {}
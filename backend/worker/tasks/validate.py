@@ -26,12 +26,7 @@ def validate(self, document_id: str):
             return {"status": "missing_record", "document_id": document_id}
 
         try:
-            evidence = record.evidence or {}
-            needs_review, reason = evaluate_review_policy(record, evidence)
-            record.needs_review = needs_review
-            record.review_reason = reason
-            doc.status = "review" if needs_review else "done"
-            doc.processing_completed_at = datetime.now(timezone.utc)
+            validate_record(doc, record)
             session.commit()
         except Exception as exc:
             doc.status = "failed"
@@ -41,3 +36,12 @@ def validate(self, document_id: str):
             raise self.retry(exc=exc, countdown=60)
 
     return {"status": "done", "document_id": document_id}
+
+
+def validate_record(doc: Document, record: AuctionRecord) -> None:
+    """Apply the review policy and move the document to ``review`` or ``done``."""
+    needs_review, reason = evaluate_review_policy(record, record.evidence or {})
+    record.needs_review = needs_review
+    record.review_reason = reason
+    doc.status = "review" if needs_review else "done"
+    doc.processing_completed_at = datetime.now(timezone.utc)
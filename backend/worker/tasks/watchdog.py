@@ -1,5 +1,8 @@
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import or_
+from sqlalchemy.orm import aliased
+
 from worker.celery_app import celery_app
 from app.db.session_sync import get_session
 from app.models.document import Document
@@ -8,6 +11,7 @@ from app.models.record import AuctionRecord
 
 WATCHDOG_THRESHOLDS_SECONDS = {
     "preprocessing": 120,
+    "ocr_queued": 600,
     "ocr": 480,
     "extracting": 120,
     "validating": 120,
@@ -40,5 +44,33 @@ def watchdog_stuck_documents(self):
                     record.needs_review = True
                     record.review_reason = f"Stuck in {status}"
         session.commit()
+        released = release_stranded_duplicates(session)
+
+    if released:
+        from worker.tasks.pipeline import dispatch_documents
+
+        dispatch_documents.delay(released)
+    return {"status": "ok", "released_duplicates": released}
+
+
+def release_stranded_duplicates(session) -> list[str]:
+    """Requeue duplicates whose original failed or was deleted (``duplicate_of`` nulled).
 
-    return {"status": "ok"}
+    They go through the near-duplicate check again, so one becomes the new
+    original and the rest link to it.  Returns the requeued ids.
+    """
+    original = aliased(Document)
+    docs = (
+        session.query(Document)
+        .outerjoin(original, Document.duplicate_of == original.id)
+        .filter(Document.status == "duplicate")
+        .filter(or_(Document.duplicate_of.is_(None), original.status == "failed"))
+        .all()
+    )
+    for doc in docs:
+        doc.status = "queued"
+        doc.duplicate_of = None
+        doc.processing_started_at = None
+        doc.processing_completed_at = None
+    session.commit()
+    return [str(doc.id) for doc in docs]